@@ -0,0 +1,70 @@
+"""
+Benchmark of the discount curve bootstrap.
+
+Builds a 40 pillar curve from deposits, FRAs and swaps up to 60 years,
+then re-quotes the 10Y and 50Y swaps, which only solve the pillars from 10Y (resp. 50Y) onwards.
+The pillars from 10Y onwards hold most of the swap payment dates, so that re-quoting
+the 10Y swap costs almost as much as a full build.
+Run from the repository root with:
+    python -m benchmarks.bench_bootstrap
+"""
+
+import timeit
+
+from disquant.definitions.bootstrap import Bootstrapper, DepositQuote, FraQuote, SwapQuote
+from disquant.definitions.business_day import Adjustment, Calendar
+from disquant.definitions.curve import Method
+from disquant.definitions.date import Date
+from disquant.definitions.day_count import DayCount
+from disquant.definitions.frequency import Frequency
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.rate import InterestRate
+
+START = Date(2023, 10, 16)
+CALENDAR = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+SPOT = CALENDAR.add(START, 2)
+REPEAT = 20
+
+
+def swap(years: int, rate: float) -> SwapQuote:
+    end = SPOT + Period(years, Unit.YEAR)
+    return SwapQuote(SPOT, end, InterestRate(rate), Frequency.ANNUAL, DayCount.THIRTY_360, CALENDAR)
+
+
+def build_quotes() -> list:
+    quotes = [DepositQuote(START, CALENDAR.add(START, 1), InterestRate(0.039), DayCount.ACTUAL_360)]
+    for months in [1, 2, 3]:
+        end = CALENDAR.add_period(SPOT, Period(months, Unit.MONTH))
+        quotes.append(DepositQuote(SPOT, end, InterestRate(0.0385 + 0.0005 * months), DayCount.ACTUAL_360))
+
+    for months in range(3, 24, 3):
+        start = CALENDAR.add_period(SPOT, Period(months, Unit.MONTH))
+        end = CALENDAR.add_period(SPOT, Period(months + 3, Unit.MONTH))
+        quotes.append(FraQuote(start, end, InterestRate(0.040 - 0.0005 * months / 3), DayCount.ACTUAL_360))
+
+    years = [*range(3, 26), *range(30, 55, 5), 60]
+    quotes.extend(swap(year, 0.034 - 0.0001 * year) for year in years)
+    return quotes
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    quotes = build_quotes()
+    print(f"{len(quotes)} pillars, best of {REPEAT}")
+
+    for method in (method for method in Method if method.is_local):
+        elapsed = best_of(lambda: Bootstrapper(START, quotes, method).curve)
+        print(f"{'build ' + method.value:<40} {elapsed * 1000:>10.2f} ms")
+
+        bootstrapper = Bootstrapper(START, quotes, method)
+        for years in [10, 50]:
+            requotes = iter([swap(years, 0.0300), swap(years, 0.0305)] * REPEAT)
+            elapsed = best_of(lambda: bootstrapper.update(next(requotes)))
+            print(f"{f'update {years}Y ' + method.value:<40} {elapsed * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
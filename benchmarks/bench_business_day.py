@@ -0,0 +1,102 @@
+"""
+Microbenchmark of business day adjustments.
+
+Adjusts every calendar day of a 10-year range with each adjustment convention,
+both with a copy of the legacy implementation looking up each day in the holidays
+and with the compiled business days, and adds 250 business days to a thousand dates.
+Run from the repository root with:
+    python -m benchmarks.bench_business_day
+"""
+
+import datetime as dt
+import timeit
+from typing import Container
+
+from disquant.definitions.business_day import REGISTRY, Adjustment, Calendar
+from disquant.definitions.date import Date, DateRange, Weekday
+from disquant.definitions.period import Period, Unit
+
+DATES = list(DateRange(Date(2020, 1, 1), Date(2030, 1, 1)))
+REPEAT = 5
+
+
+def legacy_weekday(date: Date) -> Weekday:
+    """
+    Reference implementation of Date.weekday going through strftime.
+    """
+    return Weekday(date.to_date().strftime("%a").upper())
+
+
+def legacy_previous(date: Date, holidays: Container[dt.date]) -> Date:
+    adjusted_date = date
+    while adjusted_date.is_weekend or adjusted_date.to_date() in holidays:
+        adjusted_date = adjusted_date - Period(1, Unit.DAY)
+    return adjusted_date
+
+
+def legacy_following(date: Date, holidays: Container[dt.date]) -> Date:
+    adjusted_date = date
+    while adjusted_date.is_weekend or adjusted_date.to_date() in holidays:
+        adjusted_date = adjusted_date + Period(1, Unit.DAY)
+    return adjusted_date
+
+
+def legacy_adjust(date: Date, holidays: Container[dt.date], adjustment: Adjustment) -> Date:
+    """
+    Reference implementation of Calendar.adjust walking day by day and looking up each day in the holidays,
+    as it was before business days were compiled.
+    """
+    match adjustment:
+        case Adjustment.UNADJUSTED:
+            return date
+        case Adjustment.PREVIOUS:
+            return legacy_previous(date, holidays)
+        case Adjustment.MODIFIED_PREVIOUS:
+            adjusted_date = legacy_previous(date, holidays)
+            return adjusted_date if adjusted_date.month == date.month else legacy_following(date, holidays)
+        case Adjustment.FOLLOWING:
+            return legacy_following(date, holidays)
+        case Adjustment.MODIFIED_FOLLOWING:
+            adjusted_date = legacy_following(date, holidays)
+            return adjusted_date if adjusted_date.month == date.month else legacy_previous(date, holidays)
+        case _:
+            raise NotImplementedError(f"{adjustment}")
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    print(f"{len(DATES)} dates from {DATES[0]} to {DATES[-1]}, best of {REPEAT}")
+
+    elapsed = best_of(lambda: [legacy_weekday(date) for date in DATES])
+    print(f"{'weekday (strftime)':<40} {elapsed * 1000:>10.2f} ms")
+
+    elapsed = best_of(lambda: [date.weekday for date in DATES])
+    print(f"{'weekday':<40} {elapsed * 1000:>10.2f} ms")
+
+    for identifier in ["TARGET", "USA"]:
+        # The same holidays as the ones compiled into the calendar
+        holidays = REGISTRY[identifier]()
+        for adjustment in Adjustment:
+            calendar = Calendar(identifier, adjustment)
+            assert [legacy_adjust(date, holidays, adjustment) for date in DATES] == [
+                calendar.adjust(date) for date in DATES
+            ]
+
+            legacy = best_of(lambda: [legacy_adjust(date, holidays, adjustment) for date in DATES])
+            compiled = best_of(lambda: [calendar.adjust(date) for date in DATES])
+            print(f"{f'legacy adjust {identifier} {adjustment}':<40} {legacy * 1000:>10.2f} ms")
+            print(
+                f"{f'Calendar.adjust {identifier} {adjustment}':<40} {compiled * 1000:>10.2f} ms"
+                f"   speedup {legacy / compiled:>5.1f}x"
+            )
+
+        calendar = Calendar(identifier, Adjustment.MODIFIED_FOLLOWING)
+        elapsed = best_of(lambda: [calendar.add(date, 250) for date in DATES[:1000]])
+        print(f"{f'Calendar.add 250 days {identifier} (x1000)':<40} {elapsed * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark of discount curve lookups for every interpolation method.
+
+Looks up 10000 dates on a 40 node curve, one date at a time and in a single batch,
+and measures the first lookup, which computes the interpolation coefficients.
+Cached lookups request 10000 times the same 100 dates.
+Also compares building 1000 curves from Date lists and from arrays of serial numbers.
+Run from the repository root with:
+    python -m benchmarks.bench_curve
+"""
+
+import math
+import random
+import timeit
+from array import array
+
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.period import Period, Unit
+
+START = Date(2023, 10, 16)
+NODES = [START + Period(months, Unit.MONTH) for months in range(3, 123, 3)]
+FACTORS = [math.exp(-(0.03 + 0.01 * math.sin(i / 5)) * (date - START) / 365) for i, date in enumerate(NODES)]
+DATES = [START + Period(random.Random(i).randint(1, NODES[-1] - START), Unit.DAY) for i in range(10_000)]
+REPEAT = 5
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    print(f"{len(DATES)} lookups on {len(NODES)} nodes, best of {REPEAT}")
+
+    serials = array("i", (date.to_excel() for date in NODES))
+    factors = array("d", FACTORS)
+    elapsed = best_of(lambda: [DiscountCurve(START, NODES, FACTORS) for _ in range(1000)])
+    print(f"{'build 1000 curves from lists':<40} {elapsed * 1000:>10.2f} ms")
+    elapsed = best_of(lambda: [DiscountCurve.from_arrays(START, serials, factors) for _ in range(1000)])
+    print(f"{'build 1000 curves from arrays':<40} {elapsed * 1000:>10.2f} ms")
+
+    dates = DateArray.from_dates(DATES)
+    for method in Method:
+        # Dates before the first node are only supported by the monotone convex interpolation
+        curve = DiscountCurve(START, NODES, FACTORS)
+        targets = [date for date in DATES if method == Method.MONOTONE_CONVEX or date >= NODES[0]]
+
+        elapsed = best_of(lambda: DiscountCurve(START, NODES, FACTORS).spot(NODES[0] + Period(1, Unit.DAY), method))
+        print(f"{'first lookup ' + method.value:<40} {elapsed * 1e6:>10.2f} us")
+
+        elapsed = best_of(lambda: [curve.spot(date, method) for date in targets])
+        print(f"{'spot ' + method.value:<40} {elapsed * 1e9 / len(targets):>10.2f} ns per lookup")
+
+        batch = dates if len(targets) == len(DATES) else DateArray.from_dates(targets)
+        elapsed = best_of(lambda: curve.spots(batch, method))
+        print(f"{'spots ' + method.value:<40} {elapsed * 1e9 / len(targets):>10.2f} ns per lookup")
+
+        cached_curve = DiscountCurve(START, NODES, FACTORS, cache_size=100)
+        repeated = targets[:100] * (len(targets) // 100)
+        elapsed = best_of(lambda: [cached_curve.spot(date, method) for date in repeated])
+        print(f"{'cached spot ' + method.value:<40} {elapsed * 1e9 / len(repeated):>10.2f} ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Import time benchmark.
+
+Measures the time needed to import the whole library in a fresh interpreter,
+net of the interpreter start-up time, and checks it against a budget.
+Run from the repository root with:
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+import time
+
+MODULE = "disquant.instruments.irs"
+BUDGET = 0.1
+REPEAT = 10
+
+
+def best_of(code: str) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    startup = best_of("pass")
+    elapsed = best_of(f"import {MODULE}") - startup
+    print(f"import {MODULE}: {elapsed * 1000:.1f} ms (budget {BUDGET * 1000:.0f} ms), best of {REPEAT}")
+
+    if elapsed > BUDGET:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
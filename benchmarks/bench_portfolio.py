@@ -0,0 +1,119 @@
+"""
+Benchmark of the portfolio engine on a synthetic book of swaps.
+
+Prices 100000 swaps in EUR and USD, with maturities from 1 to 30 years and quarterly
+floating legs, with 1 worker (in the current process) and then with 2, 4, ... worker
+processes up to the number of processors, and reports the speedup over 1 worker.
+The book is generated in batches with AccrualSchedule.generate_many.
+The scaling with the number of workers has not been measured yet: the benchmark was only run
+on a single processor host, where it prices with 1 worker only.
+Run from the repository root with:
+    python -m benchmarks.bench_portfolio [trades]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+from disquant.definitions.business_day import Adjustment, Calendar
+from disquant.definitions.curve import DiscountCurve
+from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.day_count import DayCount
+from disquant.definitions.market import Market
+from disquant.definitions.money import Currency, Money
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.rate import InterestRate
+from disquant.definitions.schedule import AccrualSchedule, Stub
+from disquant.instruments.irs import FixedLeg, FloatingLeg, InterestRateSwap, Way
+from disquant.instruments.portfolio import PortfolioEngine
+
+TRADES = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+START = Date(2023, 10, 16)
+NODES = [START + Period(1, Unit.DAY)] + [START + Period(months, Unit.MONTH) for months in range(3, 12 * 33, 3)]
+CALENDAR = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+PAYMENT_OFFSET = Period(2, Unit.DAY)
+
+
+def build_curve(rate: float) -> DiscountCurve:
+    return DiscountCurve(START, NODES, [math.exp(-rate * (date - START) / 365) for date in NODES])
+
+
+def slices(accruals: AccrualSchedule, offsets) -> list[AccrualSchedule]:
+    """
+    Accrual schedule of each leg of a batch.
+    """
+    return [
+        AccrualSchedule(
+            accruals.starts[start:end],
+            accruals.ends[start:end],
+            accruals.payments[start:end],
+            accruals.year_fractions[start:end],
+        )
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+
+def build_book(trades: int) -> list[InterestRateSwap]:
+    generator = random.Random(0)
+    starts = [START + Period(generator.randrange(365), Unit.DAY) for _ in range(trades)]
+    ends = [start + Period(generator.randint(1, 30), Unit.YEAR) for start in starts]
+    starts, ends = DateArray.from_dates(starts), DateArray.from_dates(ends)
+
+    fixed = slices(
+        *AccrualSchedule.generate_many(
+            starts, ends, Period(1, Unit.YEAR), CALENDAR, Stub.FRONT, DayCount.THIRTY_360, PAYMENT_OFFSET
+        )
+    )
+    floating = slices(
+        *AccrualSchedule.generate_many(
+            starts, ends, Period(3, Unit.MONTH), CALENDAR, Stub.FRONT, DayCount.ACTUAL_360, PAYMENT_OFFSET
+        )
+    )
+
+    book = []
+    for i, (fixed_accruals, floating_accruals) in enumerate(zip(fixed, floating)):
+        notional = Money(1_000_000 * generator.randint(1, 100), Currency.EUR if i % 2 else Currency.USD)
+        way = Way.PAYER if generator.random() < 0.5 else Way.RECEIVER
+        fixed_leg = FixedLeg.from_accruals(way, fixed_accruals, notional, InterestRate(generator.uniform(0.01, 0.05)))
+        floating_way = Way.RECEIVER if way == Way.PAYER else Way.PAYER
+        book.append(InterestRateSwap(fixed_leg, FloatingLeg(floating_way, floating_accruals, notional)))
+    return book
+
+
+def main() -> None:
+    market = Market()
+    market.update(discount_curves={Currency.EUR: build_curve(0.025), Currency.USD: build_curve(0.04)})
+
+    elapsed = time.perf_counter()
+    book = build_book(TRADES)
+    elapsed = time.perf_counter() - elapsed
+    print(f"{TRADES} swaps built in {elapsed * 1000:.0f} ms, {os.cpu_count()} processors")
+
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    if counts[-1] != os.cpu_count():
+        counts.append(os.cpu_count())
+
+    if len(counts) == 1:
+        print("Single processor: the scaling with the number of workers is not measured")
+
+    reference = None
+    for workers in counts:
+        with PortfolioEngine(market.snapshot(), workers=workers) as engine:
+            elapsed = time.perf_counter()
+            valuation = engine.price(book)
+            elapsed = time.perf_counter() - elapsed
+
+        reference = reference or elapsed
+        print(f"{f'{workers} worker(s)':<40} {elapsed * 1000:>10.0f} ms {reference / elapsed:>8.2f}x")
+
+    for currency, total in valuation.totals.items():
+        print(f"{f'Total {currency}':<40} {total.amount:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark of schedule generation for a book of trades.
+
+Generates the quarterly schedules of 20000 trades with maturities from 2 to 30 years,
+one trade at a time and in a single batch.
+Run from the repository root with:
+    python -m benchmarks.bench_schedule
+"""
+
+import random
+import timeit
+
+from disquant.definitions.business_day import Adjustment, Calendar
+from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.schedule import Stub, generate_schedule, generate_schedules
+
+TRADES = 20_000
+STEP = Period(3, Unit.MONTH)
+REPEAT = 3
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    generator = random.Random(0)
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    starts = [Date(2023, 10, 16) + Period(generator.randrange(730), Unit.DAY) for _ in range(TRADES)]
+    ends = [start + Period(generator.choice([2, 5, 10, 30]), Unit.YEAR) for start in starts]
+    start_array = DateArray.from_dates(starts)
+    end_array = DateArray.from_dates(ends)
+
+    dates = len(generate_schedules(start_array, end_array, STEP, calendar, Stub.FRONT).serials)
+    print(f"{TRADES} trades, {dates} dates, best of {REPEAT}")
+
+    elapsed = best_of(
+        lambda: [generate_schedule(start, end, STEP, calendar, Stub.FRONT) for start, end in zip(starts, ends)]
+    )
+    print(f"{'generate_schedule':<40} {elapsed * 1000:>10.2f} ms")
+
+    elapsed = best_of(lambda: generate_schedules(start_array, end_array, STEP, calendar, Stub.FRONT))
+    print(f"{'generate_schedules':<40} {elapsed * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark of loading discount curves from a snapshot file.
+
+Loads 2000 curves of 40 nodes and looks up one discount factor on each,
+from CSV text parsed into Date objects and from a memory-mapped snapshot.
+Run from the repository root with:
+    python -m benchmarks.bench_snapshot
+"""
+
+import math
+import os
+import tempfile
+import timeit
+
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date import Date
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.snapshot import Snapshot, write_snapshot
+
+START = Date(2023, 10, 16)
+NODES = [START + Period(months, Unit.MONTH) for months in range(3, 123, 3)]
+CURVES = 2000
+METHOD = Method.LOG_LINEAR_DISCOUNT_FACTOR
+REPEAT = 5
+
+
+def best_of(statement) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def load_csv(text: str) -> dict[str, DiscountCurve]:
+    rows: dict[str, tuple[list[Date], list[float]]] = {}
+    for line in text.splitlines():
+        name, date, factor = line.split(",")
+        dates, factors = rows.setdefault(name, ([], []))
+        dates.append(Date.from_string(date))
+        factors.append(float(factor))
+    return {name: DiscountCurve(START, dates, factors) for name, (dates, factors) in rows.items()}
+
+
+def load_snapshot(path: str) -> dict[str, DiscountCurve]:
+    snapshot = Snapshot(path)
+    return {name: snapshot.curve(name) for name in snapshot.curve_names}
+
+
+def main() -> None:
+    curves = {}
+    for i in range(CURVES):
+        factors = [math.exp(-(0.02 + i / 100_000) * (date - START) / 365) for date in NODES]
+        curves[f"CURVE{i}"] = DiscountCurve(START, NODES, factors)
+
+    text = "\n".join(
+        f"{name},{date},{factor!r}"
+        for name, curve in curves.items()
+        for date, factor in zip(curve.dates, curve.factors)
+    )
+    date = START + Period(1000, Unit.DAY)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "curves.snapshot")
+        elapsed = best_of(
+            lambda: write_snapshot(path, curves={name: (curve, METHOD) for name, curve in curves.items()})
+        )
+        print(f"{CURVES} curves of {len(NODES)} nodes, best of {REPEAT}")
+        print(f"{'write snapshot':<40} {elapsed * 1000:>10.2f} ms")
+
+        elapsed = best_of(lambda: [curve.spot(date, METHOD) for curve in load_csv(text).values()])
+        print(f"{'load csv and look up':<40} {elapsed * 1000:>10.2f} ms")
+
+        elapsed = best_of(lambda: [curve.spot(date, METHOD) for curve in load_snapshot(path).values()])
+        print(f"{'load snapshot and look up':<40} {elapsed * 1000:>10.2f} ms")
+
+        elapsed = best_of(lambda: Snapshot(path).curve("CURVE0").spot(date, METHOD))
+        print(f"{'load snapshot and look up one curve':<40} {elapsed * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence
+
+from disquant.definitions.business_day import Calendar
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date import Date
+from disquant.definitions.day_count import DayCount, year_fraction
+from disquant.definitions.frequency import Frequency
+from disquant.definitions.rate import InterestRate, compound
+from disquant.definitions.schedule import SCHEDULES, Stub
+
+# Function giving the discount factors of a list of dates
+Factors = Callable[[Sequence[Date]], Sequence[float]]
+
+# Convergence criteria of the pillar by pillar solver
+TOLERANCE = 1e-15
+MAX_ITERATIONS = 100
+
+# Market quotes used to bootstrap a discount curve
+# Each quote gives the discount factor of its pillar date from
+# the discount factors of earlier dates
+
+
+@dataclass(frozen=True)
+class DepositQuote:
+    """
+    Deposit paying a simple interest rate between two dates.
+    """
+
+    start: Date
+    end: Date
+    rate: InterestRate
+    day_count: DayCount
+
+    @property
+    def pillar(self) -> Date:
+        return self.end
+
+    def implied_factor(self, factors: Factors) -> float:
+        (factor,) = factors([self.start])
+        return factor / compound(self.rate, self.start, self.end, self.day_count)
+
+
+@dataclass(frozen=True)
+class FraQuote(DepositQuote):
+    """
+    Forward rate agreement, implying the same discount factors as a forward starting deposit.
+    """
+
+
+@dataclass(frozen=True)
+class FutureQuote:
+    """
+    Interest rate future quoted as 100 minus the rate in percent.
+    No convexity adjustment is applied.
+    """
+
+    start: Date
+    end: Date
+    price: float
+    day_count: DayCount
+
+    @property
+    def pillar(self) -> Date:
+        return self.end
+
+    def implied_factor(self, factors: Factors) -> float:
+        (factor,) = factors([self.start])
+        rate = InterestRate((100 - self.price) / 100)
+        return factor / compound(rate, self.start, self.end, self.day_count)
+
+
+@dataclass(frozen=True)
+class SwapQuote:
+    """
+    Par swap rate of a swap exchanging fixed coupons against a floating leg
+    projected on the curve being built.
+    """
+
+    start: Date
+    end: Date
+    rate: InterestRate
+    frequency: Frequency
+    day_count: DayCount
+    calendar: Calendar
+    schedule: tuple[Date, ...] = field(init=False, repr=False, compare=False)
+    fractions: list[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The fixed leg schedule and year fractions are computed once per quote
+        step = self.frequency.to_period()
+        schedule = SCHEDULES.generate(self.start, self.end, step, self.calendar, Stub.FRONT)
+        starts = (self.start,) + schedule[:-1]
+        fractions = [year_fraction(start, end, self.day_count) for start, end in zip(starts, schedule)]
+        object.__setattr__(self, "schedule", schedule)
+        object.__setattr__(self, "fractions", fractions)
+
+    @property
+    def pillar(self) -> Date:
+        return self.schedule[-1]
+
+    def implied_factor(self, factors: Factors) -> float:
+        """
+        At par, the floating leg (start factor minus end factor) is worth the fixed leg
+        (rate times the sum of the year fractions weighted by the payment discount factors).
+        """
+        start_factor, *payment_factors = factors((self.start,) + self.schedule[:-1])
+        annuity = sum(fraction * factor for fraction, factor in zip(self.fractions, payment_factors))
+        return (start_factor - self.rate.value * annuity) / (1 + self.rate.value * self.fractions[-1])
+
+
+Quote = DepositQuote | FraQuote | FutureQuote | SwapQuote
+
+
+class Bootstrapper:
+    def __init__(self, start: Date, quotes: list[Quote], method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR) -> None:
+        """
+        Bootstrap a discount curve from market quotes, solving one pillar at a time
+        in increasing pillar order. Each quote may only depend on the start date, on
+        earlier pillars and on dates up to its own pillar.
+
+        The solved discount factors are kept, so that adding or re-quoting an
+        instrument only solves again the pillars from that instrument onwards.
+
+        :param start: start date of the curve
+        :param quotes: market quotes, with distinct pillar dates after the start date
+        :param method: interpolation method used between pillars, which needs to be local
+        """
+        # Solving one pillar at a time requires the discount factors up to a pillar
+        # not to depend on the following pillars
+        if not method.is_local:
+            raise ValueError(f"{method} is not a local interpolation method")
+
+        quotes = sorted(quotes, key=lambda quote: quote.pillar)
+        pillars = [quote.pillar for quote in quotes]
+
+        # Check that each pillar is different
+        if len(set(pillars)) != len(pillars):
+            raise ValueError("Some pillar dates are duplicated")
+
+        # Check that the start date is the smallest date
+        if pillars and not start < pillars[0]:
+            raise ValueError("Some pillar dates are smaller or equal to the start date")
+
+        self._start = start
+        self._method = method
+        self._quotes = quotes
+        self._pillars = pillars
+        self._factors: list[float] = []
+        # Curve between each pillar and the previous one, as solved
+        self._segments: list[DiscountCurve] = []
+        self._curve: Optional[DiscountCurve] = None
+        self._solve()
+
+    @property
+    def start(self) -> Date:
+        return self._start
+
+    @property
+    def method(self) -> Method:
+        return self._method
+
+    @property
+    def quotes(self) -> list[Quote]:
+        return self._quotes
+
+    @property
+    def curve(self) -> DiscountCurve:
+        if self._curve is None:
+            self._curve = DiscountCurve(start=self._start, dates=list(self._pillars), factors=list(self._factors))
+        return self._curve
+
+    def update(self, quote: Quote) -> None:
+        """
+        Add a quote, or replace the quote having the same pillar date,
+        and solve the curve again from that pillar onwards.
+        """
+        if not self._start < quote.pillar:
+            raise ValueError("The pillar date needs to be after the start date")
+
+        i = bisect_left(self._pillars, quote.pillar)
+        if i < len(self._pillars) and self._pillars[i] == quote.pillar:
+            self._quotes[i] = quote
+        else:
+            self._quotes.insert(i, quote)
+            self._pillars.insert(i, quote.pillar)
+
+        del self._factors[i:]
+        del self._segments[i:]
+        self._solve()
+
+    def _solve(self) -> None:
+        """
+        Solve the pillars which do not have a discount factor yet.
+        """
+        self._curve = None
+        for i in range(len(self._factors), len(self._quotes)):
+            segment = self._solve_pillar(i)
+            self._factors.append(segment.factors[-1])
+            self._segments.append(segment)
+
+    def _solve_pillar(self, i: int) -> DiscountCurve:
+        """
+        Solve the discount factor of pillar i by fixed-point iteration,
+        the pillars before i being already solved.
+
+        :return: the curve between the previous pillar and pillar i, whose last factor is the solved one
+        """
+        quote = self._quotes[i]
+        pillar = self._pillars[i]
+        previous = self._pillars[i - 1] if i > 0 else None
+
+        # As the interpolation is local, a date up to the previous pillar is interpolated
+        # between the two pillars around it only, i.e. on the solved curve of their segment
+        def known(date: Date) -> float:
+            if date < self._pillars[0]:
+                raise ValueError(f"{quote} depends on {date}, which is before the first pillar")
+            return self._segments[bisect_left(self._pillars, date, hi=i)].spot(date, self._method)
+
+        # Discount factors up to the previous pillar do not depend on the
+        # solved factor, so they are looked up once and reused across iterations
+        cache: dict[Date, float] = {self._start: 1.0}
+
+        def factors(dates: Sequence[Date]) -> list[float]:
+            values = []
+            for date in dates:
+                value = cache.get(date)
+                if value is not None:
+                    values.append(value)
+                elif previous is not None and date <= previous:
+                    value = cache[date] = known(date)
+                    values.append(value)
+                elif date <= pillar and (previous is not None or date == pillar):
+                    values.append(gap.spot(date, self._method))
+                else:
+                    raise ValueError(f"{quote} depends on {date}, which cannot be solved at pillar {pillar}")
+            return values
+
+        factor = self._factors[-1] if i > 0 else 1.0
+        for _ in range(MAX_ITERATIONS):
+            if previous is None:
+                gap = DiscountCurve(self._start, [pillar], [factor])
+            else:
+                gap = DiscountCurve(self._start, [previous, pillar], [self._factors[-1], factor])
+
+            new_factor = quote.implied_factor(factors)
+            if abs(new_factor - factor) <= TOLERANCE:
+                break
+            factor = new_factor
+        else:
+            raise ValueError(f"The discount factor of pillar {pillar} did not converge")
+
+        if previous is None:
+            return DiscountCurve(self._start, [pillar], [new_factor])
+        return DiscountCurve(self._start, [previous, pillar], [self._factors[-1], new_factor])
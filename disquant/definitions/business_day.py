@@ -1,11 +1,19 @@
-from enum import StrEnum
-from typing import Optional
+from __future__ import annotations
 
-from holidays import HolidayBase, country_holidays, financial_holidays
+import datetime as dt
+import threading
+from array import array
+from enum import StrEnum
+from itertools import accumulate, chain, compress, repeat
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Self, Sequence
 
-from disquant.definitions.date import Date
+from disquant.definitions.date import DAYS_IN_MONTHS, LEAP_YEARS, MAX_EXCEL, MAX_YEAR, MIN_EXCEL, MIN_YEAR, Date
 from disquant.definitions.period import Period, Unit
 
+# The holidays package is only imported when a calendar is first used
+if TYPE_CHECKING:
+    from holidays import HolidayBase
+
 
 class Adjustment(StrEnum):
     UNADJUSTED = "Unadjusted"
@@ -15,6 +23,17 @@ class Adjustment(StrEnum):
     MODIFIED_FOLLOWING = "ModifiedFollowing"
 
 
+class Join(StrEnum):
+    """
+    Rules to combine several calendars into a joint calendar.
+    HOLIDAYS: a date is a business day only if it is a business day in all calendars
+    BUSINESS_DAYS: a date is a business day if it is a business day in any calendar
+    """
+
+    HOLIDAYS = "JoinHolidays"
+    BUSINESS_DAYS = "JoinBusinessDays"
+
+
 def previous(date: Date, holidays: HolidayBase) -> Date:
     """
     Previous business day adjustment.
@@ -74,39 +93,339 @@ def adjust_date(date: Date, holidays: HolidayBase, convention: Adjustment) -> Da
             raise NotImplementedError(f"{convention}")
 
 
-MAPPING = {"TARGET": financial_holidays("ECB"), "USA": country_holidays("US")}
+class CompiledCalendar:
+    """
+    Business days of a calendar precomputed over the whole range of allowed dates,
+    i.e. from January 1st 1901 to December 31st 2199.
+
+    Dates are handled as Excel serial numbers. The calendar stores:
+    - one byte per date telling whether the date is a business day
+    - the number of business days strictly before each date
+    - the ordered serial numbers of all business days
+    so that checking, adjusting, counting and adding business days are
+    lookups rather than day-by-day loops.
+    """
+
+    __slots__ = ("_open", "_count", "_business_days", "_adjusted")
+
+    def __init__(self, is_open: bytes) -> None:
+        """
+        :param is_open: one byte per date from MIN_EXCEL to MAX_EXCEL, 1 for business days and 0 otherwise
+        """
+        if len(is_open) != MAX_EXCEL - MIN_EXCEL + 1:
+            raise ValueError(f"Expecting {MAX_EXCEL - MIN_EXCEL + 1} dates, got {len(is_open)}")
+
+        self._open = is_open
+        self._count = array("i", accumulate(is_open, initial=0))
+        self._business_days = array("i", compress(range(MIN_EXCEL, MAX_EXCEL + 1), is_open))
+        self._adjusted: dict[Adjustment, array] = {}
+
+    @classmethod
+    def _from_arrays(cls, is_open: Sequence[int], count: Sequence[int], business_days: Sequence[int]) -> Self:
+        """
+        Instantiate a CompiledCalendar from its precomputed arrays, e.g. memory-mapped
+        from a snapshot, without copying nor computing them again.
+        """
+        calendar = object.__new__(cls)
+        calendar._open = is_open
+        calendar._count = count
+        calendar._business_days = business_days
+        calendar._adjusted = {}
+        return calendar
+
+    def _to_arrays(self) -> tuple[Sequence[int], Sequence[int], Sequence[int]]:
+        return self._open, self._count, self._business_days
+
+    @classmethod
+    def from_holidays(cls, holidays: Iterable[dt.date]) -> Self:
+        """
+        Compile a calendar from its holidays, weekends being always closed.
+        """
+        # Start with all weekdays open, January 1st 1901 being a Tuesday
+        is_open = bytearray((serial + 5) % 7 < 5 for serial in range(MIN_EXCEL, MAX_EXCEL + 1))
+        for holiday in holidays:
+            if MIN_YEAR <= holiday.year <= MAX_YEAR:
+                is_open[Date.from_date(holiday).to_excel() - MIN_EXCEL] = 0
+
+        return cls(is_open)
+
+    @classmethod
+    def join(cls, calendars: list[CompiledCalendar], join: Join) -> Self:
+        """
+        Compile several calendars into a single joint calendar.
+        As each byte is either 0 or 1, the bitwise AND (resp. OR) of the
+        bytes read as big integers gives the dates open in all (resp. any)
+        of the calendars.
+        """
+        size = MAX_EXCEL - MIN_EXCEL + 1
+        bitmaps = [int.from_bytes(calendar._open, "big") for calendar in calendars]
+        bitmap = bitmaps[0]
+        for other in bitmaps[1:]:
+            bitmap = bitmap & other if join == Join.HOLIDAYS else bitmap | other
+
+        return cls(bytearray(bitmap.to_bytes(size, "big")))
+
+    def is_open(self, serial: int) -> bool:
+        return self._open[serial - MIN_EXCEL] == 1
+
+    def following(self, serial: int) -> int:
+        """
+        First business day on or after the given date.
+        """
+        i = self._count[serial - MIN_EXCEL]
+        if i == len(self._business_days):
+            raise ValueError(f"No business day on or after {Date.from_excel(serial)}")
+        return self._business_days[i]
+
+    def preceding(self, serial: int) -> int:
+        """
+        Last business day on or before the given date.
+        """
+        i = self._count[serial - MIN_EXCEL + 1] - 1
+        if i < 0:
+            raise ValueError(f"No business day on or before {Date.from_excel(serial)}")
+        return self._business_days[i]
+
+    def add(self, serial: int, business_days: int) -> int:
+        """
+        Move a date by a positive or negative number of business days.
+        """
+        if business_days == 0:
+            return serial
+
+        # Index of the target date in the list of business days
+        if business_days > 0:
+            i = self._count[serial - MIN_EXCEL + 1] + business_days - 1
+        else:
+            i = self._count[serial - MIN_EXCEL] + business_days
+        if not 0 <= i < len(self._business_days):
+            raise ValueError(f"Date is out of range: cannot add {business_days} business days")
+        return self._business_days[i]
+
+    def between(self, start: int, end: int) -> int:
+        """
+        Number of business days in [start, end[, negative if end is before start.
+        """
+        return self._count[end - MIN_EXCEL] - self._count[start - MIN_EXCEL]
+
+    def adjusted(self, adjustment: Adjustment) -> array:
+        """
+        Adjusted serial number of every date, indexed by serial number, so that many dates
+        are adjusted with one lookup each. The table is computed on first use of each convention.
+        Dates without a business day to adjust to are mapped to 0.
+        """
+        table = self._adjusted.get(adjustment)
+        if table is None:
+            table = self._adjusted[adjustment] = self._adjust_all(adjustment)
+        return table
+
+    def _adjust_all(self, adjustment: Adjustment) -> array:
+        size = MAX_EXCEL - MIN_EXCEL + 1
+        business_days = self._business_days
+        last = len(business_days)
+
+        # First business day on or after, and last business day on or before, each date
+        following = [business_days[i] if i < last else 0 for i in self._count[:size]]
+        preceding = [business_days[i - 1] if i > 0 else 0 for i in self._count[1:]]
+
+        # First and last days of the month of each date
+        lengths = [length for leap in LEAP_YEARS for length in DAYS_IN_MONTHS[leap]]
+        firsts = list(accumulate(lengths[:-1], initial=MIN_EXCEL))
+        month_firsts = chain.from_iterable(map(repeat, firsts, lengths))
+        month_lasts = chain.from_iterable(repeat(first + length - 1, length) for first, length in zip(firsts, lengths))
+
+        match adjustment:
+            case Adjustment.UNADJUSTED:
+                adjusted = range(MIN_EXCEL, MAX_EXCEL + 1)
+            case Adjustment.PREVIOUS:
+                adjusted = preceding
+            case Adjustment.MODIFIED_PREVIOUS:
+                adjusted = (
+                    before if not before or before >= first else after
+                    for before, after, first in zip(preceding, following, month_firsts)
+                )
+            case Adjustment.FOLLOWING:
+                adjusted = following
+            case Adjustment.MODIFIED_FOLLOWING:
+                adjusted = (
+                    after if after <= last_day else before
+                    for after, before, last_day in zip(following, preceding, month_lasts)
+                )
+            case _:
+                raise NotImplementedError(f"{adjustment}")
+
+        return array("i", chain(repeat(0, MIN_EXCEL), adjusted))
+
+
+YEARS = range(MIN_YEAR, MAX_YEAR + 1)
+
+
+def target_holidays() -> Iterable[dt.date]:
+    """
+    TARGET holidays, as published by the European Central Bank.
+    """
+    from holidays import financial_holidays
+
+    return financial_holidays("ECB", years=YEARS)
+
+
+def usa_holidays() -> Iterable[dt.date]:
+    """
+    United States federal holidays.
+    """
+    from holidays import country_holidays
+
+    return country_holidays("US", years=YEARS)
+
+
+# Calendar identifiers mapped to functions returning their holidays
+# Holidays are only loaded and compiled the first time a calendar is used,
+# then the compiled calendar is shared by the whole process
+REGISTRY: dict[str, Callable[[], Iterable[dt.date]]] = {"TARGET": target_holidays, "USA": usa_holidays}
+COMPILED: dict[Optional[str] | tuple[frozenset[str], Join], CompiledCalendar] = {}
+LOCK = threading.Lock()
+
+
+def register_calendar(identifier: str, holidays: Iterable[dt.date] | Callable[[], Iterable[dt.date]]) -> None:
+    """
+    Register a custom calendar so that it can be used as Calendar(identifier).
+
+    :param identifier: calendar identifier, must not be already registered
+    :param holidays: holiday dates, or a function returning them called on first use
+    """
+    with LOCK:
+        if identifier in REGISTRY:
+            raise ValueError(f"Calendar {identifier} is already registered")
+        REGISTRY[identifier] = holidays if callable(holidays) else lambda: holidays
+
+
+def compile_calendar(identifier: Optional[str], join: Join = Join.HOLIDAYS) -> CompiledCalendar:
+    """
+    Compile the business days of a calendar identifier once and reuse them afterwards.
+    Without identifier, only weekends are closed.
+
+    Joint calendars are identified by several identifiers separated by "+",
+    e.g. "TARGET+USA", and are compiled into a single calendar following
+    the join rule.
+    """
+    identifiers = frozenset(identifier.split("+")) if identifier else frozenset()
+    key = _compiled_key(identifier, join)
+
+    compiled = COMPILED.get(key)
+    if compiled is not None:
+        return compiled
+
+    if len(identifiers) > 1:
+        compiled = CompiledCalendar.join([compile_calendar(item) for item in sorted(identifiers)], join)
+    elif key in REGISTRY:
+        compiled = CompiledCalendar.from_holidays(REGISTRY[key]())
+    elif key is None:
+        compiled = CompiledCalendar.from_holidays([])
+    else:
+        raise ValueError(f"Unknown calendar {identifier}: expecting one of {', '.join(REGISTRY)}")
+
+    # Another thread may have compiled the same calendar in the meantime
+    with LOCK:
+        return COMPILED.setdefault(key, compiled)
+
+
+def install_calendar(identifier: str, compiled: CompiledCalendar, join: Join = Join.HOLIDAYS) -> None:
+    """
+    Use an already compiled calendar for a calendar identifier, e.g. one loaded
+    from a snapshot, instead of compiling its holidays on first use.
+
+    :param identifier: calendar identifier, or several identifiers separated by "+" for a joint calendar
+    :param compiled: compiled business days of the calendar
+    :param join: rule used to combine the calendars of a joint calendar
+    """
+    with LOCK:
+        COMPILED[_compiled_key(identifier, join)] = compiled
+
+
+def _compiled_key(identifier: Optional[str], join: Join) -> Optional[str] | tuple[frozenset[str], Join]:
+    """
+    Key of a compiled calendar: joint calendars do not depend on the order of their identifiers,
+    and a joint calendar repeating a single identifier, e.g. "TARGET+TARGET", is that calendar.
+    """
+    identifiers = frozenset(identifier.split("+")) if identifier else frozenset()
+    if len(identifiers) == 1:
+        (identifier,) = identifiers
+    return identifier if len(identifiers) < 2 else (identifiers, join)
 
 
 class Calendar:
-    def __init__(self, identifier: Optional[str] = None, adjustment: Optional[Adjustment] = None) -> None:
+    def __init__(
+        self,
+        identifier: Optional[str] = None,
+        adjustment: Optional[Adjustment] = None,
+        join: Join = Join.HOLIDAYS,
+    ) -> None:
+        """
+        :param identifier: calendar identifier, or several identifiers separated by "+" for a joint calendar
+        :param adjustment: good business day adjustment convention
+        :param join: rule used to combine the calendars of a joint calendar
+        """
         self._identifier = identifier
         self._adjustment = adjustment or Adjustment.UNADJUSTED
+        self._join = join
+
+        # Map the identifier to its precomputed business days
+        self._business_days = compile_calendar(identifier, join)
+
+    def __repr__(self) -> str:
+        return f"Calendar({self._identifier}, {self._adjustment}, {self._join})"
+
+    def _key(self) -> tuple:
+        return _compiled_key(self._identifier, self._join), self._adjustment
+
+    def __eq__(self, other: Calendar) -> bool:
+        """
+        Calendars are equal when they have the same identifiers, adjustment convention and join rule,
+        so that they can be used in dictionary keys, e.g. to cache schedules.
+        """
+        if not isinstance(other, Calendar):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
-        # Map the identifier to holidays
-        self._holidays = MAPPING[identifier] if identifier else []
+    @property
+    def identifier(self) -> Optional[str]:
+        return self._identifier
+
+    @property
+    def adjustment(self) -> Adjustment:
+        return self._adjustment
+
+    @property
+    def join(self) -> Join:
+        return self._join
+
+    @property
+    def compiled(self) -> CompiledCalendar:
+        """
+        Precomputed business days of the calendar, compiled or installed when the calendar was created.
+        """
+        return self._business_days
 
     def is_closed(self, date: Date) -> bool:
-        return date.is_weekend or date in self._holidays
+        return not self._business_days.is_open(date.to_excel())
 
     def is_open(self, date: Date) -> bool:
-        return not self.is_closed(date)
+        return self._business_days.is_open(date.to_excel())
 
     def add(self, date: Date, business_days: int) -> Date:
         """
         Add a number of good business days to a date with respect to
-        holidays and good business day adjustment convention specified
-        in the calendar. Works with a positive or negative number of days.
+        holidays specified in the calendar. Works with a positive or
+        negative number of days.
 
         :param date: original date
         :param business_days: positive or negative number of business days
         :return: new date
         """
-        remaining_days = abs(business_days)
-        factor = 1 if business_days >= 0 else -1
-        while remaining_days > 0:
-            date = self.adjust(date + factor * Period(1, Unit.DAY))
-            remaining_days -= 1
-        return date
+        return Date.from_excel(self._business_days.add(date.to_excel(), business_days))
 
     def add_period(self, date: Date, period: Period) -> Date:
         """
@@ -120,22 +439,67 @@ class Calendar:
         """
         return self.adjust(date + period)
 
+    def business_days_between(self, start: Date, end: Date) -> int:
+        """
+        Count the business days between two dates, start date included
+        and end date excluded. The result is negative if the end date
+        is before the start date.
+
+        :param start: start date
+        :param end: end date
+        :return: number of business days
+        """
+        return self._business_days.between(start.to_excel(), end.to_excel())
+
+    def adjust_serials(self, serials: Iterable[int]) -> array:
+        """
+        Adjust many dates given as Excel serial numbers in a single pass,
+        e.g. all the dates of a book of schedules.
+
+        :param serials: Excel serial numbers of the dates
+        :return: Excel serial numbers of the adjusted dates
+        """
+        table = self._business_days.adjusted(self._adjustment)
+        adjusted = array("i", map(table.__getitem__, serials))
+        if adjusted and min(adjusted) == 0:
+            raise ValueError("Date is out of range: no business day to adjust to")
+        return adjusted
+
+    def add_serials(self, serials: Iterable[int], business_days: int) -> array:
+        """
+        Add a number of good business days to many dates given as Excel serial numbers,
+        e.g. to get the payment dates of all the accrual periods of a leg.
+
+        :param serials: Excel serial numbers of the dates
+        :param business_days: positive or negative number of business days
+        :return: Excel serial numbers of the new dates
+        """
+        add = self._business_days.add
+        return array("i", (add(serial, business_days) for serial in serials))
+
     def adjust(self, date: Date) -> Date:
-        match self._adjustment:
-            case Adjustment.UNADJUSTED:
-                return date
+        serial = date.to_excel()
+        if self._adjustment == Adjustment.UNADJUSTED or self._business_days.is_open(serial):
+            return date
 
+        match self._adjustment:
             case Adjustment.PREVIOUS:
-                return previous(date, self._holidays)
+                return Date.from_excel(self._business_days.preceding(serial))
 
             case Adjustment.MODIFIED_PREVIOUS:
-                return modified_previous(date, self._holidays)
+                adjusted_date = Date.from_excel(self._business_days.preceding(serial))
+                if adjusted_date.month == date.month:
+                    return adjusted_date
+                return Date.from_excel(self._business_days.following(serial))
 
             case Adjustment.FOLLOWING:
-                return following(date, self._holidays)
+                return Date.from_excel(self._business_days.following(serial))
 
             case Adjustment.MODIFIED_FOLLOWING:
-                return modified_following(date, self._holidays)
+                adjusted_date = Date.from_excel(self._business_days.following(serial))
+                if adjusted_date.month == date.month:
+                    return adjusted_date
+                return Date.from_excel(self._business_days.preceding(serial))
 
             case _:
                 raise NotImplementedError
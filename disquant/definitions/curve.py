@@ -1,53 +1,196 @@
 import math
+from array import array
+from bisect import bisect_right
 from enum import StrEnum
-from typing import Self
+from typing import Callable, Iterable, Optional, Self
 
-from disquant.definitions.date import Date, DateRange
-from disquant.definitions.day_count import DayCount
+from disquant.definitions.date import MAX_EXCEL, MIN_EXCEL, Date, DateRange
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.day_count import DayCount, year_fractions
 from disquant.definitions.period import Period, Unit
-from disquant.definitions.rate import InterestRate, discount
-from disquant.utils.interpolation import linear_interpolation
+from disquant.definitions.rate import InterestRate, compound_factor, discount
+from disquant.utils.cache import CacheInfo, LRUCache
+from disquant.utils.interpolation import (
+    akima,
+    cubic_interpolation,
+    cubic_spline,
+    linear_interpolation,
+    monotone_convex,
+    monotone_convex_interpolation,
+)
 
 
 class Method(StrEnum):
     """
     List of available interpolation methods in order to compute
     discount factors from the discount curve.
+    The derivatives with respect to the node discount factors, see DiscountCurve.jacobian,
+    are available for all the methods but AKIMA_ZERO_RATE and MONOTONE_CONVEX.
     """
 
     LINEAR_ZERO_RATE = "LinearZeroRate"
     LINEAR_DISCOUNT_FACTOR = "LinearDiscountFactor"
     LOG_LINEAR_DISCOUNT_FACTOR = "LogLinearDiscountFactor"
+    NATURAL_CUBIC_ZERO_RATE = "NaturalCubicZeroRate"
+    CLAMPED_CUBIC_ZERO_RATE = "ClampedCubicZeroRate"
+    AKIMA_ZERO_RATE = "AkimaZeroRate"
+    MONOTONE_CONVEX = "MonotoneConvex"
+
+    @property
+    def is_local(self) -> bool:
+        """
+        Whether a discount factor between two nodes only depends on these two nodes.
+        """
+        return self in (Method.LINEAR_ZERO_RATE, Method.LINEAR_DISCOUNT_FACTOR, Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+
+class Shift(StrEnum):
+    """
+    List of available ways to apply a shift to the discount factors
+    of a discount curve, see ShiftedCurve.
+    """
+
+    ZERO_RATE = "ZeroRate"
+    LOG_DISCOUNT_FACTOR = "LogDiscountFactor"
+
+
+# Zero rate shifts are continuously compounded rates on an ACT/365 basis
+DAYS_PER_YEAR = 365
 
 
 class DiscountCurve:
-    def __init__(self, start: Date, dates: list[Date], factors: list[float]) -> None:
+    def __init__(self, start: Date, dates: list[Date], factors: list[float], cache_size: int = 0) -> None:
         """
         Construct a discount curve from a list of discount factors.
 
         :param start: start date of the curve
         :param dates: list of discount factor dates
         :param factors: list of discount factor values
+        :param cache_size: number of discount factors kept by spot, 0 to disable the cache
         """
-        # Check that each provided date is different
-        if len(set(dates)) != len(dates):
-            raise ValueError("Some dates are duplicated")
-
         # Check that there are as many dates as there are factors
         if len(dates) != len(factors):
             raise ValueError("There needs to be as many dates as factors")
 
-        # Check that the start date is the smallest date
-        if not start < min(dates):
-            raise ValueError("Some dates are smaller or equal to the start date")
+        serials = array("i", (date.to_excel() for date in dates))
+        _check_nodes(start.to_excel(), serials, factors)
+        self._init_nodes(start, serials, factors, cache_size)
+        self._dates = dates
 
-        # Check that the dates are ordered by increasing order
-        if not sorted(dates) == dates:
-            raise ValueError("End dates need to be sorted in ascending order")
+    @classmethod
+    def from_arrays(
+        cls, start: Date, serials: DateArray | array, factors: array | list[float], cache_size: int = 0
+    ) -> Self:
+        """
+        Construct a discount curve from Excel serial numbers and discount factors, without copying them.
+        The inputs are validated in a single pass, and the Date objects of the
+        dates property are only created when it is first accessed.
+
+        :param start: start date of the curve
+        :param serials: DateArray or array of Excel serial numbers of the discount factor dates
+        :param factors: array or list of discount factor values
+        :param cache_size: number of discount factors kept by spot, 0 to disable the cache
+        :return: an instance of DiscountCurve
+        """
+        serials = serials.to_excel() if isinstance(serials, DateArray) else serials
+        if len(serials) != len(factors):
+            raise ValueError("There needs to be as many dates as factors")
+
+        _check_nodes(start.to_excel(), serials, factors)
+        if serials[-1] > MAX_EXCEL:
+            raise ValueError(f"Invalid Excel serial date number: must be in [{MIN_EXCEL}, {MAX_EXCEL}]")
 
+        curve = object.__new__(cls)
+        curve._init_nodes(start, serials, factors, cache_size)
+        curve._dates = None
+        return curve
+
+    def _init_nodes(self, start: Date, serials: array, factors: list[float] | array, cache_size: int) -> None:
+        """
+        Set the validated nodes of the curve. The node data used by the interpolations,
+        i.e. the position of each date, the times in days since the start date,
+        the logarithms of the discount factors and the zero rates, is computed on first use.
+        """
         self._start = start
-        self._dates = dates
+        self._serials = serials
+        self._version = 0
+        self._node_index: Optional[dict[int, int]] = None
+        self._node_times: Optional[list[int]] = None
+        self._set_factors(factors)
+        self._init_cache(cache_size)
+
+    def _set_factors(self, factors: list[float] | array) -> None:
         self._factors = factors
+        self._node_log_factors: Optional[list[float]] = None
+        self._node_zero_rates: Optional[list[float]] = None
+
+        # Interpolation functions by method, built with their coefficients on first use
+        self._interpolators: dict[Method, Callable[[int], float]] = {}
+
+    @property
+    def _index(self) -> dict[int, int]:
+        if self._node_index is None:
+            self._node_index = {serial: i for i, serial in enumerate(self._serials)}
+        return self._node_index
+
+    @property
+    def _times(self) -> list[int]:
+        if self._node_times is None:
+            start = self._start.to_excel()
+            self._node_times = [serial - start for serial in self._serials]
+        return self._node_times
+
+    @property
+    def _log_factors(self) -> list[float]:
+        if self._node_log_factors is None:
+            self._node_log_factors = [math.log(factor) for factor in self._factors]
+        return self._node_log_factors
+
+    @property
+    def _zero_rates(self) -> list[float]:
+        if self._node_zero_rates is None:
+            self._node_zero_rates = [-log_factor / time for log_factor, time in zip(self._log_factors, self._times)]
+        return self._node_zero_rates
+
+    def _init_cache(self, cache_size: int) -> None:
+        """
+        Set up the least recently used cache of spot, keyed by (serial number, method).
+        The cache takes a lock, so that a curve can be shared by threads.
+        """
+        self._cache: LRUCache[tuple[int, Method], float] = LRUCache(cache_size)
+        self._cache_version = self.version
+
+    @property
+    def version(self) -> int:
+        """
+        Number of in-place updates of the discount factors, used to invalidate cached discount factors.
+        """
+        return self._version
+
+    @property
+    def cache_info(self) -> CacheInfo:
+        return self._cache.info
+
+    def clear_cache(self) -> None:
+        """
+        Remove all cached discount factors and reset the hit and miss counters.
+        """
+        self._cache.clear()
+
+    def update(self, factors: list[float] | array) -> None:
+        """
+        Replace the discount factors in place, the dates being unchanged.
+        Discount factors cached by this curve or by views of this curve are invalidated.
+
+        :param factors: list of discount factor values, one per date
+        """
+        if len(factors) != len(self._serials):
+            raise ValueError("There needs to be as many dates as factors")
+        if not min(factors) > 0:
+            raise ValueError("Discount factors need to be positive")
+
+        self._set_factors(factors)
+        self._version += 1
 
     @property
     def start(self) -> Date:
@@ -55,88 +198,155 @@ class DiscountCurve:
 
     @property
     def end(self) -> Date:
-        return self._dates[-1]
+        return Date._from_serial(self._serials[-1])
 
     @property
     def dates(self) -> list[Date]:
+        if self._dates is None:
+            self._dates = [Date._from_serial(serial) for serial in self._serials]
         return self._dates
 
     @property
-    def factors(self) -> list[float]:
+    def factors(self) -> list[float] | array:
         return self._factors
 
     def spot(self, date: Date, method: Method) -> float:
         """
         Spot discount rate to the given date.
+        If the curve has a cache, the discount factors of the requested dates are kept
+        and returned without interpolating again. When the cache is full, the least
+        recently used date is evicted.
 
         :param date: end date
         :param method: interpolation method
         :return: zero discount factor
         """
+        cache = self._cache
+        if not cache.max_size:
+            return self._spot(date, method)
+
+        # Discard cached values computed before an in-place update
+        if self._cache_version != self.version:
+            cache.clear(reset_counters=False)
+            self._cache_version = self.version
+
+        key = (date.to_excel(), method)
+        factor = cache.get(key)
+        if factor is None:
+            factor = self._spot(date, method)
+            cache.put(key, factor)
+        return factor
+
+    def _spot(self, date: Date, method: Method) -> float:
+        """
+        Spot discount rate to the given date, without cache.
+        """
 
         # If the requested date is the start date,
         # return 1
-        if date == self._start:
+        x = date - self._start
+        if x == 0:
             return 1.0
 
         # If the requested date is one of the inputs,
         # return it
-        if date in self._dates:
-            i = self._dates.index(date)
+        i = self._index.get(date.to_excel())
+        if i is not None:
             return self._factors[i]
 
         # If the requested date is outside the allowed range,
         # raise an Exception
-        if not self._start < date <= self.end:
+        if not 0 < x <= self._times[-1]:
             raise ValueError(f"The date needs to be in ]{self.start},  {self.end}]")
 
-        # Find the neighbouring data points
-        i = 1
-        while self._dates[i] <= date:
-            i += 1
+        return self._interpolator(method)(x)
 
-        df1 = self.factors[i - 1]
-        df2 = self.factors[i]
-
-        x1 = self._dates[i - 1] - self.start
-        x2 = self._dates[i] - self.start
-        x = date - self.start
+    def _interpolator(self, method: Method) -> Callable[[int], float]:
+        """
+        Function giving the interpolated discount factor x days after the start date,
+        x being in ]0, end] and not a node. Interpolation coefficients are computed
+        once, on the first use of each method.
+        """
+        interpolator = self._interpolators.get(method)
+        if interpolator is None:
+            interpolator = self._interpolators[method] = self._build_interpolator(method)
+        return interpolator
 
-        # Interpolate
+    def _build_interpolator(self, method: Method) -> Callable[[int], float]:
+        """
+        Compute the interpolation coefficients of a method and return its interpolation function.
+        """
+        # Dates before the first node are rejected by the interpolations,
+        # except for the monotone convex one which starts at the start date
+        nodes = self._times
         match method:
-            case method.LINEAR_ZERO_RATE:
+            case Method.LINEAR_ZERO_RATE:
                 """
                 Linear interpolation of the zero rates.
                 Zero rates are the continuously compounded spot rates inferred from
                 the discount curve.
                 """
-                y1 = -math.log(df1) / x1
-                y2 = -math.log(df2) / x2
-                interp = linear_interpolation(x1, y1, x2, y2, x)
-                y = math.exp(-interp * x)
+                zero_rates = self._zero_rates
+
+                def interpolator(x: int) -> float:
+                    i = max(bisect_right(nodes, x), 1)
+                    y = linear_interpolation(nodes[i - 1], zero_rates[i - 1], nodes[i], zero_rates[i], x)
+                    return math.exp(-y * x)
 
-            case method.LINEAR_DISCOUNT_FACTOR:
+            case Method.LINEAR_DISCOUNT_FACTOR:
                 """
                 Linear interpolation of the discount factors.
                 """
-                y1 = df1
-                y2 = df2
-                y = linear_interpolation(x1, y1, x2, y2, x)
+                factors = self._factors
+
+                def interpolator(x: int) -> float:
+                    i = max(bisect_right(nodes, x), 1)
+                    return linear_interpolation(nodes[i - 1], factors[i - 1], nodes[i], factors[i], x)
 
-            case method.LOG_LINEAR_DISCOUNT_FACTOR:
+            case Method.LOG_LINEAR_DISCOUNT_FACTOR:
                 """
                 Linear interpolation of the natural logarithm of the discount factors.
                 # TODO check also named "FLAT_FORWARD"
                 """
-                y1 = math.log(df1)
-                y2 = math.log(df2)
-                interp = linear_interpolation(x1, y1, x2, y2, x)
-                y = math.exp(interp)
+                log_factors = self._log_factors
+
+                def interpolator(x: int) -> float:
+                    i = max(bisect_right(nodes, x), 1)
+                    y = linear_interpolation(nodes[i - 1], log_factors[i - 1], nodes[i], log_factors[i], x)
+                    return math.exp(y)
+
+            case Method.NATURAL_CUBIC_ZERO_RATE | Method.CLAMPED_CUBIC_ZERO_RATE | Method.AKIMA_ZERO_RATE:
+                """
+                Cubic interpolations of the zero rates:
+                - natural cubic spline, with zero second derivatives at the first and last nodes
+                - clamped cubic spline, with flat zero rates at the first and last nodes
+                - Akima interpolation, less prone to overshooting than cubic splines
+                """
+                if method == Method.AKIMA_ZERO_RATE:
+                    cubics = akima(nodes, self._zero_rates)
+                else:
+                    cubics = cubic_spline(nodes, self._zero_rates, clamped=method == Method.CLAMPED_CUBIC_ZERO_RATE)
+
+                def interpolator(x: int) -> float:
+                    i = max(bisect_right(nodes, x), 1)
+                    return math.exp(-cubic_interpolation(nodes[i - 1], nodes[i], cubics[i - 1], x) * x)
+
+            case Method.MONOTONE_CONVEX:
+                """
+                Monotone convex interpolation of Hagan and West, applied to minus the logarithm of
+                the discount factors from the start date. Instantaneous forward rates are continuous
+                and the discrete forward rates between nodes are preserved.
+                """
+                times = [0] + nodes
+                coefficients = monotone_convex(times, [0.0] + [-log_factor for log_factor in self._log_factors])
+
+                def interpolator(x: int) -> float:
+                    return math.exp(-monotone_convex_interpolation(coefficients[bisect_right(times, x) - 1], x))
 
             case _:
                 raise NotImplementedError
 
-        return y
+        return interpolator
 
     def forward(self, start: Date, end: Date, method: Method) -> float:
         """
@@ -150,27 +360,499 @@ class DiscountCurve:
 
         return self.spot(end, method) / self.spot(start, method)
 
+    def spots(self, dates: DateArray | Iterable[Date], method: Method) -> array:
+        """
+        Spot discount factors to many dates at once.
+        Gives the same results as spot applied to each date.
+
+        :param dates: end dates
+        :param method: interpolation method
+        :return: an array of zero discount factors
+        """
+        start = self._start.to_excel()
+        times = [serial - start for serial in _to_serials(dates)]
+
+        interpolator = self._interpolator(method)
+        nodes = self._times
+        factors = array("d")
+        for x in times:
+            if x == 0:
+                factors.append(1.0)
+                continue
+
+            if not 0 < x <= nodes[-1]:
+                raise ValueError(f"The dates need to be in ]{self.start},  {self.end}]")
+
+            # Exact node dates return the input discount factors
+            i = bisect_right(nodes, x)
+            if i > 0 and nodes[i - 1] == x:
+                factors.append(self._factors[i - 1])
+            else:
+                factors.append(interpolator(x))
+
+        return factors
+
+    def jacobian(self, dates: DateArray | Iterable[Date], method: Method) -> tuple[array, array, array]:
+        """
+        Derivatives of the spot discount factors to many dates with respect to the node discount factors.
+        The Jacobian is returned as a sparse matrix in coordinate format: values[k] is the derivative
+        of the spot discount factor to dates[rows[k]] with respect to factors[columns[k]].
+        With the local methods, only the nodes bracketing a date have non-zero derivatives.
+        Cubic splines being linear in the node zero rates, a date depends on all the nodes.
+
+        The Akima and monotone convex interpolations are not supported: their coefficients
+        are not linear in the node values, as they depend on the differences between
+        neighbouring slopes or forward rates.
+
+        :param dates: end dates
+        :param method: interpolation method, local or cubic spline
+        :return: the rows, columns and values arrays of the non-zero derivatives
+        """
+        start = self._start.to_excel()
+        times = [serial - start for serial in _to_serials(dates)]
+
+        # Pick the function giving the derivatives with respect to the nodes
+        # of a date x in ]nodes[i - 1], nodes[i][ once
+        factors = self._factors
+        nodes = self._times
+        match method:
+            case Method.LINEAR_ZERO_RATE:
+                """
+                The discount factor is exp(-z * x), z being interpolated from the zero rates -log(f) / x.
+                """
+                zero_rates = self._zero_rates
+
+                def derivatives(i: int, x: int) -> list[tuple[int, float]]:
+                    w1, w2 = _weights(nodes[i - 1], nodes[i], x)
+                    y = math.exp(-(w1 * zero_rates[i - 1] + w2 * zero_rates[i]) * x)
+                    return [
+                        (i - 1, y * x * w1 / (nodes[i - 1] * factors[i - 1])),
+                        (i, y * x * w2 / (nodes[i] * factors[i])),
+                    ]
+
+            case Method.LINEAR_DISCOUNT_FACTOR:
+
+                def derivatives(i: int, x: int) -> list[tuple[int, float]]:
+                    w1, w2 = _weights(nodes[i - 1], nodes[i], x)
+                    return [(i - 1, w1), (i, w2)]
+
+            case Method.LOG_LINEAR_DISCOUNT_FACTOR:
+                log_factors = self._log_factors
+
+                def derivatives(i: int, x: int) -> list[tuple[int, float]]:
+                    w1, w2 = _weights(nodes[i - 1], nodes[i], x)
+                    y = math.exp(w1 * log_factors[i - 1] + w2 * log_factors[i])
+                    return [(i - 1, y * w1 / factors[i - 1]), (i, y * w2 / factors[i])]
+
+            case Method.NATURAL_CUBIC_ZERO_RATE | Method.CLAMPED_CUBIC_ZERO_RATE:
+                """
+                The interpolated zero rate is a weighted sum of the node zero rates, the weight
+                of node j being the spline going through 1 at node j and 0 at the other nodes.
+                """
+                clamped = method == Method.CLAMPED_CUBIC_ZERO_RATE
+                basis = [
+                    cubic_spline(nodes, [1.0 if k == j else 0.0 for k in range(len(nodes))], clamped=clamped)
+                    for j in range(len(nodes))
+                ]
+                interpolator = self._interpolator(method)
+
+                def derivatives(i: int, x: int) -> list[tuple[int, float]]:
+                    y = interpolator(x)
+                    return [
+                        (
+                            j,
+                            y
+                            * x
+                            * cubic_interpolation(nodes[i - 1], nodes[i], cubics[i - 1], x)
+                            / (nodes[j] * factors[j]),
+                        )
+                        for j, cubics in enumerate(basis)
+                    ]
+
+            case _:
+                raise ValueError(
+                    f"The Jacobian is not available for {method}: its coefficients are not linear in the node values"
+                )
+
+        rows = array("i")
+        columns = array("i")
+        values = array("d")
+        for row, x in enumerate(times):
+            # The start discount factor is always 1
+            if x == 0:
+                continue
+
+            if not nodes[0] <= x <= nodes[-1]:
+                raise ValueError(f"The dates need to be the start date or in [{self.dates[0]},  {self.end}]")
+
+            # Exact node dates only depend on their own discount factor
+            i = bisect_right(nodes, x)
+            if nodes[i - 1] == x:
+                rows.append(row)
+                columns.append(i - 1)
+                values.append(1.0)
+                continue
+
+            for column, value in derivatives(i, x):
+                rows.append(row)
+                columns.append(column)
+                values.append(value)
+
+        return rows, columns, values
+
+    def forwards(
+        self,
+        starts: DateArray | Iterable[Date],
+        ends: DateArray | Iterable[Date],
+        method: Method,
+    ) -> array:
+        """
+        Forward starting discount factors between many pairs of dates at once.
+
+        :param starts: start dates
+        :param ends: end dates, as many as start dates
+        :param method: interpolation method
+        :return: an array of forward discount factors
+        """
+        start_factors = self.spots(starts, method)
+        end_factors = self.spots(ends, method)
+        if len(start_factors) != len(end_factors):
+            raise ValueError("There needs to be as many start dates as end dates")
+
+        return array("d", (end / start for start, end in zip(start_factors, end_factors)))
+
     @classmethod
-    def flat_forward(cls, start: Date, end: Date, rate: InterestRate, day_count: DayCount) -> Self:
+    def flat_forward(
+        cls, start: Date, end: Date, rate: InterestRate, day_count: DayCount, cache_size: int = 0
+    ) -> "FlatForwardCurve":
         """
         In a "flat forward" discount curve, all spot rates and all forward rates are equal.
         For instance, in a flat forward 1% curve, the 1Y rate, the 2Y rate and the 1Y1Y rates
         are all worth 1%.
 
-        In this basic implentation, we compute all discount factors at instantiation.
-        TODO: use a generator to give the requested discount factors on demand.
+        Discount factors are computed on demand, see FlatForwardCurve.
 
         :param start: start date
         :param end: end date
         :param rate: interest rate with associated compounding frequency
         :param day_count: day count convention
-        :return: an instance of DiscountCurve with precomputed discount factors
+        :param cache_size: number of discount factors kept by spot, 0 to disable the cache
+        :return: an instance of FlatForwardCurve
         """
-        dates = []
-        factors = []
-        for date in DateRange(start + Period(1, Unit.DAY), end + Period(1, Unit.DAY)):
-            factor = discount(rate=rate, start=start, end=date, day_count=day_count)
-            dates.append(date)
-            factors.append(factor)
+        return FlatForwardCurve(start=start, end=end, rate=rate, day_count=day_count, cache_size=cache_size)
+
+
+class FlatForwardCurve(DiscountCurve):
+    def __init__(self, start: Date, end: Date, rate: InterestRate, day_count: DayCount, cache_size: int = 0) -> None:
+        """
+        Construct a flat forward discount curve.
+        The discount factors are computed from the rate when they are requested,
+        and are equal to the ones of a discount curve with one node per day.
+
+        :param start: start date of the curve
+        :param end: end date of the curve
+        :param rate: interest rate with associated compounding frequency
+        :param day_count: day count convention
+        :param cache_size: number of discount factors kept by spot, 0 to disable the cache
+        """
+        if not start < end:
+            raise ValueError("The end date needs to be after the start date")
+
+        self._start = start
+        self._end = end
+        self._rate = rate
+        self._day_count = day_count
+        self._version = 0
+        self._init_cache(cache_size)
+
+    @property
+    def end(self) -> Date:
+        return self._end
 
-        return cls(start=start, dates=dates, factors=factors)
+    @property
+    def rate(self) -> InterestRate:
+        return self._rate
+
+    @property
+    def day_count(self) -> DayCount:
+        return self._day_count
+
+    def update(self, factors: list[float]) -> None:
+        raise NotImplementedError("The discount factors of a flat forward curve are given by its rate")
+
+    @property
+    def dates(self) -> list[Date]:
+        """
+        All the days of the curve, computed on each call.
+        """
+        return list(DateRange(self._start + Period(1, Unit.DAY), self._end + Period(1, Unit.DAY)))
+
+    @property
+    def factors(self) -> list[float]:
+        """
+        Discount factors of all the days of the curve, computed on each call.
+        """
+        return [
+            discount(rate=self._rate, start=self._start, end=date, day_count=self._day_count) for date in self.dates
+        ]
+
+    def _spot(self, date: Date, method: Method) -> float:
+        """
+        Spot discount rate to the given date, without cache.
+        As every day is a node of the curve, the interpolation method has no effect.
+
+        :param date: end date
+        :param method: interpolation method
+        :return: zero discount factor
+        """
+        if date == self._start:
+            return 1.0
+
+        if not self._start < date <= self._end:
+            raise ValueError(f"The date needs to be in ]{self.start},  {self.end}]")
+
+        return discount(rate=self._rate, start=self._start, end=date, day_count=self._day_count)
+
+    def spots(self, dates: DateArray | Iterable[Date], method: Method) -> array:
+        """
+        Spot discount factors to many dates at once.
+        As every day is a node of the curve, the interpolation method has no effect.
+
+        :param dates: end dates
+        :param method: interpolation method
+        :return: an array of zero discount factors
+        """
+        serials = _to_serials(dates)
+        if serials and not (self._start.to_excel() <= min(serials) and max(serials) <= self._end.to_excel()):
+            raise ValueError(f"The dates need to be in ]{self.start},  {self.end}]")
+
+        starts = DateArray([self._start.to_excel()] * len(serials))
+        times = year_fractions(starts, DateArray(serials), self._day_count)
+        return array("d", (1 / compound_factor(rate=self._rate, t=t) for t in times))
+
+    def jacobian(self, dates: DateArray | Iterable[Date], method: Method) -> tuple[array, array, array]:
+        """
+        Derivatives of the spot discount factors to many dates with respect to the node discount factors.
+        As every day is a node of the curve, each date only depends on its own discount factor.
+
+        :param dates: end dates
+        :param method: interpolation method
+        :return: the rows, columns and values arrays of the non-zero derivatives
+        """
+        start = self._start.to_excel()
+        end = self._end.to_excel()
+        rows = array("i")
+        columns = array("i")
+        for row, serial in enumerate(_to_serials(dates)):
+            if not start <= serial <= end:
+                raise ValueError(f"The dates need to be in ]{self.start},  {self.end}]")
+            if serial != start:
+                rows.append(row)
+                columns.append(serial - start - 1)
+
+        return rows, columns, array("d", [1.0]) * len(rows)
+
+
+class ShiftedCurve(DiscountCurve):
+    def __init__(
+        self, curve: DiscountCurve, dates: list[Date], shifts: list[float], kind: Shift, cache_size: int = 0
+    ) -> None:
+        """
+        Construct a view of a discount curve shifted on lookup.
+        The shift is linearly interpolated between the given dates and flat outside,
+        then applied to the discount factors of the base curve:
+        - for Shift.ZERO_RATE, a shift s at t years multiplies the discount factor by exp(-s * t)
+        - for Shift.LOG_DISCOUNT_FACTOR, a shift s multiplies the discount factor by exp(-s)
+
+        The base curve is not copied: its dates and precomputed node data are used
+        by each lookup, so that many scenarios can share the same base curve.
+
+        :param curve: base discount curve
+        :param dates: dates at which the shifts are given
+        :param shifts: shift values, as many as dates
+        :param kind: how the shift is applied to the discount factors
+        :param cache_size: number of discount factors kept by spot, 0 to disable the cache
+        """
+        # Check that there are as many dates as there are shifts
+        if not dates or len(dates) != len(shifts):
+            raise ValueError("There needs to be as many dates as shifts, and at least one")
+
+        # Check that the dates are different and ordered by increasing order
+        if not all(date1 < date2 for date1, date2 in zip(dates[:-1], dates[1:])):
+            raise ValueError("Shift dates need to be sorted in strictly ascending order")
+
+        self._curve = curve
+        self._start = curve.start
+        self._kind = kind
+        self._shift_times = [date - curve.start for date in dates]
+        self._shifts = list(shifts)
+        self._init_cache(cache_size)
+
+    @classmethod
+    def parallel(cls, curve: DiscountCurve, size: float, kind: Shift = Shift.ZERO_RATE, cache_size: int = 0) -> Self:
+        """
+        Shift all the discount factors of a curve by the same amount, e.g. 0.0001 for 1bp.
+        """
+        return cls(curve=curve, dates=[curve.end], shifts=[size], kind=kind, cache_size=cache_size)
+
+    @classmethod
+    def key_rate(
+        cls, curve: DiscountCurve, date: Date, size: float, kind: Shift = Shift.ZERO_RATE, cache_size: int = 0
+    ) -> Self:
+        """
+        Shift the curve around one of its node dates with a triangular shape:
+        the shift is worth size at that node, decreases linearly to zero at the
+        neighbouring nodes, and is flat before the first node and after the last node.
+        The key rate shifts of all the nodes sum up to the parallel shift.
+        """
+        dates = curve.dates
+        if date not in dates:
+            raise ValueError(f"{date} is not a node date of the curve")
+
+        i = dates.index(date)
+        nodes = dates[max(i - 1, 0) : i + 2]
+        shifts = [size if node == date else 0.0 for node in nodes]
+        return cls(curve=curve, dates=nodes, shifts=shifts, kind=kind, cache_size=cache_size)
+
+    @property
+    def curve(self) -> DiscountCurve:
+        return self._curve
+
+    @property
+    def version(self) -> int:
+        """
+        The shift cannot be updated, so the view changes with its base curve only.
+        """
+        return self._curve.version
+
+    def update(self, factors: list[float]) -> None:
+        raise NotImplementedError("A shifted curve cannot be updated, update its base curve instead")
+
+    @property
+    def kind(self) -> Shift:
+        return self._kind
+
+    @property
+    def end(self) -> Date:
+        return self._curve.end
+
+    @property
+    def dates(self) -> list[Date]:
+        return self._curve.dates
+
+    @property
+    def factors(self) -> list[float]:
+        """
+        Shifted discount factors of the node dates, computed on each call.
+        """
+        return [
+            factor * self._adjustment(date - self._start)
+            for date, factor in zip(self._curve.dates, self._curve.factors)
+        ]
+
+    def _adjustment(self, x: int) -> float:
+        """
+        Multiplicative adjustment of the discount factor x days after the start date.
+        """
+        times = self._shift_times
+        shifts = self._shifts
+        i = bisect_right(times, x)
+        if i == 0:
+            shift = shifts[0]
+        elif i == len(times):
+            shift = shifts[-1]
+        else:
+            shift = linear_interpolation(times[i - 1], shifts[i - 1], times[i], shifts[i], x)
+
+        match self._kind:
+            case Shift.ZERO_RATE:
+                return math.exp(-shift * x / DAYS_PER_YEAR)
+            case Shift.LOG_DISCOUNT_FACTOR:
+                return math.exp(-shift)
+            case _:
+                raise NotImplementedError
+
+    def _spot(self, date: Date, method: Method) -> float:
+        """
+        Spot discount rate to the given date, without cache.
+
+        :param date: end date
+        :param method: interpolation method of the base curve
+        :return: zero discount factor
+        """
+        if date == self._start:
+            return 1.0
+
+        return self._curve.spot(date, method) * self._adjustment(date - self._start)
+
+    def spots(self, dates: DateArray | Iterable[Date], method: Method) -> array:
+        """
+        Spot discount factors to many dates at once.
+
+        :param dates: end dates
+        :param method: interpolation method of the base curve
+        :return: an array of zero discount factors
+        """
+        dates = dates if isinstance(dates, DateArray) else DateArray.from_dates(dates)
+        factors = self._curve.spots(dates, method)
+
+        start = self._start.to_excel()
+        for i, serial in enumerate(dates.to_excel()):
+            if serial != start:
+                factors[i] *= self._adjustment(serial - start)
+
+        return factors
+
+    def jacobian(self, dates: DateArray | Iterable[Date], method: Method) -> tuple[array, array, array]:
+        """
+        Derivatives of the spot discount factors to many dates with respect to the node discount factors
+        of the base curve, the shift being independent of the node discount factors.
+
+        :param dates: end dates
+        :param method: interpolation method of the base curve
+        :return: the rows, columns and values arrays of the non-zero derivatives
+        """
+        serials = _to_serials(dates)
+        rows, columns, values = self._curve.jacobian(DateArray._from_array(serials), method)
+
+        start = self._start.to_excel()
+        for k, row in enumerate(rows):
+            values[k] *= self._adjustment(serials[row] - start)
+
+        return rows, columns, values
+
+
+def _weights(x1: int, x2: int, x: int) -> tuple[float, float]:
+    """
+    Linear interpolation weights of the points x1 and x2 at x.
+    """
+    return (x2 - x) / (x2 - x1), (x - x1) / (x2 - x1)
+
+
+def _check_nodes(start: int, serials: array, factors: list[float] | array) -> None:
+    """
+    Check in a single pass that the serial numbers of the nodes are strictly increasing
+    and after the start serial number, and that the discount factors are positive.
+    """
+    if not serials:
+        raise ValueError("There needs to be at least one date")
+
+    previous = start
+    for serial in serials:
+        if serial <= previous:
+            if serial <= start:
+                raise ValueError("Some dates are smaller or equal to the start date")
+            if serial == previous:
+                raise ValueError("Some dates are duplicated")
+            raise ValueError("End dates need to be sorted in ascending order")
+        previous = serial
+
+    if not min(factors) > 0:
+        raise ValueError("Discount factors need to be positive")
+
+
+def _to_serials(dates: DateArray | Iterable[Date]) -> array:
+    """
+    Excel serial numbers of a DateArray or of Date objects.
+    """
+    return (dates if isinstance(dates, DateArray) else DateArray.from_dates(dates)).to_excel()
@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import datetime as dt
+from bisect import bisect_right
 from enum import Enum
-from functools import total_ordering
+from itertools import accumulate
 from typing import Self
 
-# TODO remove dependency on relativedelta
-from dateutil.relativedelta import relativedelta
-
 from disquant.definitions.period import Period, Unit
 
 # Constants are defined here
@@ -20,6 +18,56 @@ MIN_EXCEL = 367
 MAX_EXCEL = 109574
 
 
+def _is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+# Lookup tables used to convert between (year, month, day) and Excel serial numbers
+# - LEAP_YEARS[i] tells whether year MIN_YEAR + i is a leap year
+# - YEAR_STARTS[i] is the serial number of January 1st of year MIN_YEAR + i,
+#   the last item being the serial number of January 1st of MAX_YEAR + 1
+# - MONTH_STARTS[leap][m] is the number of days between January 1st and the 1st of month m + 1
+LEAP_YEARS = tuple(_is_leap(year) for year in range(MIN_YEAR, MAX_YEAR + 1))
+YEAR_STARTS = list(accumulate((366 if leap else 365 for leap in LEAP_YEARS), initial=MIN_EXCEL))
+MONTH_STARTS = (
+    list(accumulate(ENDS_OF_MONTHS[:-1], initial=0)),
+    list(accumulate(ENDS_OF_MONTHS_LEAP_YEAR[:-1], initial=0)),
+)
+DAYS_IN_MONTHS = (ENDS_OF_MONTHS, ENDS_OF_MONTHS_LEAP_YEAR)
+
+
+def _to_serial(year: int, month: int, day: int) -> int:
+    """
+    Convert a valid (year, month, day) triplet into an Excel serial number.
+    """
+    i = year - MIN_YEAR
+    return YEAR_STARTS[i] + MONTH_STARTS[LEAP_YEARS[i]][month - 1] + day - 1
+
+
+def _to_ymd(serial: int) -> tuple[int, int, int]:
+    """
+    Convert a valid Excel serial number into a (year, month, day) triplet.
+    """
+    i = bisect_right(YEAR_STARTS, serial) - 1
+    day_of_year = serial - YEAR_STARTS[i]
+    month_starts = MONTH_STARTS[LEAP_YEARS[i]]
+    month = bisect_right(month_starts, day_of_year)
+    return MIN_YEAR + i, month, day_of_year - month_starts[month - 1] + 1
+
+
+def _add_months(year: int, month: int, day: int, months: int) -> int:
+    """
+    Add a number of months to a (year, month, day) triplet and return the Excel serial
+    number of the resulting date. The day is capped to the last day of the resulting month,
+    e.g. January 31st + 1 month is the last day of February.
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"Date is out of range: year should be in [{MIN_YEAR}, {MAX_YEAR}]")
+    day = min(day, DAYS_IN_MONTHS[LEAP_YEARS[year - MIN_YEAR]][month])
+    return _to_serial(year, month + 1, day)
+
+
 class Weekday(str, Enum):
     MON = "MON"
     TUE = "TUE"
@@ -30,14 +78,22 @@ class Weekday(str, Enum):
     SUN = "SUN"
 
 
-@total_ordering
+# Weekdays indexed by (serial + 5) % 7: January 1st 1901 (serial 367) was a Tuesday
+WEEKDAYS = tuple(Weekday)
+
+
 class Date:
     """
     Custom date implementation.
     Allows dates from January 1st 1901 to December 31st 2199 as per QuantLib
     implementation.
+
+    A Date is stored as its Excel serial number, so that comparing, hashing
+    and adding days or weeks to a Date are simple integer operations.
     """
 
+    __slots__ = ("_serial", "_year", "_month", "_day")
+
     def __init__(self, year: int, month: int, day: int):
         # Base error message
         error = f"Date({year}, {month}, {day}) is invalid: "
@@ -61,12 +117,25 @@ class Date:
             raise ValueError(error)
         self._day = day
 
+        self._serial = _to_serial(year, month, day)
+
     def __repr__(self) -> str:
         return f"Date({self._year:02d}, {self._month:02d}, {self.day:02d})"
 
     def __str__(self) -> str:
         return f"{self._year:02d}-{self._month:02d}-{self.day:02d}"
 
+    @classmethod
+    def _from_serial(cls, serial: int) -> Self:
+        """
+        Instantiate a Date from an Excel serial number known to be valid,
+        bypassing the validation performed in __init__.
+        """
+        date = object.__new__(cls)
+        date._serial = serial
+        date._year, date._month, date._day = _to_ymd(serial)
+        return date
+
     @classmethod
     def today(cls) -> Self:
         """
@@ -87,11 +156,12 @@ class Date:
         """
         Instantiate a Date from an Excel serial date number.
         """
+        if not isinstance(serial, int):
+            raise TypeError(f"Invalid Excel serial date number {serial!r}: expecting an int")
         if not MIN_EXCEL <= serial <= MAX_EXCEL:
             raise ValueError(f"Invalid Excel serial date number: must be in [{MIN_EXCEL}, {MAX_EXCEL}]")
 
-        min_date = Date(1901, 1, 1)
-        return min_date + Period(serial - 367, Unit.DAY)
+        return cls._from_serial(serial)
 
     @classmethod
     def from_string(cls, string: str) -> Self:
@@ -121,9 +191,7 @@ class Date:
         The IMM date is the third Wednesday of the month .
         """
         date = Date(year, month, 15)
-        while date.weekday != "WED":
-            date += Period(1, Unit.DAY)
-        return date
+        return date + Period((2 - date.weekday_index) % 7, Unit.DAY)
 
     @classmethod
     def third_friday(cls, year: int, month: int) -> Self:
@@ -132,9 +200,7 @@ class Date:
         The third Friday of the month is when most European index futures expire.
         """
         date = Date(year, month, 15)
-        while date.weekday != "FRI":
-            date += Period(1, Unit.DAY)
-        return date
+        return date + Period((4 - date.weekday_index) % 7, Unit.DAY)
 
     def to_date(self) -> dt.date:
         """
@@ -147,8 +213,7 @@ class Date:
         Convert the date into an Excel serial number.
         Allowed dates start on January 1st 1901, i.e. after the "Excel bug" of year 1900.
         """
-        period = self - Date(1901, 1, 1)
-        return 367 + period
+        return self._serial
 
     @property
     def year(self) -> int:
@@ -162,15 +227,20 @@ class Date:
     def day(self) -> int:
         return self._day
 
+    @property
+    def weekday_index(self) -> int:
+        """
+        Day of the week as an integer, from 0 for Monday to 6 for Sunday.
+        """
+        return (self._serial + 5) % 7
+
     @property
     def weekday(self) -> Weekday:
-        date = self.to_date()
-        weekday = date.strftime("%a")
-        return Weekday(weekday.upper())
+        return WEEKDAYS[(self._serial + 5) % 7]
 
     @property
     def is_weekend(self) -> bool:
-        return self.weekday in [Weekday.SAT, Weekday.SUN]
+        return (self._serial + 5) % 7 >= 5
 
     @property
     def is_weekday(self) -> bool:
@@ -178,7 +248,7 @@ class Date:
 
     @property
     def is_leap(self) -> bool:
-        return self._year % 4 == 0 and (self._year % 100 != 0 or self._year % 400 == 0)
+        return _is_leap(self._year)
 
     @property
     def is_eom(self) -> bool:
@@ -194,7 +264,7 @@ class Date:
         """
         ends_of_months = ENDS_OF_MONTHS_LEAP_YEAR if self.is_leap else ENDS_OF_MONTHS
         last_day = ends_of_months[self._month - 1]
-        return Date(self._year, self._month, last_day)
+        return Date._from_serial(self._serial + last_day - self._day)
 
     def __add__(self, other: Period) -> Date:
         """
@@ -203,23 +273,18 @@ class Date:
         if not isinstance(other, Period):
             raise TypeError("Only a Period can be added to a Date")
 
-        date = dt.date(self._year, self._month, self.day)
-        return self._add_delta(date, other)
+        return self._add_period(other.quantity, other.unit)
 
     def __sub__(self, other: Date | Period) -> Date | int:
         """
         Subtracting a Date from another Date returns the number of calendar days in between as an integer.
         Subtracting a Period from a Date returns a new Date.
         """
-        date = dt.date(self._year, self._month, self.day)
-
         if isinstance(other, Date):
-            other = dt.date(other._year, other._month, other.day)
-            return (date - other).days
+            return self._serial - other._serial
 
         elif isinstance(other, Period):
-            period = Period(-other.quantity, other.unit)
-            return self._add_delta(date, period)
+            return self._add_period(-other.quantity, other.unit)
 
         else:
             raise TypeError(f"Only a Date or a Period can be subtracted from a Date")
@@ -228,32 +293,52 @@ class Date:
         """
         Required in order to use a Date as a dictionary key for instance.
         """
-        return hash((self._year, self._month, self.day))
-
-    @staticmethod
-    def _add_delta(date: dt.date, period: Period):
-        days = period.quantity if period.unit == "D" else 0
-        weeks = period.quantity if period.unit == "W" else 0
-        months = period.quantity if period.unit == "M" else 0
-        years = period.quantity if period.unit == "Y" else 0
+        return hash(self._serial)
 
-        new_date = date + relativedelta(days=days, weeks=weeks, months=months, years=years)
-        return Date(new_date.year, new_date.month, new_date.day)
+    def _add_period(self, quantity: int, unit: Unit) -> Date:
+        """
+        Days and weeks are added to the serial number directly.
+        Months and years are added to the month count and the day is
+        capped to the last day of the resulting month.
+        """
+        match unit:
+            case Unit.DAY:
+                serial = self._serial + quantity
+            case Unit.WEEK:
+                serial = self._serial + 7 * quantity
+            case Unit.MONTH:
+                serial = _add_months(self._year, self._month, self._day, quantity)
+            case Unit.YEAR:
+                serial = _add_months(self._year, self._month, self._day, 12 * quantity)
+            case _:
+                raise NotImplementedError
+
+        return Date.from_excel(serial)
 
     def __eq__(self, other: Date) -> bool:
-        return self._year == other._year and self._month == other._month and self.day == other.day
+        if not isinstance(other, Date):
+            return NotImplemented
+        return self._serial == other._serial
 
     def __lt__(self, other: Date) -> bool:
-        if self._year != other._year:
-            return self._year < other._year
+        if not isinstance(other, Date):
+            return NotImplemented
+        return self._serial < other._serial
 
-        elif self._month != other._month:
-            return self._month < other._month
+    def __le__(self, other: Date) -> bool:
+        if not isinstance(other, Date):
+            return NotImplemented
+        return self._serial <= other._serial
 
-        elif self.day != other.day:
-            return self.day < other.day
+    def __gt__(self, other: Date) -> bool:
+        if not isinstance(other, Date):
+            return NotImplemented
+        return self._serial > other._serial
 
-        return False
+    def __ge__(self, other: Date) -> bool:
+        if not isinstance(other, Date):
+            return NotImplemented
+        return self._serial >= other._serial
 
 
 class DateRange:
@@ -265,7 +350,5 @@ class DateRange:
         return self.start <= item < self.end
 
     def __iter__(self) -> list[Date]:
-        date = self.start
-        while date < self.end:
-            yield date
-            date += Period(1, Unit.DAY)
+        for serial in range(self.start.to_excel(), self.end.to_excel()):
+            yield Date._from_serial(serial)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import datetime as dt
+from array import array
+from typing import Iterable, Optional, Self
+
+from disquant.definitions.date import (
+    DAYS_IN_MONTHS,
+    LEAP_YEARS,
+    MAX_EXCEL,
+    MIN_EXCEL,
+    MIN_YEAR,
+    WEEKDAYS,
+    Date,
+    Weekday,
+    _add_months,
+    _to_ymd,
+)
+from disquant.definitions.period import Period, Unit
+
+# Offset between python ordinals (January 1st of year 1 is 1) and Excel serial numbers
+ORDINAL_OFFSET = dt.date(1901, 1, 1).toordinal() - MIN_EXCEL
+
+
+class DateArray:
+    """
+    Columnar companion to Date.
+
+    A DateArray stores Excel serial numbers in a 32-bit integer array, i.e.
+    4 bytes per date, and applies date operations to all its dates at once.
+    Items are returned as Date objects.
+
+    Comparison operators are applied element-wise, against a Date or against
+    a DateArray of the same length, and return a list of booleans.
+    """
+
+    __slots__ = ("_serials",)
+
+    def __init__(self, serials: Iterable[int] = ()) -> None:
+        """
+        Construct a DateArray from Excel serial numbers.
+
+        :param serials: Excel serial numbers
+        """
+        serials = serials if isinstance(serials, array) and serials.typecode == "i" else array("i", serials)
+        if serials and not (MIN_EXCEL <= min(serials) and max(serials) <= MAX_EXCEL):
+            raise ValueError(f"Invalid Excel serial date number: must be in [{MIN_EXCEL}, {MAX_EXCEL}]")
+        self._serials = serials
+
+    def __repr__(self) -> str:
+        return f"DateArray([{', '.join(str(date) for date in self)}])"
+
+    @classmethod
+    def _from_array(cls, serials: array) -> Self:
+        """
+        Instantiate a DateArray from an array of serial numbers known to be valid.
+        """
+        dates = object.__new__(cls)
+        dates._serials = serials
+        return dates
+
+    @classmethod
+    def from_excel(cls, serials: Iterable[int]) -> Self:
+        """
+        Instantiate a DateArray from Excel serial date numbers.
+        """
+        return cls(serials)
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[Date | dt.date]) -> Self:
+        """
+        Instantiate a DateArray from Date or datetime.date objects.
+        """
+        return cls(date.to_excel() if isinstance(date, Date) else date.toordinal() - ORDINAL_OFFSET for date in dates)
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> Self:
+        """
+        Instantiate a DateArray from strings.
+        Expected string format is "YYYY-MM-DD".
+        """
+        return cls(Date.from_string(string).to_excel() for string in strings)
+
+    def to_list(self) -> list[Date]:
+        return [Date._from_serial(serial) for serial in self._serials]
+
+    def to_excel(self) -> array:
+        """
+        Excel serial numbers of the dates.
+        The underlying array is returned without copy.
+        """
+        return self._serials
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def __iter__(self) -> Iterable[Date]:
+        for serial in self._serials:
+            yield Date._from_serial(serial)
+
+    def __getitem__(self, item: int | slice) -> Date | DateArray:
+        if isinstance(item, slice):
+            return DateArray._from_array(self._serials[item])
+        return Date._from_serial(self._serials[item])
+
+    @property
+    def year(self) -> array:
+        return array("i", (_to_ymd(serial)[0] for serial in self._serials))
+
+    @property
+    def month(self) -> array:
+        return array("i", (_to_ymd(serial)[1] for serial in self._serials))
+
+    @property
+    def day(self) -> array:
+        return array("i", (_to_ymd(serial)[2] for serial in self._serials))
+
+    @property
+    def weekday_index(self) -> array:
+        return array("b", ((serial + 5) % 7 for serial in self._serials))
+
+    @property
+    def weekday(self) -> list[Weekday]:
+        return [WEEKDAYS[(serial + 5) % 7] for serial in self._serials]
+
+    @property
+    def is_weekend(self) -> list[bool]:
+        return [(serial + 5) % 7 >= 5 for serial in self._serials]
+
+    @property
+    def is_eom(self) -> list[bool]:
+        """
+        Check whether each date is an end of month.
+        """
+        return [serial == eom for serial, eom in zip(self._serials, self._eom_serials())]
+
+    def get_eom(self) -> DateArray:
+        """
+        Return a new DateArray with the last day of the month of each date.
+        """
+        return DateArray._from_array(array("i", self._eom_serials()))
+
+    def _eom_serials(self) -> Iterable[int]:
+        for serial in self._serials:
+            year, month, day = _to_ymd(serial)
+            yield serial + DAYS_IN_MONTHS[LEAP_YEARS[year - MIN_YEAR]][month - 1] - day
+
+    def sort(self) -> DateArray:
+        """
+        Return a new DateArray with the dates sorted in ascending order.
+        """
+        return DateArray._from_array(array("i", sorted(self._serials)))
+
+    def argsort(self) -> list[int]:
+        """
+        Return the indices that would sort the dates in ascending order.
+        """
+        return sorted(range(len(self._serials)), key=self._serials.__getitem__)
+
+    def __add__(self, other: Period) -> DateArray:
+        """
+        Adding a Period to a DateArray adds it to each date and returns a new DateArray.
+        """
+        if not isinstance(other, Period):
+            raise TypeError("Only a Period can be added to a DateArray")
+
+        return self._add_period(other.quantity, other.unit)
+
+    def __sub__(self, other: DateArray | Date | Period) -> DateArray | array:
+        """
+        Subtracting a DateArray or a Date returns the number of calendar days in between as an array of integers.
+        Subtracting a Period returns a new DateArray.
+        """
+        if isinstance(other, DateArray):
+            self._check_length(other)
+            return array("i", (x - y for x, y in zip(self._serials, other._serials)))
+
+        elif isinstance(other, Date):
+            serial = other.to_excel()
+            return array("i", (x - serial for x in self._serials))
+
+        elif isinstance(other, Period):
+            return self._add_period(-other.quantity, other.unit)
+
+        else:
+            raise TypeError("Only a DateArray, a Date or a Period can be subtracted from a DateArray")
+
+    def _add_period(self, quantity: int, unit: Unit) -> DateArray:
+        match unit:
+            case Unit.DAY:
+                return DateArray(serial + quantity for serial in self._serials)
+            case Unit.WEEK:
+                return DateArray(serial + 7 * quantity for serial in self._serials)
+            case Unit.MONTH:
+                months = quantity
+            case Unit.YEAR:
+                months = 12 * quantity
+            case _:
+                raise NotImplementedError
+
+        return DateArray._from_array(array("i", (_add_months(*_to_ymd(serial), months) for serial in self._serials)))
+
+    def _check_length(self, other: DateArray) -> None:
+        if len(other) != len(self):
+            raise ValueError(f"DateArray lengths differ: {len(self)} and {len(other)}")
+
+    def _others(self, other: object) -> Optional[Iterable[int]]:
+        """
+        Serial numbers to compare element-wise with the current DateArray,
+        or None if the other object is neither a DateArray nor a Date.
+        """
+        if isinstance(other, DateArray):
+            self._check_length(other)
+            return other._serials
+
+        if isinstance(other, Date):
+            return [other.to_excel()] * len(self._serials)
+
+        return None
+
+    def __eq__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x == y for x, y in zip(self._serials, others)]
+
+    def __ne__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x != y for x, y in zip(self._serials, others)]
+
+    def __lt__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x < y for x, y in zip(self._serials, others)]
+
+    def __le__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x <= y for x, y in zip(self._serials, others)]
+
+    def __gt__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x > y for x, y in zip(self._serials, others)]
+
+    def __ge__(self, other: DateArray | Date) -> list[bool]:
+        others = self._others(other)
+        if others is None:
+            return NotImplemented
+        return [x >= y for x, y in zip(self._serials, others)]
+
+    # Element-wise equality makes a DateArray unhashable
+    __hash__ = None
@@ -1,7 +1,10 @@
+from array import array
+from bisect import bisect_right
 from enum import Enum
+from typing import Iterable
 
-from disquant.definitions.date import Date, DateRange
-
+from disquant.definitions.date import DAYS_IN_MONTHS, LEAP_YEARS, MIN_EXCEL, YEAR_STARTS, Date
+from disquant.definitions.date_array import DateArray
 
 # Some useful definitions
 # https://www.isda.org/a/pIJEE/The-Actual-Actual-Day-Count-Fraction-1999.pdf
@@ -22,6 +25,22 @@ class DayCount(str, Enum):
     ACTUAL_ACTUAL_ISDA = "ACT/ACT ISDA"
 
 
+# Lookup tables indexed directly by Excel serial number, used to compute 30/360 year fractions in batch
+# - THIRTY_DAYS[serial] is the number of 30/360 days between December 30th MIN_YEAR - 1 and the date,
+#   when every month has 30 days and the 31st is treated as the 30th
+# - DAYS_OF_MONTH[serial] is the day of month of the date
+# Serial numbers below MIN_EXCEL are padded with zeros so that no offset needs to be subtracted.
+_YEAR_THIRTY_DAYS = tuple(
+    [30 * month + min(day, 30) for month, length in enumerate(lengths) for day in range(1, length + 1)]
+    for lengths in DAYS_IN_MONTHS
+)
+_YEAR_DAYS = tuple(bytes(day for length in lengths for day in range(1, length + 1)) for lengths in DAYS_IN_MONTHS)
+THIRTY_DAYS = array("i", bytes(4 * MIN_EXCEL))
+for _year, _leap in enumerate(LEAP_YEARS):
+    THIRTY_DAYS.fromlist([360 * _year + days for days in _YEAR_THIRTY_DAYS[_leap]])
+DAYS_OF_MONTH = array("b", bytes(MIN_EXCEL) + b"".join(_YEAR_DAYS[leap] for leap in LEAP_YEARS))
+
+
 # TODO rename
 def year_fraction(start: Date, end: Date, day_count: DayCount) -> float:
     """
@@ -83,10 +102,75 @@ def year_fraction(start: Date, end: Date, day_count: DayCount) -> float:
             """
             This implementation follows the ACT/ACT ISDA definition.
             https://www.isda.org/a/pIJEE/The-Actual-Actual-Day-Count-Fraction-1999.pdf
+            The period is split at year boundaries to count the days falling in leap years.
             """
-            leap = sum(1 for x in DateRange(start, end) if x.is_leap)
+            leap = _leap_days(start.to_excel(), end.to_excel())
             non_leap = calendar_days - leap
             return leap / 366 + non_leap / 365
 
         case _:
             raise NotImplementedError
+
+
+def _leap_days(start: int, end: int) -> int:
+    """
+    Number of days in [start, end[ falling in leap years, dates being Excel serial numbers.
+    The period is split at year boundaries, i.e. one step per calendar year.
+    """
+    leap = 0
+    for i in range(bisect_right(YEAR_STARTS, start) - 1, bisect_right(YEAR_STARTS, end)):
+        if LEAP_YEARS[i]:
+            leap += max(min(end, YEAR_STARTS[i + 1]) - max(start, YEAR_STARTS[i]), 0)
+    return leap
+
+
+def year_fractions(
+    starts: DateArray | Iterable[Date],
+    ends: DateArray | Iterable[Date],
+    day_count: DayCount,
+) -> array:
+    """
+    Compute the fractions of year between many pairs of dates at once.
+    Gives the same results as year_fraction applied to each pair of dates.
+
+    :param starts: start dates
+    :param ends: end dates, as many as start dates
+    :param day_count: day count convention
+    :return: an array of year fractions
+    """
+    starts = (starts if isinstance(starts, DateArray) else DateArray.from_dates(starts)).to_excel()
+    ends = (ends if isinstance(ends, DateArray) else DateArray.from_dates(ends)).to_excel()
+    if len(starts) != len(ends):
+        raise ValueError("There needs to be as many start dates as end dates")
+
+    match day_count:
+        case DayCount.THIRTY_E_360:
+            thirty_days = THIRTY_DAYS
+            return array("d", ((thirty_days[end] - thirty_days[start]) / 360 for start, end in zip(starts, ends)))
+
+        case DayCount.THIRTY_360:
+            # Same as 30E/360, except that an end date on the 31st stays the 31st unless the start date is the 30th or 31st
+            thirty_days, days = THIRTY_DAYS, DAYS_OF_MONTH
+            return array(
+                "d",
+                (
+                    (thirty_days[end] - thirty_days[start] + (days[end] == 31 and days[start] < 30)) / 360
+                    for start, end in zip(starts, ends)
+                ),
+            )
+
+        case DayCount.ACTUAL_360:
+            return array("d", ((end - start) / 360 for start, end in zip(starts, ends)))
+
+        case DayCount.ACTUAL_365_FIXED:
+            return array("d", ((end - start) / 365 for start, end in zip(starts, ends)))
+
+        case DayCount.ACTUAL_ACTUAL_ISDA:
+            fractions = array("d")
+            for start, end in zip(starts, ends):
+                leap = _leap_days(start, end)
+                fractions.append(leap / 366 + (end - start - leap) / 365)
+            return fractions
+
+        case _:
+            raise NotImplementedError
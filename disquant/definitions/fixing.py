@@ -0,0 +1,98 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Self, Sequence
+
+from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+
+
+class Fixings:
+    """
+    Historical fixings of a rate index, e.g. the daily fixings of ESTR.
+
+    Fixing dates are stored as Excel serial numbers in increasing order,
+    next to the fixed rates, so that a fixing is found by bisection.
+    """
+
+    def __init__(self, index: str, dates: DateArray | Iterable[Date], rates: Iterable[float]) -> None:
+        """
+        :param index: rate index identifier
+        :param dates: fixing dates, in increasing order
+        :param rates: fixed rates, one per date
+        """
+        serials = (dates if isinstance(dates, DateArray) else DateArray.from_dates(dates)).to_excel()
+        rates = array("d", rates)
+        _check_fixings(serials, rates)
+
+        self._index = index
+        self._serials = serials
+        self._rates = rates
+
+    @classmethod
+    def from_arrays(cls, index: str, serials: Sequence[int], rates: Sequence[float]) -> Self:
+        """
+        Instantiate Fixings from Excel serial numbers and rates, without copying them.
+
+        :param index: rate index identifier
+        :param serials: Excel serial numbers of the fixing dates, in increasing order
+        :param rates: fixed rates, one per date
+        """
+        _check_fixings(serials, rates)
+
+        fixings = object.__new__(cls)
+        fixings._index = index
+        fixings._serials = serials
+        fixings._rates = rates
+        return fixings
+
+    def __repr__(self) -> str:
+        return f"Fixings({self._index}, {len(self)} fixings)"
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def __contains__(self, date: Date) -> bool:
+        serial = date.to_excel()
+        i = bisect_left(self._serials, serial)
+        return i < len(self._serials) and self._serials[i] == serial
+
+    @property
+    def index(self) -> str:
+        return self._index
+
+    @property
+    def serials(self) -> Sequence[int]:
+        return self._serials
+
+    @property
+    def rates(self) -> Sequence[float]:
+        return self._rates
+
+    @property
+    def dates(self) -> DateArray:
+        return DateArray(self._serials)
+
+    def rate(self, date: Date) -> float:
+        """
+        Rate fixed on the given date.
+
+        :param date: fixing date
+        :return: fixed rate
+        """
+        serial = date.to_excel()
+        i = bisect_left(self._serials, serial)
+        if i == len(self._serials) or self._serials[i] != serial:
+            raise ValueError(f"No fixing of {self._index} on {date}")
+        return self._rates[i]
+
+
+def _check_fixings(serials: Sequence[int], rates: Sequence[float]) -> None:
+    """
+    Check in a single pass that the fixing dates are strictly increasing.
+    """
+    if len(serials) != len(rates):
+        raise ValueError("There needs to be as many dates as rates")
+
+    for previous, serial in zip(serials, serials[1:]):
+        if serial <= previous:
+            raise ValueError("Fixing dates need to be sorted in strictly ascending order")
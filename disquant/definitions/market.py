@@ -0,0 +1,150 @@
+import threading
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from disquant.definitions.curve import DiscountCurve
+from disquant.definitions.fixing import Fixings
+from disquant.definitions.money import Currency, Money
+
+
+def _frozen(mapping: Mapping) -> Mapping:
+    return MappingProxyType(dict(mapping))
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """
+    Immutable state of the market data at a given version:
+    - discount curves by currency
+    - projection curves by rate index
+    - FX spot rates by (base currency, quote currency), giving the amount of quote currency for one unit of base currency
+    - fixings by rate index
+
+    The mappings are copied when the snapshot is created, so that later changes
+    to the mappings it was created from do not affect it. Curves are shared between
+    snapshots and must not be updated in place: a new curve is swapped in the market instead.
+    """
+
+    version: int = 0
+    discount_curves: Mapping[Currency, DiscountCurve] = field(default_factory=dict)
+    projection_curves: Mapping[str, DiscountCurve] = field(default_factory=dict)
+    fx_spots: Mapping[tuple[Currency, Currency], float] = field(default_factory=dict)
+    fixings: Mapping[str, Fixings] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for name in ("discount_curves", "projection_curves", "fx_spots", "fixings"):
+            object.__setattr__(self, name, _frozen(getattr(self, name)))
+
+    def discount_curve(self, currency: Currency) -> DiscountCurve:
+        curve = self.discount_curves.get(currency)
+        if curve is None:
+            raise ValueError(f"No discount curve for {currency}")
+        return curve
+
+    def projection_curve(self, index: str) -> DiscountCurve:
+        curve = self.projection_curves.get(index)
+        if curve is None:
+            raise ValueError(f"No projection curve for {index}")
+        return curve
+
+    def index_fixings(self, index: str) -> Fixings:
+        fixings = self.fixings.get(index)
+        if fixings is None:
+            raise ValueError(f"No fixings for {index}")
+        return fixings
+
+    def fx_spot(self, base: Currency, quote: Currency) -> float:
+        """
+        Amount of quote currency for one unit of base currency, inverting the opposite pair if needed.
+        """
+        if base == quote:
+            return 1.0
+
+        spot = self.fx_spots.get((base, quote))
+        if spot is not None:
+            return spot
+
+        spot = self.fx_spots.get((quote, base))
+        if spot is not None:
+            return 1 / spot
+
+        raise ValueError(f"No FX spot for {base}/{quote}")
+
+    def convert(self, money: Money, currency: Currency) -> Money:
+        """
+        Convert an amount of money into another currency at the FX spot rate.
+        """
+        return Money(money.amount * self.fx_spot(money.currency, currency), currency)
+
+
+class Market:
+    """
+    Container of the current market data, read through immutable snapshots.
+
+    Readers take a snapshot and value against it, while a writer swaps in updated
+    market data. Each update builds a new snapshot with copies of the small mappings
+    of the previous snapshot, merged with the changes, and shares all the curves with it,
+    so that readers holding a previous snapshot keep seeing consistent market data.
+    """
+
+    def __init__(self, snapshot: Optional[MarketSnapshot] = None) -> None:
+        """
+        :param snapshot: initial market data, empty by default
+        """
+        self._snapshot = snapshot or MarketSnapshot()
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> MarketSnapshot:
+        """
+        Current market data, unaffected by later updates.
+        """
+        return self._snapshot
+
+    def update(
+        self,
+        discount_curves: Optional[Mapping[Currency, DiscountCurve]] = None,
+        projection_curves: Optional[Mapping[str, DiscountCurve]] = None,
+        fx_spots: Optional[Mapping[tuple[Currency, Currency], float]] = None,
+        fixings: Optional[Mapping[str, Fixings]] = None,
+    ) -> MarketSnapshot:
+        """
+        Add or replace market data, all changes being visible at once in the next snapshot.
+
+        :param discount_curves: discount curves by currency
+        :param projection_curves: projection curves by rate index
+        :param fx_spots: FX spot rates by (base currency, quote currency)
+        :param fixings: fixings by rate index
+        :return: the new snapshot
+        """
+        changes = {
+            name: mapping
+            for name, mapping in [
+                ("discount_curves", discount_curves),
+                ("projection_curves", projection_curves),
+                ("fx_spots", fx_spots),
+                ("fixings", fixings),
+            ]
+            if mapping
+        }
+
+        # Writers are serialised so that concurrent updates are not lost,
+        # readers only read the current snapshot attribute
+        with self._lock:
+            snapshot = self._snapshot
+            # The merged mappings are frozen by the new snapshot
+            updated = {name: {**getattr(snapshot, name), **mapping} for name, mapping in changes.items()}
+            self._snapshot = replace(snapshot, version=snapshot.version + 1, **updated)
+            return self._snapshot
+
+    def set_discount_curve(self, currency: Currency, curve: DiscountCurve) -> MarketSnapshot:
+        return self.update(discount_curves={currency: curve})
+
+    def set_projection_curve(self, index: str, curve: DiscountCurve) -> MarketSnapshot:
+        return self.update(projection_curves={index: curve})
+
+    def set_fx_spot(self, base: Currency, quote: Currency, spot: float) -> MarketSnapshot:
+        return self.update(fx_spots={(base, quote): spot})
+
+    def set_fixings(self, fixings: Fixings) -> MarketSnapshot:
+        return self.update(fixings={fixings.index: fixings})
@@ -108,7 +108,17 @@ def compound(rate: InterestRate, start: Date, end: Date, day_count: DayCount) ->
     :return: the compound factor
     """
     t = year_fraction(start=start, end=end, day_count=day_count)
+    return compound_factor(rate=rate, t=t)
 
+
+def compound_factor(rate: InterestRate, t: float) -> float:
+    """
+    Compute the compound factor over a time expressed in years.
+
+    :param rate: interest rate
+    :param t: time in years
+    :return: the compound factor
+    """
     # If the compounding is not defined,
     # we assume it's a simple interest rate
     if rate.compounding is None:
@@ -1,9 +1,22 @@
+from array import array
 from enum import StrEnum
-from typing import Optional
+from typing import Iterable, Optional, Self, Sequence
 
 from disquant.definitions.business_day import Calendar
-from disquant.definitions.date import Date
+from disquant.definitions.date import (
+    DAYS_IN_MONTHS,
+    LEAP_YEARS,
+    MAX_YEAR,
+    MIN_YEAR,
+    Date,
+    _add_months,
+    _to_serial,
+    _to_ymd,
+)
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.day_count import DayCount, year_fractions
 from disquant.definitions.period import Period, Unit
+from disquant.utils.cache import CacheInfo, LRUCache
 
 
 # Todo add long and short stub
@@ -81,3 +94,365 @@ def generate_schedule(
 
     # Sort the dates
     return sorted(schedule)
+
+
+# Excel serial number of the first day and number of days of each month, by month index
+# from January of MIN_YEAR, used to roll dates month by month without converting them
+MONTH_FIRSTS = array(
+    "i", (_to_serial(year, month, 1) for year in range(MIN_YEAR, MAX_YEAR + 1) for month in range(1, 13))
+)
+MONTH_LENGTHS = array(
+    "b",
+    (
+        DAYS_IN_MONTHS[LEAP_YEARS[year - MIN_YEAR]][month]
+        for year in range(MIN_YEAR, MAX_YEAR + 1)
+        for month in range(12)
+    ),
+)
+
+
+class Schedules:
+    """
+    Columnar storage of many schedules, e.g. the schedules of all the trades of a book.
+
+    The dates of all the schedules are stored one schedule after the other
+    as Excel serial numbers in a single flat array, and schedule i is made of
+    the dates between offsets[i] included and offsets[i + 1] excluded.
+    Items are returned as DateArray objects.
+    """
+
+    __slots__ = ("_serials", "_offsets")
+
+    def __init__(self, serials: array, offsets: array) -> None:
+        """
+        :param serials: Excel serial numbers of the dates of all the schedules
+        :param offsets: position of the first date of each schedule, followed by the total number of dates
+        """
+        if not offsets or offsets[0] != 0 or offsets[-1] != len(serials):
+            raise ValueError("Offsets need to start at 0 and end at the number of dates")
+
+        self._serials = serials
+        self._offsets = offsets
+
+    def __repr__(self) -> str:
+        return f"Schedules({len(self)} schedules, {len(self._serials)} dates)"
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, item: int) -> DateArray:
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("Schedule index out of range")
+        return DateArray._from_array(self._serials[self._offsets[item] : self._offsets[item + 1]])
+
+    def __iter__(self) -> Iterable[DateArray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def serials(self) -> array:
+        """
+        Excel serial numbers of the dates of all the schedules, without copy.
+        """
+        return self._serials
+
+    @property
+    def offsets(self) -> array:
+        """
+        Position of the first date of each schedule in the serial numbers, followed by the total number of dates.
+        """
+        return self._offsets
+
+    def to_lists(self) -> list[list[Date]]:
+        return [schedule.to_list() for schedule in self]
+
+
+def generate_schedules(
+    starts: DateArray | Iterable[Date],
+    ends: DateArray | Iterable[Date],
+    step: Period,
+    calendar: Calendar,
+    stub: Stub,
+    roll: Optional[Roll] = Roll.DOM,
+) -> Schedules:
+    """
+    Generate the schedules of many trades sharing the same step, calendar, stub and roll.
+    Each schedule is the one given by generate_schedule for the same inputs.
+
+    Dates are handled as Excel serial numbers: the end dates are adjusted in a first pass,
+    the unadjusted dates of all the schedules are rolled in a second pass and
+    all the dates are adjusted in a last pass, without creating any Date object.
+
+    :param starts: start dates
+    :param ends: end dates, one per start date
+    :param step: period used to compute the regular steps (e.g. "3M")
+    :param calendar: holidays and adjustment convention
+    :param stub: stub convention
+    :param roll: roll convention (DayOfMonth or EndOfMonth)
+    :return: the schedules, in the order of the start dates
+    """
+    starts = (starts if isinstance(starts, DateArray) else DateArray.from_dates(starts)).to_excel()
+    ends = (ends if isinstance(ends, DateArray) else DateArray.from_dates(ends)).to_excel()
+    if len(starts) != len(ends):
+        raise ValueError("There needs to be as many start dates as end dates")
+
+    freq_eom = step >= Period(1, Unit.MONTH)
+    roll_eom = freq_eom and roll == Roll.EOM
+    match step.unit:
+        case Unit.DAY:
+            months, days = 0, step.quantity
+        case Unit.WEEK:
+            months, days = 0, 7 * step.quantity
+        case Unit.MONTH:
+            months, days = step.quantity, 0
+        case Unit.YEAR:
+            months, days = 12 * step.quantity, 0
+        case _:
+            raise NotImplementedError
+
+    serials = array("i")
+    offsets = array("q", [0])
+    for start, end in zip(starts, calendar.adjust_serials(ends)):
+        year, month, day = _to_ymd(start)
+        is_eom = roll_eom and day == DAYS_IN_MONTHS[LEAP_YEARS[year - MIN_YEAR]][month - 1]
+
+        # Exit if the maturity is closer than a step
+        if end < (_add_months(year, month, day, months) if months else start + days):
+            serials.append(end)
+
+        # Unadjusted dates are rolled backward from the end date and reversed
+        elif stub == Stub.FRONT:
+            serials.extend(reversed(_roll(end, start, -months, -days, is_eom)))
+            serials.append(end)
+
+        # Unadjusted dates are rolled forward from the start date
+        elif stub == Stub.BACK:
+            serials.extend(_roll(start, end, months, days, is_eom))
+            serials.append(end)
+
+        else:
+            serials.append(end)
+
+        offsets.append(len(serials))
+
+    # Adjusting dates keeps them in order, so that the schedules do not need sorting
+    return Schedules(calendar.adjust_serials(serials), offsets)
+
+
+def _roll(origin: int, bound: int, months: int, days: int, is_eom: bool) -> list[int]:
+    """
+    Excel serial numbers obtained by repeatedly moving the origin by a number of months or days,
+    moving each date to the end of its month if is_eom, while strictly between the origin and the bound.
+    """
+    if not months and not is_eom:
+        return list(range(origin + days, bound, days))
+
+    year, month, day = _to_ymd(origin)
+    if months:
+        # Roll the month index up to the month of the bound, the day being capped
+        # to the last day of each month and staying capped afterwards, as with Date
+        bound_year, bound_month, _ = _to_ymd(bound)
+        first = (year - MIN_YEAR) * 12 + month - 1 + months
+        last = (bound_year - MIN_YEAR) * 12 + bound_month - 1
+        indices = range(first, last + 1, months) if months > 0 else range(first, last - 1, months)
+        if is_eom:
+            serials = [MONTH_FIRSTS[i] + MONTH_LENGTHS[i] - 1 for i in indices]
+        elif day <= 28:
+            serials = [MONTH_FIRSTS[i] + day - 1 for i in indices]
+        else:
+            serials = []
+            for i in indices:
+                day = min(day, MONTH_LENGTHS[i])
+                serials.append(MONTH_FIRSTS[i] + day - 1)
+
+    else:
+        serials = []
+        serial = origin
+        while True:
+            year, month, day = _to_ymd(serial + days)
+            serial += days + DAYS_IN_MONTHS[LEAP_YEARS[year - MIN_YEAR]][month - 1] - day
+            if not (serial < bound if days > 0 else serial > bound):
+                break
+            serials.append(serial)
+
+    # Only the last date of the bound month may be beyond the bound
+    if serials and (serials[-1] >= bound if months > 0 or days > 0 else serials[-1] <= bound):
+        serials.pop()
+    return serials
+
+
+class ScheduleCache:
+    """
+    Bounded cache of generated schedules, for books where many trades share
+    the same start date, end date, step, calendar, stub and roll.
+
+    Schedules are returned as tuples so that they can be shared safely.
+    Calendars whose compiled business days were replaced, e.g. by install_calendar,
+    do not share the schedules of the calendars created before.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """
+        :param max_size: maximum number of schedules kept
+        """
+        self._cache: LRUCache[tuple, tuple[Date, ...]] = LRUCache(max_size)
+
+    @property
+    def info(self) -> CacheInfo:
+        return self._cache.info
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def generate(
+        self,
+        start: Date,
+        end: Date,
+        step: Period,
+        calendar: Calendar,
+        stub: Stub,
+        roll: Optional[Roll] = Roll.DOM,
+    ) -> tuple[Date, ...]:
+        """
+        Generate a schedule, or return the schedule cached for the same inputs.
+        See generate_schedule for the parameters.
+        """
+        # Periods compare by length, e.g. 1M is equal to 30D, so the step is keyed on its quantity and unit.
+        # Calendars compare by identifier, so their compiled business days are part of the key as well
+        key = (start, end, step.quantity, step.unit, calendar, calendar.compiled, stub, roll)
+        schedule = self._cache.get(key)
+        if schedule is None:
+            schedule = tuple(generate_schedule(start, end, step, calendar, stub, roll))
+            self._cache.put(key, schedule)
+        return schedule
+
+
+# Schedule cache shared by the whole process
+SCHEDULES = ScheduleCache()
+
+
+class AccrualSchedule:
+    """
+    Accrual periods of a leg stored as parallel arrays: the accrual start dates,
+    accrual end dates and payment dates as DateArray objects, and the year fractions
+    of the accrual periods, so that legs are built, stored and revalued
+    without one Python object per coupon.
+    """
+
+    __slots__ = ("_starts", "_ends", "_payments", "_year_fractions")
+
+    def __init__(
+        self, starts: DateArray, ends: DateArray, payments: DateArray, year_fractions: Sequence[float]
+    ) -> None:
+        """
+        :param starts: accrual start dates
+        :param ends: accrual end dates
+        :param payments: payment dates
+        :param year_fractions: year fractions of the accrual periods
+        """
+        if not len(starts) == len(ends) == len(payments) == len(year_fractions):
+            raise ValueError("There needs to be as many start dates, end dates, payment dates and year fractions")
+
+        self._starts = starts
+        self._ends = ends
+        self._payments = payments
+        self._year_fractions = year_fractions
+
+    @classmethod
+    def generate(
+        cls,
+        start: Date,
+        end: Date,
+        step: Period,
+        calendar: Calendar,
+        stub: Stub,
+        day_count: DayCount,
+        payment_offset: Period,
+        roll: Optional[Roll] = Roll.DOM,
+    ) -> Self:
+        """
+        Generate the accrual periods between two dates in a single pass.
+        Each period ends on a date of the schedule and starts at the end of the previous period.
+
+        :param start: start date
+        :param end: end date
+        :param step: period used to compute the regular steps (e.g. "3M")
+        :param calendar: holidays and adjustment convention
+        :param stub: stub convention
+        :param day_count: day count convention of the accrual periods
+        :param payment_offset: number of business days between the end of each period and its payment
+        :param roll: roll convention (DayOfMonth or EndOfMonth)
+        """
+        ends = DateArray.from_dates(SCHEDULES.generate(start, end, step, calendar, stub, roll)).to_excel()
+        starts = array("i", [start.to_excel()]) + ends[:-1]
+        payments = calendar.add_serials(ends, payment_offset.quantity)
+        starts, ends = DateArray._from_array(starts), DateArray._from_array(ends)
+        return cls(starts, ends, DateArray._from_array(payments), year_fractions(starts, ends, day_count))
+
+    @classmethod
+    def generate_many(
+        cls,
+        starts: DateArray | Iterable[Date],
+        ends: DateArray | Iterable[Date],
+        step: Period,
+        calendar: Calendar,
+        stub: Stub,
+        day_count: DayCount,
+        payment_offset: Period,
+        roll: Optional[Roll] = Roll.DOM,
+    ) -> tuple[Self, array]:
+        """
+        Generate the accrual periods of many legs sharing the same conventions in a single batch,
+        see generate_schedules. The periods of all the legs are stored one leg after the other,
+        the periods of leg i being the ones between offsets[i] included and offsets[i + 1] excluded.
+
+        :param starts: start dates
+        :param ends: end dates, one per start date
+        :param step: period used to compute the regular steps (e.g. "3M")
+        :param calendar: holidays and adjustment convention
+        :param stub: stub convention
+        :param day_count: day count convention of the accrual periods
+        :param payment_offset: number of business days between the end of each period and its payment
+        :param roll: roll convention (DayOfMonth or EndOfMonth)
+        :return: the accrual periods of all the legs and the offsets of each leg
+        """
+        starts = starts if isinstance(starts, DateArray) else DateArray.from_dates(starts)
+        schedules = generate_schedules(starts, ends, step, calendar, stub, roll)
+        ends, offsets = schedules.serials, schedules.offsets
+
+        # Each period starts at the end of the previous period of the same leg, or at the start date of the leg
+        accrual_starts = array("i", ends)
+        accrual_starts[1:] = ends[:-1]
+        for offset, start in zip(offsets, starts.to_excel()):
+            accrual_starts[offset] = start
+
+        payments = calendar.add_serials(ends, payment_offset.quantity)
+        accrual_starts, ends = DateArray._from_array(accrual_starts), DateArray._from_array(ends)
+        accruals = cls(
+            accrual_starts, ends, DateArray._from_array(payments), year_fractions(accrual_starts, ends, day_count)
+        )
+        return accruals, offsets
+
+    def __repr__(self) -> str:
+        return f"AccrualSchedule({len(self)} periods)"
+
+    def __len__(self) -> int:
+        return len(self._year_fractions)
+
+    @property
+    def starts(self) -> DateArray:
+        return self._starts
+
+    @property
+    def ends(self) -> DateArray:
+        return self._ends
+
+    @property
+    def payments(self) -> DateArray:
+        return self._payments
+
+    @property
+    def year_fractions(self) -> Sequence[float]:
+        return self._year_fractions
@@ -0,0 +1,236 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Mapping, Optional, Self, Sequence
+
+from disquant.definitions.business_day import CompiledCalendar, Join, install_calendar
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.fixing import Fixings
+
+# Snapshot file layout, all offsets being counted from the start of the file:
+# - header: magic bytes, format version and size of the table of contents
+# - table of contents: UTF-8 JSON describing each curve, calendar and fixings,
+#   with the offset, type code and length of each of their arrays
+# - data: the raw bytes of the arrays, each aligned on 8 bytes
+# Arrays are written in the byte order of the machine writing the snapshot,
+# so that they can be memory-mapped without conversion on the same architecture
+MAGIC = b"DISQUANT"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 8
+
+
+def write_snapshot(
+    path: str,
+    curves: Optional[Mapping[str, tuple[DiscountCurve, Method]]] = None,
+    calendars: Optional[Mapping[str, CompiledCalendar | tuple[CompiledCalendar, Join]]] = None,
+    fixings: Optional[Sequence[Fixings]] = None,
+) -> None:
+    """
+    Write discount curves, compiled calendars and fixings to a snapshot file.
+
+    :param path: path of the snapshot file
+    :param curves: discount curves and their interpolation method, by name
+    :param calendars: compiled calendars, with the join rule of joint calendars, by calendar identifier
+    :param fixings: fixings of rate indices
+    """
+    with open(path, "wb") as file:
+        file.write(encode_snapshot(curves, calendars, fixings))
+
+
+def encode_snapshot(
+    curves: Optional[Mapping[str, tuple[DiscountCurve, Method]]] = None,
+    calendars: Optional[Mapping[str, CompiledCalendar | tuple[CompiledCalendar, Join]]] = None,
+    fixings: Optional[Sequence[Fixings]] = None,
+) -> bytes:
+    """
+    Encode discount curves, compiled calendars and fixings in the snapshot format,
+    e.g. to copy them into shared memory. See write_snapshot for the parameters.
+    """
+    contents = {"byteorder": sys.byteorder, "curves": {}, "calendars": {}, "fixings": {}}
+    chunks: list[bytes] = []
+    offset = 0
+
+    def add(values: array | bytes | bytearray) -> list:
+        """
+        Append an array to the data and return its location in the data.
+        """
+        nonlocal offset
+        data = values.tobytes() if isinstance(values, array) else bytes(values)
+        typecode = values.typecode if isinstance(values, array) else "B"
+        location = [offset, typecode, len(data)]
+        padding = -len(data) % ALIGNMENT
+        chunks.append(data + bytes(padding))
+        offset += len(data) + padding
+        return location
+
+    for name, (curve, method) in (curves or {}).items():
+        contents["curves"][name] = {
+            "start": curve.start.to_excel(),
+            "method": method.value,
+            "serials": add(DateArray.from_dates(curve.dates).to_excel()),
+            "factors": add(array("d", curve.factors)),
+        }
+
+    for identifier, calendar in (calendars or {}).items():
+        calendar, join = calendar if isinstance(calendar, tuple) else (calendar, Join.HOLIDAYS)
+        is_open, count, business_days = calendar._to_arrays()
+        contents["calendars"][identifier] = {
+            "join": join.value,
+            "open": add(is_open),
+            "count": add(array("i", count)),
+            "business_days": add(array("i", business_days)),
+        }
+
+    for index_fixings in fixings or []:
+        contents["fixings"][index_fixings.index] = {
+            "serials": add(array("i", index_fixings.serials)),
+            "rates": add(array("d", index_fixings.rates)),
+        }
+
+    toc = json.dumps(contents).encode("utf-8")
+    toc += b" " * (-(HEADER.size + len(toc)) % ALIGNMENT)
+
+    return b"".join([HEADER.pack(MAGIC, VERSION, len(toc)), toc, *chunks])
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file written by write_snapshot.
+
+    The file is memory-mapped, so that processes opening the same snapshot share
+    its pages, and arrays are read from the mapped pages without copying.
+    Curves, calendars and fixings are only built when first accessed, then kept.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: path of the snapshot file
+        """
+        with open(path, "rb") as file:
+            self._load(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | bytearray | memoryview) -> Self:
+        """
+        Read a snapshot encoded by encode_snapshot from a buffer, e.g. a shared memory block,
+        arrays being read from the buffer without copying.
+
+        :param buffer: buffer starting with the snapshot, which may be followed by padding
+        """
+        snapshot = object.__new__(cls)
+        snapshot._load(buffer, "Buffer")
+        return snapshot
+
+    def _load(self, buffer: bytes | bytearray | memoryview | mmap.mmap, name: str) -> None:
+        self._buffer = buffer
+
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{name} is not a snapshot file")
+
+        magic, version, toc_size = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{name} is not a snapshot file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}: expecting {VERSION}")
+
+        contents = json.loads(bytes(buffer[HEADER.size : HEADER.size + toc_size]).decode("utf-8"))
+        self._data_offset = HEADER.size + toc_size
+        self._swap = contents["byteorder"] != sys.byteorder
+        self._contents = contents
+        self._curves: dict[str, DiscountCurve] = {}
+        self._calendars: dict[str, CompiledCalendar] = {}
+        self._fixings: dict[str, Fixings] = {}
+
+    @property
+    def curve_names(self) -> list[str]:
+        return list(self._contents["curves"])
+
+    @property
+    def calendar_identifiers(self) -> list[str]:
+        return list(self._contents["calendars"])
+
+    @property
+    def fixing_indices(self) -> list[str]:
+        return list(self._contents["fixings"])
+
+    def _array(self, location: list) -> Sequence:
+        """
+        Array stored at the given location, read from the mapped pages.
+        Arrays written with another byte order are copied and swapped instead.
+        """
+        offset, typecode, size = location
+        start = self._data_offset + offset
+        if self._swap and typecode != "B":
+            values = array(typecode, bytes(self._buffer[start : start + size]))
+            values.byteswap()
+            return values
+        return memoryview(self._buffer)[start : start + size].cast(typecode)
+
+    def curve(self, name: str) -> DiscountCurve:
+        """
+        Discount curve with the given name, built on first access.
+        """
+        curve = self._curves.get(name)
+        if curve is None:
+            contents = self._contents["curves"].get(name)
+            if contents is None:
+                raise ValueError(f"Unknown curve {name}: expecting one of {', '.join(self.curve_names)}")
+
+            serials = self._array(contents["serials"])
+            factors = self._array(contents["factors"])
+            curve = self._curves[name] = DiscountCurve.from_arrays(Date.from_excel(contents["start"]), serials, factors)
+
+        return curve
+
+    def method(self, name: str) -> Method:
+        """
+        Interpolation method of the discount curve with the given name.
+        """
+        return Method(self._contents["curves"][name]["method"])
+
+    def calendar(self, identifier: str) -> CompiledCalendar:
+        """
+        Compiled calendar with the given identifier, built on first access.
+        """
+        calendar = self._calendars.get(identifier)
+        if calendar is None:
+            contents = self._contents["calendars"].get(identifier)
+            if contents is None:
+                raise ValueError(
+                    f"Unknown calendar {identifier}: expecting one of {', '.join(self.calendar_identifiers)}"
+                )
+
+            calendar = self._calendars[identifier] = CompiledCalendar._from_arrays(
+                self._array(contents["open"]), self._array(contents["count"]), self._array(contents["business_days"])
+            )
+
+        return calendar
+
+    def install_calendars(self) -> None:
+        """
+        Use the calendars of the snapshot for Calendar objects created afterwards
+        with the same identifiers, instead of compiling their holidays.
+        """
+        for identifier, contents in self._contents["calendars"].items():
+            install_calendar(identifier, self.calendar(identifier), Join(contents["join"]))
+
+    def fixings(self, index: str) -> Fixings:
+        """
+        Fixings of the rate index, built on first access.
+        """
+        fixings = self._fixings.get(index)
+        if fixings is None:
+            contents = self._contents["fixings"].get(index)
+            if contents is None:
+                raise ValueError(f"Unknown fixings {index}: expecting one of {', '.join(self.fixing_indices)}")
+
+            fixings = self._fixings[index] = Fixings.from_arrays(
+                index, self._array(contents["serials"]), self._array(contents["rates"])
+            )
+
+        return fixings
@@ -1,16 +1,22 @@
+from array import array
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Self
+from operator import mul, truediv
+from typing import Optional, Self, Sequence
 
 from disquant.definitions.business_day import Calendar
-from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.curve import DiscountCurve, Method, ShiftedCurve
 from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
 from disquant.definitions.day_count import DayCount
 from disquant.definitions.frequency import Frequency
 from disquant.definitions.money import Currency, Money
 from disquant.definitions.period import Period
-from disquant.definitions.rate import InterestRate, compound
-from disquant.definitions.schedule import Stub, generate_schedule
+from disquant.definitions.rate import InterestRate, compound_factor
+from disquant.definitions.schedule import AccrualSchedule, Stub
+
+# Size of the parallel shift of the curves used to compute the DV01
+BASIS_POINT = 0.0001
 
 
 class Way(StrEnum):
@@ -26,10 +32,114 @@ class FixedCoupon:
     amount: Money
 
 
+@dataclass(frozen=True)
+class CompiledLeg:
+    """
+    Cashflows of a leg compiled into arrays of payment dates and amounts, the sign
+    of the leg and its currency. As the cashflows do not depend on the discount curve,
+    revaluing the leg against a new curve is a single lookup of the discount factors
+    of all the payment dates followed by a dot product.
+    """
+
+    payments: DateArray
+    amounts: array
+    sign: int
+    currency: Currency
+
+    def compute_npv(self, discount_curve: DiscountCurve, method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR) -> Money:
+        """
+        :param discount_curve: discount curve of the currency of the leg
+        :param method: interpolation method of the discount curve
+        :return: net present value of the leg
+        """
+        discount_factors = discount_curve.spots(self.payments, method)
+        return Money(self.sign * sum(map(mul, self.amounts, discount_factors)), self.currency)
+
+    def compute_sensitivities(
+        self, discount_curve: DiscountCurve, method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+    ) -> list[Money]:
+        """
+        Sensitivities of the NPV to each node discount factor of the discount curve,
+        computed from the analytic Jacobian of the payment discount factors.
+
+        :param discount_curve: discount curve of the currency of the leg
+        :param method: interpolation method of the discount curve
+        :return: one sensitivity per node date of the discount curve
+        """
+        rows, columns, values = discount_curve.jacobian(self.payments, method)
+
+        sensitivities = [0.0] * len(discount_curve.dates)
+        for row, column, value in zip(rows, columns, values):
+            sensitivities[column] += self.amounts[row] * value
+
+        return [Money(self.sign * sensitivity, self.currency) for sensitivity in sensitivities]
+
+
 class FixedLeg:
+    """
+    Fixed leg of a swap, stored as the payment dates and the amounts of its coupons in arrays.
+    A leg built from its accrual schedule also keeps the schedule, the notional and the coupon rate.
+    """
+
     def __init__(self, way: Way, coupons: list[FixedCoupon]) -> None:
+        """
+        :param way: payer or receiver
+        :param coupons: coupons of the leg, all in the same currency
+        """
+        currencies = {coupon.amount.currency for coupon in coupons}
+        if len(currencies) > 1:
+            raise ValueError("The coupons need to be in the same currency")
+
+        self._init_columns(
+            way=way,
+            payments=DateArray.from_dates(coupon.payment for coupon in coupons),
+            amounts=array("d", (coupon.amount.amount for coupon in coupons)),
+            currency=currencies.pop() if currencies else Currency.USD,
+        )
+        self._coupons: Optional[list[FixedCoupon]] = list(coupons)
+        self._accruals: Optional[AccrualSchedule] = None
+        self._notional: Optional[Money] = None
+        self._coupon_rate: Optional[InterestRate] = None
+
+    @classmethod
+    def from_accruals(cls, way: Way, accruals: AccrualSchedule, notional: Money, coupon_rate: InterestRate) -> Self:
+        """
+        Construct a fixed leg from its accrual schedule, without creating coupon objects.
+
+        :param way: payer or receiver
+        :param accruals: accrual periods and payment dates of the coupons
+        :param notional: notional amount
+        :param coupon_rate: fixed coupon rate
+        :return: an instance of FixedLeg
+        """
+        leg = object.__new__(cls)
+        leg._init_columns(
+            way=way,
+            payments=accruals.payments,
+            amounts=array(
+                "d", (notional.amount * (compound_factor(coupon_rate, t) - 1) for t in accruals.year_fractions)
+            ),
+            currency=notional.currency,
+        )
+        leg._coupons = None
+        leg._accruals = accruals
+        leg._notional = notional
+        leg._coupon_rate = coupon_rate
+        return leg
+
+    def _init_columns(self, way: Way, payments: DateArray, amounts: array, currency: Currency) -> None:
+        """
+        Set the way of the leg and the payment dates and amounts of its coupons, in the given currency.
+        """
         self._way = way
-        self._coupons = coupons
+        self._currency = currency
+        self._amounts = amounts
+        self._compiled = CompiledLeg(
+            payments=payments,
+            amounts=amounts,
+            sign=-1 if way == Way.PAYER else 1,
+            currency=currency,
+        )
 
     @classmethod
     def generate(
@@ -47,30 +157,459 @@ class FixedLeg:
         # Get the period equivalent to the payment frequency
         step = payment_frequency.to_period()
 
-        # Generate schedule
-        schedule = generate_schedule(start=start, end=end, step=step, calendar=calendar, stub=Stub.FRONT)
+        # Generate the accrual periods and the payment dates
+        accruals = AccrualSchedule.generate(
+            start=start,
+            end=end,
+            step=step,
+            calendar=calendar,
+            stub=Stub.FRONT,
+            day_count=day_count,
+            payment_offset=payment_offset,
+        )
+
+        return cls.from_accruals(way=way, accruals=accruals, notional=notional, coupon_rate=coupon_rate)
+
+    @property
+    def way(self) -> Way:
+        return self._way
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
+
+    @property
+    def accruals(self) -> Optional[AccrualSchedule]:
+        """
+        Accrual schedule of the leg, None if the leg was built from coupons.
+        """
+        return self._accruals
+
+    @property
+    def notional(self) -> Optional[Money]:
+        """
+        Notional of the leg, None if the leg was built from coupons.
+        """
+        return self._notional
+
+    @property
+    def coupon_rate(self) -> Optional[InterestRate]:
+        """
+        Coupon rate of the leg, None if the leg was built from coupons.
+        """
+        return self._coupon_rate
+
+    @property
+    def payments(self) -> DateArray:
+        return self._compiled.payments
 
-        # Generate coupons
-        coupons = []
-        start_dates = [start] + [date for date in schedule[:-1]]
-        end_dates = [date for date in schedule]
-        for dates in zip(start_dates, end_dates):
-            compound_factor = compound(coupon_rate, dates[0], dates[1], day_count)
-            amount = notional * (compound_factor - 1)
-            payment = calendar.add(dates[1], payment_offset.quantity)
-            coupon = FixedCoupon(start=dates[0], end=dates[1], amount=amount, payment=payment)
-            coupons.append(coupon)
+    @property
+    def amounts(self) -> array:
+        return self._amounts
 
-        return FixedLeg(way=way, coupons=coupons)
+    @property
+    def coupons(self) -> list[FixedCoupon]:
+        """
+        Coupons of the leg as FixedCoupon objects, built on each call if the leg was built from its accrual schedule.
+        """
+        if self._coupons is not None:
+            return list(self._coupons)
+
+        accruals = self._accruals
+        currency = self._currency
+        return [
+            FixedCoupon(start=start, end=end, payment=payment, amount=Money(amount, currency))
+            for start, end, payment, amount in zip(accruals.starts, accruals.ends, accruals.payments, self._amounts)
+        ]
+
+    def compile(self) -> CompiledLeg:
+        """
+        Cashflows of the leg compiled into arrays, to revalue the leg against many curves.
+        """
+        return self._compiled
 
     def compute_npv(self, discount_curve: DiscountCurve) -> Money:
-        npv = Money(0, Currency.USD)
+        return self._compiled.compute_npv(discount_curve)
+
+    def compute_sensitivities(self, discount_curve: DiscountCurve) -> list[Money]:
+        """
+        Sensitivities of the NPV to each node discount factor of the discount curve,
+        computed from the analytic Jacobian of the payment discount factors.
+
+        :param discount_curve: discount curve
+        :return: one sensitivity per node date of the discount curve
+        """
+        return self._compiled.compute_sensitivities(discount_curve)
+
+
+class FloatingLeg:
+    """
+    Floating leg of a swap, paying over each accrual period the forward rate projected
+    from a projection curve plus a spread. The forward rates are simple rates over the
+    accrual periods, so that the leg only depends on the discount factors of the projection
+    curve at the accrual start and end dates, which need to be on or after the curve start date.
+    """
+
+    def __init__(
+        self, way: Way, accruals: AccrualSchedule, notional: Money, spread: float = 0.0, index: Optional[str] = None
+    ) -> None:
+        """
+        :param way: payer or receiver
+        :param accruals: accrual periods and payment dates of the coupons
+        :param notional: notional amount
+        :param spread: spread added to the forward rates
+        :param index: rate index identifier, used to find the projection curve in a market
+        """
+        self._way = way
+        self._accruals = accruals
+        self._notional = notional
+        self._spread = spread
+        self._index = index
+
+    @classmethod
+    def generate(
+        cls,
+        way: Way,
+        start: Date,
+        end: Date,
+        notional: Money,
+        day_count: DayCount,
+        payment_frequency: Frequency,
+        payment_offset: Period,
+        calendar: Calendar,
+        spread: float = 0.0,
+        index: Optional[str] = None,
+    ) -> Self:
+        accruals = AccrualSchedule.generate(
+            start=start,
+            end=end,
+            step=payment_frequency.to_period(),
+            calendar=calendar,
+            stub=Stub.FRONT,
+            day_count=day_count,
+            payment_offset=payment_offset,
+        )
+
+        return cls(way=way, accruals=accruals, notional=notional, spread=spread, index=index)
+
+    @property
+    def way(self) -> Way:
+        return self._way
+
+    @property
+    def accruals(self) -> AccrualSchedule:
+        return self._accruals
+
+    @property
+    def currency(self) -> Currency:
+        return self._notional.currency
+
+    @property
+    def notional(self) -> Money:
+        return self._notional
+
+    @property
+    def spread(self) -> float:
+        return self._spread
+
+    @property
+    def index(self) -> Optional[str]:
+        return self._index
+
+    def compute_forward_rates(
+        self, projection_curve: DiscountCurve, method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+    ) -> array:
+        """
+        Simple forward rates over the accrual periods, projected in a single batch.
+
+        :param projection_curve: projection curve of the rate index
+        :param method: interpolation method of the projection curve
+        :return: one forward rate per accrual period
+        """
+        factors = projection_curve.forwards(self._accruals.starts, self._accruals.ends, method)
+        return array("d", ((1 / factor - 1) / t for factor, t in zip(factors, self._accruals.year_fractions)))
+
+    def compile(
+        self, projection_curve: DiscountCurve, method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+    ) -> CompiledLeg:
+        """
+        Cashflows of the leg projected from a projection curve and compiled into arrays.
+
+        :param projection_curve: projection curve of the rate index
+        :param method: interpolation method of the projection curve
+        """
+        factors = projection_curve.forwards(self._accruals.starts, self._accruals.ends, method)
+        amounts = array(
+            "d",
+            (
+                self._notional.amount * (1 / factor - 1 + self._spread * t)
+                for factor, t in zip(factors, self._accruals.year_fractions)
+            ),
+        )
+        return CompiledLeg(
+            payments=self._accruals.payments,
+            amounts=amounts,
+            sign=-1 if self._way == Way.PAYER else 1,
+            currency=self._notional.currency,
+        )
+
+    def compute_npv(self, discount_curve: DiscountCurve, projection_curve: Optional[DiscountCurve] = None) -> Money:
+        """
+        :param discount_curve: discount curve
+        :param projection_curve: projection curve of the rate index, the discount curve by default
+        :return: net present value of the leg
+        """
+        return self.compile(projection_curve or discount_curve).compute_npv(discount_curve)
+
+
+class InterestRateSwap:
+    """
+    Vanilla interest rate swap exchanging a fixed leg against a floating leg.
+    A payer swap pays the fixed leg and receives the floating leg.
+
+    Par rates are simple rates over the fixed accrual periods, i.e. the fixed rate
+    without compounding for which the NPV of the swap is zero.
+    """
+
+    def __init__(self, fixed_leg: FixedLeg, floating_leg: FloatingLeg) -> None:
+        """
+        :param fixed_leg: fixed leg
+        :param floating_leg: floating leg, in the opposite way and currency of the fixed leg
+        """
+        if fixed_leg.way == floating_leg.way:
+            raise ValueError("The fixed and floating legs need to be in opposite ways")
+        if fixed_leg.currency != floating_leg.currency:
+            raise ValueError("The fixed and floating legs need to be in the same currency")
+
+        self._fixed_leg = fixed_leg
+        self._floating_leg = floating_leg
+
+    @classmethod
+    def generate(
+        cls,
+        way: Way,
+        start: Date,
+        end: Date,
+        notional: Money,
+        fixed_rate: InterestRate,
+        fixed_day_count: DayCount,
+        fixed_frequency: Frequency,
+        floating_day_count: DayCount,
+        floating_frequency: Frequency,
+        payment_offset: Period,
+        calendar: Calendar,
+        spread: float = 0.0,
+        index: Optional[str] = None,
+    ) -> Self:
+        """
+        :param way: payer or receiver of the fixed leg
+        :param start: start date
+        :param end: end date
+        :param notional: notional amount of both legs
+        :param fixed_rate: fixed coupon rate
+        :param fixed_day_count: day count convention of the fixed leg
+        :param fixed_frequency: payment frequency of the fixed leg
+        :param floating_day_count: day count convention of the floating leg
+        :param floating_frequency: payment frequency of the floating leg
+        :param payment_offset: number of business days between the end of each period and its payment
+        :param calendar: holidays and adjustment convention
+        :param spread: spread added to the forward rates of the floating leg
+        :param index: rate index identifier of the floating leg
+        """
+        fixed_leg = FixedLeg.generate(
+            way=way,
+            start=start,
+            end=end,
+            notional=notional,
+            coupon_rate=fixed_rate,
+            day_count=fixed_day_count,
+            payment_frequency=fixed_frequency,
+            payment_offset=payment_offset,
+            calendar=calendar,
+        )
+        floating_leg = FloatingLeg.generate(
+            way=Way.RECEIVER if way == Way.PAYER else Way.PAYER,
+            start=start,
+            end=end,
+            notional=notional,
+            day_count=floating_day_count,
+            payment_frequency=floating_frequency,
+            payment_offset=payment_offset,
+            calendar=calendar,
+            spread=spread,
+            index=index,
+        )
+
+        return cls(fixed_leg=fixed_leg, floating_leg=floating_leg)
+
+    @property
+    def fixed_leg(self) -> FixedLeg:
+        return self._fixed_leg
+
+    @property
+    def floating_leg(self) -> FloatingLeg:
+        return self._floating_leg
+
+    def _fixed_accruals(self) -> AccrualSchedule:
+        """
+        Accrual schedule of the fixed leg, whose year fractions give the annuity.
+        """
+        accruals = self._fixed_leg.accruals
+        if accruals is None:
+            raise ValueError("The fixed leg needs to be built from its accrual schedule, not from coupons")
+        return accruals
+
+    def compute_npv(self, discount_curve: DiscountCurve, projection_curve: Optional[DiscountCurve] = None) -> Money:
+        """
+        :param discount_curve: discount curve
+        :param projection_curve: projection curve of the rate index, the discount curve by default
+        :return: net present value of the swap
+        """
+        return self._fixed_leg.compute_npv(discount_curve) + self._floating_leg.compute_npv(
+            discount_curve, projection_curve
+        )
+
+    def compute_annuity(self, discount_curve: DiscountCurve) -> float:
+        """
+        Year fractions of the fixed accrual periods weighted by the discount factors of their payment dates,
+        i.e. the value of receiving 1 per annum over the fixed accrual periods.
+
+        :param discount_curve: discount curve
+        :return: annuity per unit of notional
+        """
+        accruals = self._fixed_accruals()
+        return _annuities(accruals, [0, len(accruals)], discount_curve, Method.LOG_LINEAR_DISCOUNT_FACTOR)[0]
+
+    def compute_par_rate(
+        self, discount_curve: DiscountCurve, projection_curve: Optional[DiscountCurve] = None
+    ) -> float:
+        """
+        :param discount_curve: discount curve
+        :param projection_curve: projection curve of the rate index, the discount curve by default
+        :return: simple fixed rate for which the NPV of the swap is zero
+        """
+        fixed_accruals = self._fixed_accruals()
+        floating_leg = self._floating_leg
+        return _par_rates(
+            fixed_accruals,
+            [0, len(fixed_accruals)],
+            floating_leg.accruals,
+            [0, len(floating_leg.accruals)],
+            floating_leg.spread,
+            discount_curve,
+            projection_curve or discount_curve,
+            Method.LOG_LINEAR_DISCOUNT_FACTOR,
+        )[0]
+
+    def compute_dv01(self, discount_curve: DiscountCurve, projection_curve: Optional[DiscountCurve] = None) -> Money:
+        """
+        Change of the NPV when the zero rates of the discount and projection curves are shifted by 1bp.
+
+        :param discount_curve: discount curve
+        :param projection_curve: projection curve of the rate index, the discount curve by default
+        :return: DV01 of the swap
+        """
+        shifted_discount_curve = ShiftedCurve.parallel(discount_curve, BASIS_POINT)
+        shifted_projection_curve = projection_curve and ShiftedCurve.parallel(projection_curve, BASIS_POINT)
+        return self.compute_npv(shifted_discount_curve, shifted_projection_curve) - self.compute_npv(
+            discount_curve, projection_curve
+        )
+
+
+def compute_par_rates(
+    starts: Sequence[Date],
+    tenors: Sequence[Period],
+    fixed_day_count: DayCount,
+    fixed_frequency: Frequency,
+    floating_day_count: DayCount,
+    floating_frequency: Frequency,
+    payment_offset: Period,
+    calendar: Calendar,
+    discount_curve: DiscountCurve,
+    projection_curve: Optional[DiscountCurve] = None,
+    spread: float = 0.0,
+    method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR,
+) -> list[array]:
+    """
+    Par rates of a grid of swaps sharing the same conventions, one swap per start date and tenor.
+    The schedules of all the swaps are generated in a single batch, the discount factors and forwards
+    of all their accrual periods are looked up in a single batch, and the par rate of each swap
+    is given by the same formula as InterestRateSwap.compute_par_rate.
+
+    :param starts: start dates of the swaps
+    :param tenors: tenors of the swaps, the end date of a swap being its start date plus its tenor
+    :param fixed_day_count: day count convention of the fixed legs
+    :param fixed_frequency: payment frequency of the fixed legs
+    :param floating_day_count: day count convention of the floating legs
+    :param floating_frequency: payment frequency of the floating legs
+    :param payment_offset: number of business days between the end of each period and its payment
+    :param calendar: holidays and adjustment convention
+    :param discount_curve: discount curve
+    :param projection_curve: projection curve of the rate index, the discount curve by default
+    :param spread: spread added to the forward rates of the floating legs
+    :param method: interpolation method of the curves
+    :return: one array of par rates per start date, with one par rate per tenor
+    """
+    swap_starts = DateArray.from_dates(start for start in starts for _ in tenors)
+    swap_ends = DateArray.from_dates(start + tenor for start in starts for tenor in tenors)
+
+    fixed_accruals, fixed_offsets = AccrualSchedule.generate_many(
+        swap_starts, swap_ends, fixed_frequency.to_period(), calendar, Stub.FRONT, fixed_day_count, payment_offset
+    )
+    floating_accruals, floating_offsets = AccrualSchedule.generate_many(
+        swap_starts, swap_ends, floating_frequency.to_period(), calendar, Stub.FRONT, floating_day_count, payment_offset
+    )
+    par_rates = _par_rates(
+        fixed_accruals,
+        fixed_offsets,
+        floating_accruals,
+        floating_offsets,
+        spread,
+        discount_curve,
+        projection_curve or discount_curve,
+        method,
+    )
+
+    return [par_rates[i : i + len(tenors)] for i in range(0, len(par_rates), len(tenors))]
+
+
+def _segment_sums(values: Sequence[float], offsets: Sequence[int]) -> list[float]:
+    """
+    Sums of the values between consecutive offsets.
+    """
+    return [sum(values[start:end]) for start, end in zip(offsets, offsets[1:])]
+
+
+def _annuities(
+    accruals: AccrualSchedule, offsets: Sequence[int], discount_curve: DiscountCurve, method: Method
+) -> list[float]:
+    """
+    Annuity of each leg of fixed accrual periods, per unit of notional.
+    """
+    discount_factors = discount_curve.spots(accruals.payments, method)
+    return _segment_sums(list(map(mul, accruals.year_fractions, discount_factors)), offsets)
 
-        method = Method.LOG_LINEAR_DISCOUNT_FACTOR
-        for coupon in self._coupons:
-            discount_factor = discount_curve.spot(coupon.payment, method)
-            npv += coupon.amount * discount_factor
 
-        sign = -1 if self._way == Way.PAYER else 1
+def _par_rates(
+    fixed_accruals: AccrualSchedule,
+    fixed_offsets: Sequence[int],
+    floating_accruals: AccrualSchedule,
+    floating_offsets: Sequence[int],
+    spread: float,
+    discount_curve: DiscountCurve,
+    projection_curve: DiscountCurve,
+    method: Method,
+) -> array:
+    """
+    Par rate of each swap, as the value of its floating leg per unit of notional divided by its annuity.
+    """
+    forwards = projection_curve.forwards(floating_accruals.starts, floating_accruals.ends, method)
+    discount_factors = discount_curve.spots(floating_accruals.payments, method)
+    values = [
+        (1 / forward - 1 + spread * t) * discount_factor
+        for forward, t, discount_factor in zip(forwards, floating_accruals.year_fractions, discount_factors)
+    ]
 
-        return sign * npv
+    floating_values = _segment_sums(values, floating_offsets)
+    annuities = _annuities(fixed_accruals, fixed_offsets, discount_curve, method)
+    return array("d", map(truediv, floating_values, annuities))
@@ -0,0 +1,311 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from multiprocessing import shared_memory
+from operator import mul
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional, Self, Sequence
+
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.market import MarketSnapshot
+from disquant.definitions.money import Currency, Money
+from disquant.definitions.snapshot import Snapshot, encode_snapshot
+from disquant.instruments.irs import FixedLeg, FloatingLeg, InterestRateSwap, Way
+
+Trade = FixedLeg | FloatingLeg | InterestRateSwap
+
+
+@dataclass(frozen=True)
+class PortfolioValuation:
+    """
+    NPVs of the trades of a portfolio, in the order of the trades, and their totals by currency.
+    """
+
+    npvs: array
+    currencies: list[Currency]
+    totals: Mapping[Currency, Money] = field(default_factory=lambda: MappingProxyType({}))
+
+    def __len__(self) -> int:
+        return len(self.npvs)
+
+    def npv(self, i: int) -> Money:
+        """
+        NPV of the i-th trade, in its currency.
+        """
+        return Money(self.npvs[i], self.currencies[i])
+
+
+@dataclass
+class _Chunk:
+    """
+    Cashflows of a chunk of trades sharing the same curves, flattened into arrays
+    so that a chunk is sent to a worker as a few buffers rather than as trade objects.
+    The fixed cashflows (resp. floating periods) of the i-th trade of the chunk are the ones
+    between fixed_offsets[i] (resp. floating_offsets[i]) included and the next offset excluded.
+    Amounts and notionals are signed with the way of their legs.
+    """
+
+    discount_curve: str
+    projection_curve: str
+    method: Method
+    positions: array = field(default_factory=lambda: array("q"))
+    fixed_offsets: array = field(default_factory=lambda: array("q", [0]))
+    fixed_payments: array = field(default_factory=lambda: array("i"))
+    fixed_amounts: array = field(default_factory=lambda: array("d"))
+    floating_offsets: array = field(default_factory=lambda: array("q", [0]))
+    floating_starts: array = field(default_factory=lambda: array("i"))
+    floating_ends: array = field(default_factory=lambda: array("i"))
+    floating_payments: array = field(default_factory=lambda: array("i"))
+    floating_fractions: array = field(default_factory=lambda: array("d"))
+    floating_notionals: array = field(default_factory=lambda: array("d"))
+    floating_spreads: array = field(default_factory=lambda: array("d"))
+
+    def add(self, position: int, legs: Sequence[FixedLeg | FloatingLeg]) -> None:
+        self.positions.append(position)
+        for leg in legs:
+            sign = -1 if leg.way == Way.PAYER else 1
+            if isinstance(leg, FixedLeg):
+                self.fixed_payments.extend(leg.payments.to_excel())
+                self.fixed_amounts.extend(sign * amount for amount in leg.amounts)
+            else:
+                accruals = leg.accruals
+                count = len(accruals)
+                self.floating_starts.extend(accruals.starts.to_excel())
+                self.floating_ends.extend(accruals.ends.to_excel())
+                self.floating_payments.extend(accruals.payments.to_excel())
+                self.floating_fractions.extend(accruals.year_fractions)
+                self.floating_notionals.extend([sign * leg.notional.amount] * count)
+                self.floating_spreads.extend([leg.spread] * count)
+
+        self.fixed_offsets.append(len(self.fixed_payments))
+        self.floating_offsets.append(len(self.floating_payments))
+
+
+def _legs(trade: Trade) -> list[FixedLeg | FloatingLeg]:
+    if isinstance(trade, InterestRateSwap):
+        return [trade.fixed_leg, trade.floating_leg]
+    if isinstance(trade, (FixedLeg, FloatingLeg)):
+        return [trade]
+    raise TypeError(f"Cannot price {type(trade).__name__}: expecting a FixedLeg, a FloatingLeg or an InterestRateSwap")
+
+
+def _price_chunk(chunk: _Chunk, curve: Callable[[str], DiscountCurve]) -> array:
+    """
+    NPVs of the trades of a chunk, from one batch of discount factors for all the payment dates
+    and one batch of forwards for all the floating periods, reduced trade by trade.
+    The NPV of each trade is computed as the sum of the NPVs of its legs, as InterestRateSwap.compute_npv.
+    """
+    discount_curve = curve(chunk.discount_curve)
+    projection_curve = curve(chunk.projection_curve)
+    method = chunk.method
+
+    discount_factors = discount_curve.spots(DateArray._from_array(chunk.fixed_payments), method)
+    fixed_values = list(map(mul, chunk.fixed_amounts, discount_factors))
+
+    forwards = projection_curve.forwards(
+        DateArray._from_array(chunk.floating_starts), DateArray._from_array(chunk.floating_ends), method
+    )
+    discount_factors = discount_curve.spots(DateArray._from_array(chunk.floating_payments), method)
+    floating_values = [
+        notional * (1 / forward - 1 + spread * t) * discount_factor
+        for notional, forward, spread, t, discount_factor in zip(
+            chunk.floating_notionals, forwards, chunk.floating_spreads, chunk.floating_fractions, discount_factors
+        )
+    ]
+
+    fixed_offsets = chunk.fixed_offsets
+    floating_offsets = chunk.floating_offsets
+    return array(
+        "d",
+        (
+            sum(fixed_values[fixed_offsets[i] : fixed_offsets[i + 1]])
+            + sum(floating_values[floating_offsets[i] : floating_offsets[i + 1]])
+            for i in range(len(chunk.positions))
+        ),
+    )
+
+
+# Curves of the market shared with the engine, set in each worker process by _init_worker
+_WORKER_MEMORY: Optional[shared_memory.SharedMemory] = None
+_WORKER_SNAPSHOT: Optional[Snapshot] = None
+
+
+def _init_worker(name: str) -> None:
+    global _WORKER_MEMORY, _WORKER_SNAPSHOT
+    # Workers share the resource tracker of the engine process, which only
+    # destroys the shared memory block if the engine is not closed
+    _WORKER_MEMORY = shared_memory.SharedMemory(name=name)
+    _WORKER_SNAPSHOT = Snapshot.from_buffer(_WORKER_MEMORY.buf)
+
+
+def _price_chunk_in_worker(chunk: _Chunk) -> array:
+    return _price_chunk(chunk, _WORKER_SNAPSHOT.curve)
+
+
+class PortfolioEngine:
+    """
+    Prices portfolios of fixed legs, floating legs and swaps against a market snapshot.
+
+    Trades are partitioned by discount and projection curves, i.e. by currency and rate index,
+    and each partition is split into chunks of trades priced in batches. With several workers,
+    the chunks are priced in a pool of processes: the curves of the market are copied once
+    into a shared memory block that every worker reads without copying, so that only
+    the cashflows of each chunk are sent to the workers.
+
+    Floating legs are projected from the projection curve of their rate index,
+    or from the discount curve of their currency if they have no index. Only the curves used
+    by the priced trades are shared, as their nodes: chunks on flat forward or shifted curves,
+    which are not defined by their nodes only, are priced in the current process
+    while the workers price the other chunks.
+
+    The workers and the shared memory block are started by the first portfolio priced
+    with several workers, and are held until the engine is closed.
+    """
+
+    def __init__(
+        self,
+        market: MarketSnapshot,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        method: Method = Method.LOG_LINEAR_DISCOUNT_FACTOR,
+    ) -> None:
+        """
+        :param market: market data used to price the portfolios
+        :param workers: number of worker processes, all the processors by default, 1 to price in the current process
+        :param chunk_size: maximum number of trades per chunk
+        :param method: interpolation method of the curves
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size needs to be positive")
+
+        self._market = market
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._method = method
+
+        # Curves by name, the same names being used in the shared memory block
+        self._curves = {f"discount/{currency}": curve for currency, curve in market.discount_curves.items()}
+        self._curves.update({f"projection/{index}": curve for index, curve in market.projection_curves.items()})
+
+        self._shared: frozenset[str] = frozenset()
+        self._memory: Optional[shared_memory.SharedMemory] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory block. Closing a closed engine has no effect.
+        """
+        self._closed = True
+        self._release()
+
+    def _release(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+        self._shared = frozenset()
+
+    def _share(self, names: set[str]) -> None:
+        """
+        Copy the given curves into a shared memory block and start workers reading it,
+        unless the curves are already shared.
+        """
+        if names <= self._shared:
+            return
+
+        names = names | self._shared
+        self._release()
+        data = encode_snapshot(curves={name: (self._curves[name], self._method) for name in sorted(names)})
+        self._memory = shared_memory.SharedMemory(create=True, size=len(data))
+        self._memory.buf[: len(data)] = data
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers, initializer=_init_worker, initargs=(self._memory.name,)
+        )
+        self._shared = frozenset(names)
+
+    def _is_shareable(self, chunk: _Chunk) -> bool:
+        """
+        Whether the curves of a chunk are defined by their nodes, so that workers can read them from a snapshot.
+        """
+        return all(type(self._curves[name]) is DiscountCurve for name in (chunk.discount_curve, chunk.projection_curve))
+
+    def price(self, trades: Sequence[Trade]) -> PortfolioValuation:
+        """
+        Price a portfolio. The NPVs do not depend on the number of workers nor on the chunk size.
+
+        :param trades: fixed legs, floating legs and swaps
+        :return: the NPV of each trade in its currency, in the order of the trades, and the totals by currency
+        """
+        if self._closed:
+            raise ValueError("The engine is closed")
+
+        chunks = self._partition(trades)
+        remote: list[_Chunk] = []
+        local: list[_Chunk] = []
+        for chunk in chunks:
+            (remote if self._workers > 1 and self._is_shareable(chunk) else local).append(chunk)
+
+        remote_results: Iterable[array] = []
+        if remote:
+            self._share({name for chunk in remote for name in (chunk.discount_curve, chunk.projection_curve)})
+            remote_results = self._executor.map(_price_chunk_in_worker, remote)
+        # The chunks which cannot be shared are priced while the workers price the others
+        local_results = [_price_chunk(chunk, self._curves.__getitem__) for chunk in local]
+
+        npvs = array("d", [0.0]) * len(trades)
+        for chunk, chunk_npvs in chain(zip(local, local_results), zip(remote, remote_results)):
+            for position, npv in zip(chunk.positions, chunk_npvs):
+                npvs[position] = npv
+
+        # Totals are summed in the order of the trades, so that they are reproducible
+        currencies = [_legs(trade)[0].currency for trade in trades]
+        totals: dict[Currency, float] = {}
+        for currency, npv in zip(currencies, npvs):
+            totals[currency] = totals.get(currency, 0.0) + npv
+
+        return PortfolioValuation(
+            npvs=npvs,
+            currencies=currencies,
+            totals=MappingProxyType({currency: Money(total, currency) for currency, total in totals.items()}),
+        )
+
+    def _partition(self, trades: Sequence[Trade]) -> list[_Chunk]:
+        """
+        Group the trades by discount and projection curves, and split each group into chunks.
+        """
+        groups: dict[tuple[str, str], list[_Chunk]] = {}
+        for position, trade in enumerate(trades):
+            legs = _legs(trade)
+            currency = legs[0].currency
+            self._market.discount_curve(currency)
+            discount_curve = f"discount/{currency}"
+
+            projection_curve = discount_curve
+            for leg in legs:
+                if isinstance(leg, FloatingLeg) and leg.index is not None:
+                    self._market.projection_curve(leg.index)
+                    projection_curve = f"projection/{leg.index}"
+
+            chunks = groups.setdefault((discount_curve, projection_curve), [])
+            if not chunks or len(chunks[-1].positions) == self._chunk_size:
+                chunks.append(_Chunk(discount_curve, projection_curve, self._method))
+            chunks[-1].add(position, legs)
+
+        return [chunk for chunks in groups.values() for chunk in chunks]
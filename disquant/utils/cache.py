@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Statistics of a cache.
+    """
+
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded mapping which evicts the least recently used key when it is full,
+    and counts the lookups finding (hits) or not finding (misses) their key.
+    Operations are protected by a lock so that a cache can be shared by threads.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: maximum number of keys kept, 0 to keep none
+        """
+        if max_size < 0:
+            raise ValueError("The cache size needs to be positive or zero")
+
+        self._max_size = max_size
+        self._values: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def info(self) -> CacheInfo:
+        return CacheInfo(hits=self._hits, misses=self._misses, max_size=self._max_size, size=len(self._values))
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Value of the key, or None if the key is not cached.
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._values.move_to_end(key)
+                self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Cache the value of the key, evicting the least recently used key if the cache is full.
+        """
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if len(self._values) > self._max_size:
+                self._values.popitem(last=False)
+
+    def clear(self, reset_counters: bool = True) -> None:
+        """
+        Remove all the cached values and, unless told otherwise, reset the hit and miss counters.
+        """
+        with self._lock:
+            self._values.clear()
+            if reset_counters:
+                self._hits = 0
+                self._misses = 0
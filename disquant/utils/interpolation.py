@@ -15,3 +15,214 @@ def linear_interpolation(x1: float, y1: float, x2: float, y2: float, x: float) -
     w1 = (x2 - x) / (x2 - x1)
     w2 = (x - x1) / (x2 - x1)
     return w1 * y1 + w2 * y2
+
+
+# Coefficients (a, b, c, d) of the cubic a + b * dx + c * dx ** 2 + d * dx ** 3
+# of one interval, dx being the distance to the left end of the interval
+Cubic = tuple[float, float, float, float]
+
+
+def cubic_interpolation(x1: float, x2: float, cubic: Cubic, x: float) -> float:
+    """
+    Evaluate the cubic of the interval [x1, x2].
+
+    :param x1: x-axis coordinate of the left end of the interval
+    :param x2: x-axis coordinate of the right end of the interval
+    :param cubic: coefficients of the cubic
+    :param x: x-axis value to interpolate at
+    :return: y-axis interpolated value
+    """
+    if not x1 <= x <= x2:
+        raise ValueError(f"{x=} needs to be in [{x1}, {x2}]")
+
+    a, b, c, d = cubic
+    dx = x - x1
+    return a + dx * (b + dx * (c + dx * d))
+
+
+def cubic_spline(xs: list[float], ys: list[float], clamped: bool = False) -> list[Cubic]:
+    """
+    Cubic spline going through the points (xs, ys), twice continuously differentiable.
+    A natural spline has zero second derivatives at both ends, a clamped spline has
+    zero first derivatives at both ends.
+
+    :param xs: x-axis coordinates, in increasing order
+    :param ys: y-axis coordinates
+    :param clamped: whether the spline is clamped instead of natural
+    :return: the coefficients of the cubic of each of the len(xs) - 1 intervals
+    """
+    n = len(xs)
+    h = [x2 - x1 for x1, x2 in zip(xs[:-1], xs[1:])]
+    slopes = [(y2 - y1) / step for y1, y2, step in zip(ys[:-1], ys[1:], h)]
+    if n < 2:
+        return []
+
+    # Tridiagonal system giving the second derivatives m at each point:
+    # lower[i] * m[i - 1] + diagonal[i] * m[i] + upper[i] * m[i + 1] = rhs[i]
+    lower = [0.0] * n
+    diagonal = [1.0] * n
+    upper = [0.0] * n
+    rhs = [0.0] * n
+    for i in range(1, n - 1):
+        lower[i] = h[i - 1]
+        diagonal[i] = 2 * (h[i - 1] + h[i])
+        upper[i] = h[i]
+        rhs[i] = 6 * (slopes[i] - slopes[i - 1])
+    if clamped:
+        diagonal[0] = 2 * h[0]
+        upper[0] = h[0]
+        rhs[0] = 6 * slopes[0]
+        lower[-1] = h[-1]
+        diagonal[-1] = 2 * h[-1]
+        rhs[-1] = -6 * slopes[-1]
+
+    # Thomas algorithm
+    for i in range(1, n):
+        w = lower[i] / diagonal[i - 1]
+        diagonal[i] -= w * upper[i - 1]
+        rhs[i] -= w * rhs[i - 1]
+    m = [0.0] * n
+    m[-1] = rhs[-1] / diagonal[-1]
+    for i in range(n - 2, -1, -1):
+        m[i] = (rhs[i] - upper[i] * m[i + 1]) / diagonal[i]
+
+    return [
+        (ys[i], slopes[i] - h[i] * (2 * m[i] + m[i + 1]) / 6, m[i] / 2, (m[i + 1] - m[i]) / (6 * h[i]))
+        for i in range(n - 1)
+    ]
+
+
+def akima(xs: list[float], ys: list[float]) -> list[Cubic]:
+    """
+    Akima interpolation going through the points (xs, ys): a continuously differentiable
+    cubic Hermite interpolation whose derivatives are weighted averages of the neighbouring slopes,
+    which avoids the overshooting of cubic splines.
+    The slopes are extended by linear extrapolation at both ends.
+
+    :param xs: x-axis coordinates, in increasing order
+    :param ys: y-axis coordinates
+    :return: the coefficients of the cubic of each of the len(xs) - 1 intervals
+    """
+    h = [x2 - x1 for x1, x2 in zip(xs[:-1], xs[1:])]
+    slopes = [(y2 - y1) / step for y1, y2, step in zip(ys[:-1], ys[1:], h)]
+    if len(slopes) < 2:
+        return [(y, slope, 0.0, 0.0) for y, slope in zip(ys, slopes)]
+
+    # Two extra slopes at each end
+    first = 2 * slopes[0] - slopes[1]
+    last = 2 * slopes[-1] - slopes[-2]
+    s = [2 * first - slopes[0], first] + slopes + [last, 2 * last - slopes[-1]]
+
+    derivatives = []
+    for i in range(len(xs)):
+        w1 = abs(s[i + 3] - s[i + 2])
+        w2 = abs(s[i + 1] - s[i])
+        if w1 + w2 == 0:
+            derivatives.append((s[i + 1] + s[i + 2]) / 2)
+        else:
+            derivatives.append((w1 * s[i + 1] + w2 * s[i + 2]) / (w1 + w2))
+
+    return [
+        (
+            ys[i],
+            derivatives[i],
+            (3 * slopes[i] - 2 * derivatives[i] - derivatives[i + 1]) / h[i],
+            (derivatives[i] + derivatives[i + 1] - 2 * slopes[i]) / h[i] ** 2,
+        )
+        for i in range(len(slopes))
+    ]
+
+
+# Coefficients of the monotone convex interpolation of one interval:
+# (x1, x2, y1, discrete forward, g0, g1, zone, eta, a), see monotone_convex
+MonotoneConvex = tuple[float, float, float, float, float, float, int, float, float]
+
+
+def monotone_convex(xs: list[float], ys: list[float]) -> list[MonotoneConvex]:
+    """
+    Monotone convex interpolation of Hagan and West, "Interpolation Methods for Curve Construction" (2006).
+    The points (xs, ys) give the integral of the instantaneous forward rates, i.e. minus the logarithm of
+    the discount factors. The forward rates are interpolated between the discrete forward rates of the intervals,
+    so that they are continuous, stay between the neighbouring discrete forward rates and integrate exactly
+    to the points (xs, ys).
+
+    :param xs: x-axis coordinates, in increasing order, starting at 0
+    :param ys: y-axis coordinates, starting at 0
+    :return: the coefficients of each of the len(xs) - 1 intervals
+    """
+    n = len(xs) - 1
+    discrete = [(y2 - y1) / (x2 - x1) for x1, x2, y1, y2 in zip(xs[:-1], xs[1:], ys[:-1], ys[1:])]
+    if n < 1:
+        return []
+
+    # Instantaneous forward rates at each point
+    forwards = [discrete[0]] * (n + 1)
+    for i in range(1, n):
+        w = (xs[i] - xs[i - 1]) / (xs[i + 1] - xs[i - 1])
+        forwards[i] = w * discrete[i] + (1 - w) * discrete[i - 1]
+    if n > 1:
+        forwards[0] = discrete[0] - (forwards[1] - discrete[0]) / 2
+        forwards[n] = discrete[-1] - (forwards[n - 1] - discrete[-1]) / 2
+
+    coefficients = []
+    for i in range(n):
+        g0 = forwards[i] - discrete[i]
+        g1 = forwards[i + 1] - discrete[i]
+        eta = a = 0.0
+        if g0 == 0 and g1 == 0:
+            zone = 0
+        elif (g0 < 0 and -g0 / 2 <= g1 <= -2 * g0) or (g0 > 0 and -g0 / 2 >= g1 >= -2 * g0):
+            zone = 1
+        elif (g0 < 0 and g1 > -2 * g0) or (g0 > 0 and g1 < -2 * g0):
+            zone = 2
+            eta = (g1 + 2 * g0) / (g1 - g0)
+        elif (g0 > 0 and 0 > g1 > -g0 / 2) or (g0 < 0 and 0 < g1 < -g0 / 2):
+            zone = 3
+            eta = 3 * g1 / (g1 - g0)
+        else:
+            zone = 4
+            eta = g1 / (g1 + g0)
+            a = -g0 * g1 / (g0 + g1)
+        coefficients.append((xs[i], xs[i + 1], ys[i], discrete[i], g0, g1, zone, eta, a))
+
+    return coefficients
+
+
+def monotone_convex_interpolation(coefficients: MonotoneConvex, x: float) -> float:
+    """
+    Evaluate the monotone convex interpolation of an interval.
+
+    :param coefficients: coefficients of the interval
+    :param x: x-axis value to interpolate at
+    :return: y-axis interpolated value
+    """
+    x1, x2, y1, discrete, g0, g1, zone, eta, a = coefficients
+    if not x1 <= x <= x2:
+        raise ValueError(f"{x=} needs to be in [{x1}, {x2}]")
+
+    # Integral between 0 and u of the difference g between the instantaneous
+    # and the discrete forward rates, u being the relative position in the interval
+    u = (x - x1) / (x2 - x1)
+    match zone:
+        case 0:
+            integral = 0.0
+        case 1:
+            integral = g0 * (u - 2 * u**2 + u**3) + g1 * (u**3 - u**2)
+        case 2:
+            integral = g0 * u
+            if u > eta:
+                integral += (g1 - g0) * (u - eta) ** 3 / (3 * (1 - eta) ** 2)
+        case 3:
+            integral = g1 * u
+            if u < eta:
+                integral += (g0 - g1) * (eta**3 - (eta - u) ** 3) / (3 * eta**2)
+            else:
+                integral += (g0 - g1) * eta / 3
+        case _:
+            integral = a * u
+            if u <= eta:
+                integral += (g0 - a) * (eta**3 - (eta - u) ** 3) / (3 * eta**2)
+            else:
+                integral += (g0 - a) * eta / 3 + (g1 - a) * (u - eta) ** 3 / (3 * (1 - eta) ** 2)
+
+    return y1 + discrete * (x - x1) + (x2 - x1) * integral
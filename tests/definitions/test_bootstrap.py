@@ -0,0 +1,101 @@
+import math
+
+import pytest
+
+from disquant.definitions.bootstrap import Bootstrapper, DepositQuote, FraQuote, FutureQuote, SwapQuote
+from disquant.definitions.business_day import Adjustment, Calendar
+from disquant.definitions.curve import Method
+from disquant.definitions.date import Date
+from disquant.definitions.day_count import DayCount, year_fraction
+from disquant.definitions.frequency import Frequency
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.rate import InterestRate, discount
+
+START = Date(2023, 10, 16)
+CALENDAR = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+SPOT = CALENDAR.add(START, 2)
+
+
+def build_quotes() -> list:
+    quotes = [DepositQuote(START, CALENDAR.add(START, 1), InterestRate(0.0390), DayCount.ACTUAL_360)]
+    for months, rate in [(1, 0.0385), (3, 0.0395), (6, 0.0405)]:
+        end = CALENDAR.add_period(SPOT, Period(months, Unit.MONTH))
+        quotes.append(DepositQuote(SPOT, end, InterestRate(rate), DayCount.ACTUAL_360))
+
+    for months, rate in [(6, 0.0400), (9, 0.0390)]:
+        start = CALENDAR.add_period(SPOT, Period(months, Unit.MONTH))
+        end = CALENDAR.add_period(SPOT, Period(months + 3, Unit.MONTH))
+        quotes.append(FraQuote(start, end, InterestRate(rate), DayCount.ACTUAL_360))
+
+    for years, rate in [(2, 0.0360), (3, 0.0335), (5, 0.0310), (7, 0.0305), (10, 0.0300), (20, 0.0290)]:
+        end = SPOT + Period(years, Unit.YEAR)
+        quotes.append(SwapQuote(SPOT, end, InterestRate(rate), Frequency.ANNUAL, DayCount.THIRTY_360, CALENDAR))
+
+    return quotes
+
+
+def par_rate(quote: SwapQuote, bootstrapper: Bootstrapper) -> float:
+    curve = bootstrapper.curve
+    method = bootstrapper.method
+    annuity = sum(fraction * curve.spot(date, method) for fraction, date in zip(quote.fractions, quote.schedule))
+    return (curve.spot(quote.start, method) - curve.spot(quote.pillar, method)) / annuity
+
+
+@pytest.mark.parametrize("method", [method for method in Method if method.is_local])
+def test_bootstrap_reprices_quotes(method: Method):
+    quotes = build_quotes()
+    bootstrapper = Bootstrapper(START, quotes, method)
+    curve = bootstrapper.curve
+
+    assert curve.dates == sorted(quote.pillar for quote in quotes)
+
+    for quote in quotes:
+        if isinstance(quote, SwapQuote):
+            assert math.isclose(par_rate(quote, bootstrapper), quote.rate.value, abs_tol=1e-12)
+        else:
+            forward = curve.forward(quote.start, quote.end, method)
+            expected = discount(quote.rate, quote.start, quote.end, quote.day_count)
+            assert math.isclose(forward, expected, abs_tol=1e-14)
+
+
+def test_future_quote():
+    start = Date.imm(2023, 12)
+    end = Date.imm(2024, 3)
+    quotes = [
+        DepositQuote(START, start, InterestRate(0.04), DayCount.ACTUAL_360),
+        FutureQuote(start, end, 96.0, DayCount.ACTUAL_360),
+    ]
+    curve = Bootstrapper(START, quotes).curve
+    forward = curve.forward(start, end, Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+    assert math.isclose(forward, 1 / (1 + 0.04 * year_fraction(start, end, DayCount.ACTUAL_360)))
+
+
+def test_update_solves_the_tail_only():
+    quotes = build_quotes()
+    bootstrapper = Bootstrapper(START, quotes)
+    factors = list(bootstrapper.curve.factors)
+
+    # Re-quote the 5Y swap
+    i = 8
+    quote = quotes[i]
+    new_quote = SwapQuote(quote.start, quote.end, InterestRate(0.0320), quote.frequency, quote.day_count, CALENDAR)
+    bootstrapper.update(new_quote)
+
+    # Pillars before the 5Y swap are unchanged, the following ones match a full rebuild
+    rebuilt = Bootstrapper(START, quotes[:i] + [new_quote] + quotes[i + 1 :])
+    assert bootstrapper.curve.factors[:i] == factors[:i]
+    assert bootstrapper.curve.factors == rebuilt.curve.factors
+
+    # Add a 15Y swap
+    end = SPOT + Period(15, Unit.YEAR)
+    bootstrapper.update(SwapQuote(SPOT, end, InterestRate(0.0295), Frequency.ANNUAL, DayCount.THIRTY_360, CALENDAR))
+    assert len(bootstrapper.curve.dates) == len(quotes) + 1
+    assert bootstrapper.curve.factors[: len(quotes) - 1] == rebuilt.curve.factors[: len(quotes) - 1]
+
+
+def test_duplicated_pillars_raise_value_error():
+    quote = DepositQuote(START, SPOT, InterestRate(0.04), DayCount.ACTUAL_360)
+
+    with pytest.raises(ValueError):
+        Bootstrapper(START, [quote, quote])
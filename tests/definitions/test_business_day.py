@@ -0,0 +1,148 @@
+import datetime as dt
+import subprocess
+import sys
+
+import pytest
+from holidays import country_holidays, financial_holidays
+
+from disquant.definitions import business_day
+from disquant.definitions.business_day import (
+    Adjustment,
+    Calendar,
+    Join,
+    adjust_date,
+    compile_calendar,
+    register_calendar,
+)
+from disquant.definitions.date import Date, DateRange
+from disquant.definitions.period import Period, Unit
+
+
+def test_is_open():
+    calendar = Calendar("TARGET")
+
+    assert calendar.is_open(Date(2023, 12, 22))
+    assert calendar.is_closed(Date(2023, 12, 23))
+    assert calendar.is_closed(Date(2023, 12, 25))
+    assert calendar.is_closed(Date(2024, 1, 1))
+
+    # Check against the holidays definitions over several years
+    holidays = financial_holidays("ECB")
+    for date in DateRange(Date(2020, 1, 1), Date(2025, 1, 1)):
+        assert calendar.is_open(date) == (not date.is_weekend and date.to_date() not in holidays)
+
+
+@pytest.mark.parametrize("adjustment", list(Adjustment))
+def test_adjust(adjustment: Adjustment):
+    """
+    Check the calendar adjustments against the day-by-day reference implementation.
+    """
+    calendar = Calendar("USA", adjustment)
+    holidays = country_holidays("US")
+
+    for date in DateRange(Date(2022, 1, 1), Date(2025, 1, 1)):
+        assert calendar.adjust(date) == adjust_date(date, holidays, adjustment)
+
+
+@pytest.mark.parametrize("adjustment", list(Adjustment))
+def test_adjust_serials(adjustment: Adjustment):
+    calendar = Calendar("USA", adjustment)
+    dates = list(DateRange(Date(2022, 1, 1), Date(2025, 1, 1)))
+
+    adjusted = calendar.adjust_serials(date.to_excel() for date in dates)
+    assert list(adjusted) == [calendar.adjust(date).to_excel() for date in dates]
+
+    # There is no business day before New Year's Day of the first allowed year
+    with pytest.raises(ValueError):
+        Calendar("USA", Adjustment.PREVIOUS).adjust_serials([Date(1901, 1, 1).to_excel()])
+
+
+def test_add():
+    calendar = Calendar("TARGET", Adjustment.FOLLOWING)
+
+    # Friday before Christmas, 25 and 26 December are TARGET holidays
+    assert calendar.add(Date(2023, 12, 22), 1) == Date(2023, 12, 27)
+    assert calendar.add(Date(2023, 12, 27), -1) == Date(2023, 12, 22)
+    assert calendar.add(Date(2023, 12, 23), 1) == Date(2023, 12, 27)
+    assert calendar.add(Date(2023, 12, 23), -1) == Date(2023, 12, 22)
+    assert calendar.add(Date(2023, 12, 23), 0) == Date(2023, 12, 23)
+
+    # Check against stepping one business day at a time
+    date = Date(2023, 1, 2)
+    expected = date
+    for business_days in range(1, 300):
+        expected = calendar.adjust(expected + Period(1, Unit.DAY))
+        assert calendar.add(date, business_days) == expected
+        assert calendar.add(expected, -business_days) == date
+
+
+def test_business_days_between():
+    calendar = Calendar("TARGET")
+    start = Date(2023, 12, 18)
+    end = Date(2024, 1, 8)
+
+    assert calendar.business_days_between(start, end) == 12
+    assert calendar.business_days_between(end, start) == -12
+    assert calendar.business_days_between(start, start) == 0
+    assert calendar.add(start, calendar.business_days_between(start, end)) == end
+
+
+def test_register_calendar(monkeypatch: pytest.MonkeyPatch):
+    # Register in copies of the global registries, restored on teardown, so that other tests are not affected
+    monkeypatch.setattr(business_day, "REGISTRY", dict(business_day.REGISTRY))
+    monkeypatch.setattr(business_day, "COMPILED", dict(business_day.COMPILED))
+
+    register_calendar("TEST", [dt.date(2023, 12, 25), dt.date(2023, 12, 26)])
+    calendar = Calendar("TEST", Adjustment.FOLLOWING)
+
+    assert calendar.adjust(Date(2023, 12, 25)) == Date(2023, 12, 27)
+    assert calendar.is_open(Date(2024, 1, 1))
+
+    # Identifiers cannot be registered twice
+    with pytest.raises(ValueError):
+        register_calendar("TEST", [])
+
+
+def test_unknown_calendar_raises_value_error():
+    with pytest.raises(ValueError):
+        calendar = Calendar("UNKNOWN")
+
+
+def test_holidays_not_loaded_at_import():
+    """
+    Holidays are only loaded when a calendar is first used.
+    """
+    code = "import sys, disquant.instruments.irs; assert 'holidays' not in sys.modules"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_joint_calendar():
+    target = Calendar("TARGET")
+    usa = Calendar("USA")
+    joint_holidays = Calendar("TARGET+USA", join=Join.HOLIDAYS)
+    joint_business_days = Calendar("USA+TARGET", join=Join.BUSINESS_DAYS)
+
+    for date in DateRange(Date(2023, 1, 1), Date(2025, 1, 1)):
+        assert joint_holidays.is_open(date) == (target.is_open(date) and usa.is_open(date))
+        assert joint_business_days.is_open(date) == (target.is_open(date) or usa.is_open(date))
+
+    # July 4th is a holiday in the USA only
+    calendar = Calendar("TARGET+USA", Adjustment.FOLLOWING)
+    assert calendar.adjust(Date(2023, 7, 4)) == Date(2023, 7, 5)
+    assert calendar.add(Date(2023, 7, 3), 1) == Date(2023, 7, 5)
+
+
+def test_calendar_equality():
+    calendar = Calendar("TARGET+USA", Adjustment.FOLLOWING)
+
+    assert calendar == Calendar("USA+TARGET", Adjustment.FOLLOWING)
+    assert hash(calendar) == hash(Calendar("USA+TARGET", Adjustment.FOLLOWING))
+    assert calendar != Calendar("TARGET+USA", Adjustment.MODIFIED_FOLLOWING)
+    assert calendar != Calendar("TARGET+USA", Adjustment.FOLLOWING, Join.BUSINESS_DAYS)
+    assert Calendar("TARGET") == Calendar("TARGET", Adjustment.UNADJUSTED)
+    assert len({calendar, Calendar("USA+TARGET", Adjustment.FOLLOWING), Calendar("TARGET")}) == 2
+
+    # Repeating a calendar in a joint calendar gives that calendar
+    assert Calendar("TARGET+TARGET") == Calendar("TARGET")
+    assert compile_calendar("TARGET+TARGET") is compile_calendar("TARGET")
+    assert Calendar("TARGET+USA+TARGET", Adjustment.FOLLOWING) == calendar
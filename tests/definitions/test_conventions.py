@@ -1,7 +1,9 @@
+import random
+
 import pytest
 
-from disquant.definitions.day_count import DayCount, year_fraction
-from disquant.definitions.date import Date
+from disquant.definitions.day_count import DayCount, year_fraction, year_fractions
+from disquant.definitions.date import MAX_EXCEL, MIN_EXCEL, Date, DateRange
 from tests.definitions.test_conventions_data import ISDA_EXAMPLES
 
 
@@ -104,3 +106,41 @@ def test_year_fraction_deltaquants():
     assert act_act_isda == 335 / 366 + 150 / 365
     assert act_365_fixed == 485 / 365
     assert act_360 == 485 / 360
+
+
+def test_year_fraction_actual_actual_isda_random():
+    """
+    Compare with a day-by-day count of the days falling in leap years
+    on random periods of up to 30 years.
+    """
+    generator = random.Random(42)
+    for _ in range(100):
+        start = Date.from_excel(generator.randint(MIN_EXCEL, MAX_EXCEL - 11_000))
+        end = Date.from_excel(start.to_excel() + generator.randint(0, 11_000))
+
+        leap = sum(1 for date in DateRange(start, end) if date.is_leap)
+        expected = leap / 366 + (end - start - leap) / 365
+
+        assert year_fraction(start, end, DayCount.ACTUAL_ACTUAL_ISDA) == expected
+
+
+@pytest.mark.parametrize("day_count", list(DayCount))
+def test_year_fractions(day_count: DayCount):
+    """
+    The batch computation gives the same results as the scalar one.
+    """
+    generator = random.Random(42)
+    starts = [Date.from_excel(generator.randint(MIN_EXCEL, MAX_EXCEL - 11_000)) for _ in range(1000)]
+    ends = [Date.from_excel(start.to_excel() + generator.randint(0, 11_000)) for start in starts]
+
+    # Include all the month-end cases of the ISDA examples
+    starts += [start for start, _, _, _ in ISDA_EXAMPLES]
+    ends += [end for _, end, _, _ in ISDA_EXAMPLES]
+
+    # And the bounds of the lookup tables
+    starts += [Date.from_excel(MIN_EXCEL), Date.from_excel(MIN_EXCEL)]
+    ends += [Date.from_excel(MAX_EXCEL), Date.from_excel(MIN_EXCEL)]
+
+    expected = [year_fraction(start, end, day_count) for start, end in zip(starts, ends)]
+
+    assert list(year_fractions(starts, ends, day_count)) == expected
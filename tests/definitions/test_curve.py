@@ -1,7 +1,13 @@
 import math
+import sys
+import threading
+from array import array
 
-from disquant.definitions.curve import DiscountCurve, Method
+import pytest
+
+from disquant.definitions.curve import CacheInfo, DiscountCurve, FlatForwardCurve, Method, Shift, ShiftedCurve
 from disquant.definitions.date import Date, DateRange
+from disquant.definitions.date_array import DateArray
 from disquant.definitions.day_count import DayCount, year_fraction
 from disquant.definitions.period import Period, Unit
 from disquant.definitions.rate import Compounding, InterestRate, as_rate, discount
@@ -114,3 +120,325 @@ def test_linear_zero_rate_interpolation():
     rate = as_rate(factor=factor, start=start, end=date, day_count=day_count, compounding=compounding)
 
     assert round(rate, 5) == InterestRate(0.04353, Compounding.ANNUAL)
+
+
+def test_spot_interpolation():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY)]
+    factors = [0.99, 0.97]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+
+    date = start + Period(150, Unit.DAY)
+    zero_rate = (-math.log(0.99) / 100 - math.log(0.97) / 200) / 2
+
+    assert math.isclose(discount_curve.spot(date, Method.LINEAR_DISCOUNT_FACTOR), 0.98)
+    assert math.isclose(discount_curve.spot(date, Method.LOG_LINEAR_DISCOUNT_FACTOR), math.sqrt(0.99 * 0.97))
+    assert math.isclose(discount_curve.spot(date, Method.LINEAR_ZERO_RATE), math.exp(-zero_rate * 150))
+    assert discount_curve.spot(start, Method.LINEAR_ZERO_RATE) == 1.0
+
+
+def test_spot_outside_nodes_raises_value_error():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY)]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=[0.99, 0.97])
+
+    with pytest.raises(ValueError):
+        discount_curve.spot(start + Period(50, Unit.DAY), Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+    with pytest.raises(ValueError):
+        discount_curve.spot(start + Period(201, Unit.DAY), Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+
+def test_flat_forward_matches_nodes():
+    """
+    The flat forward curve gives the same discount factors as a curve
+    with one node per day.
+    """
+    start = Date(2023, 10, 17)
+    end = Date(2025, 10, 17)
+    rate = InterestRate(0.03, Compounding.SEMI_ANNUAL)
+    day_count = DayCount.ACTUAL_365_FIXED
+
+    flat_curve = DiscountCurve.flat_forward(start=start, end=end, rate=rate, day_count=day_count)
+    dates = list(DateRange(start + Period(1, Unit.DAY), end + Period(1, Unit.DAY)))
+    factors = [discount(rate, start, date, day_count) for date in dates]
+    node_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+
+    assert isinstance(flat_curve, FlatForwardCurve)
+    assert flat_curve.end == end
+    assert flat_curve.dates == dates
+    for method in Method:
+        assert all(flat_curve.spot(date, method) == node_curve.spot(date, method) for date in dates)
+
+    with pytest.raises(ValueError):
+        flat_curve.spot(end + Period(1, Unit.DAY), Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+
+def test_spots_and_forwards():
+    """
+    The batch lookups give the same results as the single date lookups.
+    """
+    start = Date(2011, 11, 10)
+    dates = [Date(2011, 11, 14), Date(2012, 5, 14), Date(2012, 11, 14), Date(2013, 5, 14), Date(2013, 11, 14)]
+    factors = [0.9999843, 0.9966889, 0.9942107, 0.9911884, 0.9880738]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+    flat_curve = DiscountCurve.flat_forward(start, dates[-1], InterestRate(0.01), DayCount.ACTUAL_360)
+
+    targets = [start] + list(DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)))
+    for curve in [discount_curve, flat_curve]:
+        for method in Method:
+            assert list(curve.spots(targets, method)) == [curve.spot(date, method) for date in targets]
+            expected = [curve.forward(date, dates[-1], method) for date in targets]
+            assert list(curve.forwards(targets, [dates[-1]] * len(targets), method)) == expected
+
+        with pytest.raises(ValueError):
+            curve.spots([dates[-1] + Period(1, Unit.DAY)], Method.LOG_LINEAR_DISCOUNT_FACTOR)
+
+
+def test_parallel_shift():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY), start + Period(365, Unit.DAY)]
+    factors = [0.99, 0.97, 0.95]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+
+    zero_rate_curve = ShiftedCurve.parallel(discount_curve, 0.0001, Shift.ZERO_RATE)
+    log_factor_curve = ShiftedCurve.parallel(discount_curve, 0.0001, Shift.LOG_DISCOUNT_FACTOR)
+
+    # The base curve is shared, not copied
+    assert isinstance(zero_rate_curve, DiscountCurve)
+    assert zero_rate_curve.dates is discount_curve.dates
+    assert discount_curve.factors == factors
+
+    targets = [start] + list(DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)))
+    for method in Method:
+        for date in targets:
+            factor = discount_curve.spot(date, method)
+            t = (date - start) / 365
+            assert math.isclose(zero_rate_curve.spot(date, method), factor * math.exp(-0.0001 * t))
+            expected = factor * math.exp(-0.0001) if date != start else 1.0
+            assert math.isclose(log_factor_curve.spot(date, method), expected)
+
+        assert list(zero_rate_curve.spots(targets, method)) == [zero_rate_curve.spot(date, method) for date in targets]
+
+    assert zero_rate_curve.factors == [zero_rate_curve.spot(date, Method.LINEAR_ZERO_RATE) for date in dates]
+
+
+def test_key_rate_shifts():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY), start + Period(365, Unit.DAY)]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=[0.99, 0.97, 0.95])
+    method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+
+    # The middle node shift is zero at the neighbouring nodes and half way in between
+    shifted_curve = ShiftedCurve.key_rate(discount_curve, dates[1], 0.01, Shift.LOG_DISCOUNT_FACTOR)
+    assert shifted_curve.spot(dates[0], method) == discount_curve.spot(dates[0], method)
+    assert math.isclose(shifted_curve.spot(dates[1], method), discount_curve.spot(dates[1], method) * math.exp(-0.01))
+    date = start + Period(150, Unit.DAY)
+    assert math.isclose(shifted_curve.spot(date, method), discount_curve.spot(date, method) * math.exp(-0.005))
+
+    # The key rate shifts of all the nodes sum up to the parallel shift
+    shifted_curve = discount_curve
+    for node in dates:
+        shifted_curve = ShiftedCurve.key_rate(shifted_curve, node, 0.01, Shift.LOG_DISCOUNT_FACTOR)
+    parallel_curve = ShiftedCurve.parallel(discount_curve, 0.01, Shift.LOG_DISCOUNT_FACTOR)
+    for date in DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)):
+        assert math.isclose(shifted_curve.spot(date, method), parallel_curve.spot(date, method))
+
+    with pytest.raises(ValueError):
+        ShiftedCurve.key_rate(discount_curve, date + Period(1, Unit.DAY), 0.01)
+
+
+def test_custom_shift():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY)]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=[0.99, 0.97])
+    shifted_curve = ShiftedCurve(discount_curve, dates, [0.01, 0.03], Shift.ZERO_RATE)
+
+    date = start + Period(150, Unit.DAY)
+    factor = discount_curve.spot(date, Method.LINEAR_DISCOUNT_FACTOR)
+    expected = factor * math.exp(-0.02 * 150 / 365)
+    assert math.isclose(shifted_curve.spot(date, Method.LINEAR_DISCOUNT_FACTOR), expected)
+
+    with pytest.raises(ValueError):
+        ShiftedCurve(discount_curve, dates, [0.01], Shift.ZERO_RATE)
+
+
+def test_jacobian_matches_finite_differences():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY), start + Period(365, Unit.DAY)]
+    factors = [0.99, 0.97, 0.95]
+    targets = [start] + list(DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)))
+    splines = [Method.NATURAL_CUBIC_ZERO_RATE, Method.CLAMPED_CUBIC_ZERO_RATE]
+    h = 1e-7
+
+    def build(curve_factors: list[float]) -> list[DiscountCurve]:
+        discount_curve = DiscountCurve(start=start, dates=dates, factors=curve_factors)
+        return [discount_curve, ShiftedCurve.parallel(discount_curve, 0.01)]
+
+    for method in [*(method for method in Method if method.is_local), *splines]:
+        for k, curve in enumerate(build(factors)):
+            rows, columns, values = curve.jacobian(targets, method)
+            jacobian = {(row, column): value for row, column, value in zip(rows, columns, values)}
+            assert len(jacobian) == len(rows) <= (len(dates) if method in splines else 2) * len(targets)
+
+            for column in range(len(dates)):
+                bumped_factors = list(factors)
+                bumped_factors[column] += h
+                bumped_curve = build(bumped_factors)[k]
+                for row, date in enumerate(targets):
+                    derivative = (bumped_curve.spot(date, method) - curve.spot(date, method)) / h
+                    assert math.isclose(jacobian.get((row, column), 0.0), derivative, abs_tol=1e-6)
+
+    for method in [Method.AKIMA_ZERO_RATE, Method.MONOTONE_CONVEX]:
+        with pytest.raises(ValueError):
+            build(factors)[0].jacobian(targets, method)
+
+    flat_curve = DiscountCurve.flat_forward(start, dates[-1], InterestRate(0.01), DayCount.ACTUAL_360)
+    rows, columns, values = flat_curve.jacobian(targets, Method.LOG_LINEAR_DISCOUNT_FACTOR)
+    assert list(rows) == list(range(1, len(targets)))
+    assert [flat_curve.dates[column] for column in columns] == targets[1:]
+    assert list(values) == [1.0] * (len(targets) - 1)
+
+
+def test_cubic_and_monotone_convex_interpolations():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(days, Unit.DAY) for days in [30, 90, 180, 365, 730, 1825]]
+    targets = list(DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)))
+
+    # Zero rates on a line are kept on that line by the natural cubic spline and Akima interpolations
+    zero_rates = [0.03 + 0.00001 * (date - start) for date in dates]
+    factors = [math.exp(-rate * (date - start) / 365) for rate, date in zip(zero_rates, dates)]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+    for method in [Method.NATURAL_CUBIC_ZERO_RATE, Method.AKIMA_ZERO_RATE]:
+        for date in targets:
+            expected = discount_curve.spot(date, Method.LINEAR_ZERO_RATE)
+            assert math.isclose(discount_curve.spot(date, method), expected, rel_tol=1e-12)
+
+    # Flat zero rates are kept flat by all the interpolations except the linear discount factor one
+    factors = [math.exp(-0.03 * (date - start) / 365) for date in dates]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+    for method in (method for method in Method if method != Method.LINEAR_DISCOUNT_FACTOR):
+        spots = discount_curve.spots(targets, method)
+        assert all(
+            math.isclose(spot, math.exp(-0.03 * (date - start) / 365), rel_tol=1e-12)
+            for date, spot in zip(targets, spots)
+        )
+
+    # The monotone convex interpolation is defined from the start date
+    date = start + Period(10, Unit.DAY)
+    assert math.isclose(discount_curve.spot(date, Method.MONOTONE_CONVEX), math.exp(-0.03 * 10 / 365))
+    with pytest.raises(ValueError):
+        discount_curve.spot(date, Method.CLAMPED_CUBIC_ZERO_RATE)
+
+
+def test_spot_cache():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY)]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=[0.99, 0.97], cache_size=2)
+    shifted_curve = ShiftedCurve.parallel(discount_curve, 0.0001, cache_size=2)
+    method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+    date1 = start + Period(150, Unit.DAY)
+    date2 = start + Period(160, Unit.DAY)
+    date3 = start + Period(170, Unit.DAY)
+
+    factor = discount_curve.spot(date1, method)
+    assert discount_curve.spot(date1, method) == factor
+    assert discount_curve.cache_info == CacheInfo(hits=1, misses=1, max_size=2, size=1)
+
+    # The least recently used date is evicted, a recently looked up date survives
+    discount_curve.spot(date2, method)
+    discount_curve.spot(date1, method)
+    discount_curve.spot(date3, method)
+    discount_curve.spot(date1, method)
+    assert discount_curve.cache_info == CacheInfo(hits=3, misses=3, max_size=2, size=2)
+    discount_curve.spot(date2, method)
+    assert discount_curve.cache_info == CacheInfo(hits=3, misses=4, max_size=2, size=2)
+
+    # In-place updates invalidate the cached values of the curve and of its views
+    shifted_factor = shifted_curve.spot(date1, method)
+    discount_curve.update([0.98, 0.96])
+    assert discount_curve.spot(date1, method) == math.sqrt(0.98 * 0.96)
+    assert discount_curve.spot(date1, method) != factor
+    assert shifted_curve.spot(date1, method) == discount_curve.spot(date1, method) * math.exp(-0.0001 * 150 / 365)
+    assert shifted_curve.spot(date1, method) != shifted_factor
+    assert shifted_curve.cache_info == CacheInfo(hits=1, misses=2, max_size=2, size=1)
+
+    discount_curve.clear_cache()
+    assert discount_curve.cache_info == CacheInfo(hits=0, misses=0, max_size=2, size=0)
+
+    # Curves have no cache by default
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=[0.99, 0.97])
+    discount_curve.spot(date1, method)
+    assert discount_curve.cache_info == CacheInfo(hits=0, misses=0, max_size=0, size=0)
+
+    with pytest.raises(ValueError):
+        discount_curve.update([0.99])
+
+
+def test_spot_cache_shared_by_threads():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(days, Unit.DAY) for days in range(30, 400, 30)]
+    discount_curve = DiscountCurve(
+        start=start, dates=dates, factors=[math.exp(-0.03 * (date - start) / 365) for date in dates], cache_size=4
+    )
+    targets = list(DateRange(dates[0], dates[-1]))
+    expected = [discount_curve._spot(date, Method.LOG_LINEAR_DISCOUNT_FACTOR) for date in targets]
+
+    # Threads looking up overlapping dates evict each other's cached values
+    errors = []
+    barrier = threading.Barrier(3)
+
+    def look_up(offset: int) -> None:
+        barrier.wait()
+        try:
+            for _ in range(200):
+                for i in range(offset, len(targets), 3):
+                    assert discount_curve.spot(targets[i], Method.LOG_LINEAR_DISCOUNT_FACTOR) == expected[i]
+        except Exception as error:
+            errors.append(error)
+
+    # Switch between threads as often as possible to make races likely
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=look_up, args=(offset,)) for offset in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert discount_curve.cache_info.size == 4
+
+
+def test_from_arrays():
+    start = Date(2023, 1, 1)
+    dates = [start + Period(100, Unit.DAY), start + Period(200, Unit.DAY), start + Period(365, Unit.DAY)]
+    factors = [0.99, 0.97, 0.95]
+    serials = array("i", (date.to_excel() for date in dates))
+    values = array("d", factors)
+
+    discount_curve = DiscountCurve.from_arrays(start, serials, values)
+    expected_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+
+    # The arrays are not copied
+    assert discount_curve.factors is values
+    assert discount_curve.dates == dates
+    assert discount_curve.end == dates[-1]
+
+    targets = [start] + list(DateRange(dates[0], dates[-1] + Period(1, Unit.DAY)))
+    for method in Method:
+        assert discount_curve.spots(targets, method) == expected_curve.spots(targets, method)
+
+    assert DiscountCurve.from_arrays(start, DateArray(serials), factors).spot(dates[1], Method.LINEAR_ZERO_RATE) == 0.97
+
+    # Duplicated, unsorted, before the start date, fewer than factors
+    s = start.to_excel()
+    for wrong_serials in [[s + 1, s + 2, s + 2], [s + 2, s + 1, s + 3], [s, s + 1, s + 2], [s + 1, s + 2]]:
+        with pytest.raises(ValueError):
+            DiscountCurve.from_arrays(start, array("i", wrong_serials), values)
+
+    with pytest.raises(ValueError):
+        DiscountCurve.from_arrays(start, serials, array("d", [0.99, 0.0, 0.95]))
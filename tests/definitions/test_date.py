@@ -135,6 +135,9 @@ def test_excel():
     assert Date.from_excel(48000) == Date(2031, 6, 1)
     assert Date.from_excel(30000).to_excel() == 30000
 
+    with pytest.raises(TypeError):
+        Date.from_excel(45000.5)
+
 
 def test_str():
     date_1 = Date(2023, 9, 18)
@@ -192,3 +195,50 @@ def test_is_eom():
 def test_get_eom():
     assert Date(2024, 1, 1).get_eom() == Date(2024, 1, 31)
     assert Date(2023, 12, 31).get_eom() == Date(2023, 12, 31)
+
+
+def test_add_months_end_of_month():
+    """
+    Adding months or years to a Date caps the day to the last day of the resulting month.
+    """
+    assert Date(2023, 1, 31) + Period(1, Unit.MONTH) == Date(2023, 2, 28)
+    assert Date(2024, 1, 31) + Period(1, Unit.MONTH) == Date(2024, 2, 29)
+    assert Date(2024, 3, 31) - Period(1, Unit.MONTH) == Date(2024, 2, 29)
+    assert Date(2024, 2, 29) + Period(1, Unit.YEAR) == Date(2025, 2, 28)
+    assert Date(2023, 11, 30) + Period(3, Unit.MONTH) == Date(2024, 2, 29)
+
+
+def test_add_out_of_range_raises_value_error():
+    with pytest.raises(ValueError):
+        date = Date(2199, 12, 31) + Period(1, Unit.DAY)
+
+    with pytest.raises(ValueError):
+        date = Date(1901, 6, 30) - Period(1, Unit.YEAR)
+
+
+def test_hash():
+    """
+    Equal dates have the same hash so they can be used as dictionary keys.
+    """
+    fixings = {Date(2023, 9, 18): 0.04}
+
+    assert Date(2023, 9, 18) in fixings
+    assert Date(2023, 9, 11) + Period(1, Unit.WEEK) in fixings
+
+
+def test_weekday_index():
+    assert Date(2023, 9, 18).weekday_index == 0
+    assert Date(2023, 9, 24).weekday_index == 6
+
+    # Check against datetime.date over several years
+    for date in DateRange(Date(1901, 1, 1), Date(1905, 1, 1)):
+        assert date.weekday_index == date.to_date().weekday()
+
+
+def test_imm_and_third_friday_over_a_year():
+    for month in range(1, 13):
+        imm = Date.imm(2024, month)
+        third_friday = Date.third_friday(2024, month)
+
+        assert imm.weekday == "WED" and 15 <= imm.day <= 21
+        assert third_friday.weekday == "FRI" and 15 <= third_friday.day <= 21
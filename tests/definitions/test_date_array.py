@@ -0,0 +1,87 @@
+import datetime as dt
+from array import array
+
+import pytest
+
+from disquant.definitions.date import Date, DateRange
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.period import Period, Unit
+
+
+def test_init():
+    dates = DateArray([367, 48000])
+
+    assert len(dates) == 2
+    assert dates[0] == Date(1901, 1, 1)
+    assert dates[1] == Date(2031, 6, 1)
+    assert dates.to_excel().itemsize == 4
+
+
+def test_invalid_serial_raises_value_error():
+    with pytest.raises(ValueError):
+        dates = DateArray([366])
+
+
+def test_constructors():
+    expected = [Date(2023, 9, 18), Date(2024, 2, 29)]
+
+    assert DateArray.from_strings(["2023-09-18", "2024-02-29"]).to_list() == expected
+    assert DateArray.from_dates([dt.date(2023, 9, 18), dt.date(2024, 2, 29)]).to_list() == expected
+    assert DateArray.from_dates(expected).to_list() == expected
+    assert DateArray.from_excel([date.to_excel() for date in expected]).to_list() == expected
+
+
+def test_add_period():
+    dates = [Date(2023, 1, 31), Date(2023, 11, 30), Date(2024, 2, 29)]
+    array_dates = DateArray.from_dates(dates)
+
+    for period in [Period(1, Unit.DAY), Period(2, Unit.WEEK), Period(1, Unit.MONTH), Period(1, Unit.YEAR)]:
+        assert (array_dates + period).to_list() == [date + period for date in dates]
+        assert (array_dates - period).to_list() == [date - period for date in dates]
+
+
+def test_subtract_dates():
+    dates_1 = DateArray.from_dates([Date(2023, 9, 18), Date(2023, 10, 18)])
+    dates_2 = DateArray.from_dates([Date(2023, 9, 18), Date(2023, 9, 18)])
+
+    assert dates_1 - dates_2 == array("i", [0, 30])
+    assert dates_1 - Date(2023, 9, 18) == array("i", [0, 30])
+
+
+def test_weekday_and_weekend():
+    dates = list(DateRange(Date(2023, 9, 18), Date(2023, 10, 18)))
+    array_dates = DateArray.from_dates(dates)
+
+    assert array_dates.weekday == [date.weekday for date in dates]
+    assert array_dates.is_weekend == [date.is_weekend for date in dates]
+
+
+def test_eom():
+    dates = list(DateRange(Date(2023, 12, 1), Date(2025, 1, 1)))
+    array_dates = DateArray.from_dates(dates)
+
+    assert array_dates.is_eom == [date.is_eom for date in dates]
+    assert array_dates.get_eom().to_list() == [date.get_eom() for date in dates]
+
+
+def test_compare():
+    dates_1 = DateArray.from_dates([Date(2023, 9, 18), Date(2023, 10, 18)])
+    dates_2 = DateArray.from_dates([Date(2023, 9, 19), Date(2023, 10, 18)])
+
+    assert (dates_1 < dates_2) == [True, False]
+    assert (dates_1 == dates_2) == [False, True]
+    assert (dates_1 >= Date(2023, 10, 1)) == [False, True]
+
+    # Other objects are not equal to a DateArray and cannot be ordered with it
+    assert dates_1 != None
+    assert dates_1 not in [None, 1, "2023-09-18"]
+    with pytest.raises(TypeError):
+        dates_1 < 1
+
+
+def test_sort():
+    dates = [Date(2024, 1, 1), Date(2023, 1, 1), Date(2023, 6, 1)]
+    array_dates = DateArray.from_dates(dates)
+
+    assert array_dates.sort().to_list() == sorted(dates)
+    assert array_dates.argsort() == [1, 2, 0]
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from disquant.definitions.curve import DiscountCurve
+from disquant.definitions.date import Date
+from disquant.definitions.fixing import Fixings
+from disquant.definitions.market import Market, MarketSnapshot
+from disquant.definitions.money import Currency, Money
+from disquant.definitions.period import Period, Unit
+
+START = Date(2023, 10, 16)
+
+
+def build_curve(factor: float) -> DiscountCurve:
+    return DiscountCurve(start=START, dates=[START + Period(1, Unit.YEAR)], factors=[factor])
+
+
+def test_snapshots_copy_their_mappings():
+    curves = {Currency.EUR: build_curve(0.97)}
+    snapshot = MarketSnapshot(discount_curves=curves)
+
+    # Changing the mapping a snapshot was built from does not change the snapshot
+    curves[Currency.USD] = build_curve(0.95)
+    with pytest.raises(ValueError):
+        snapshot.discount_curve(Currency.USD)
+    with pytest.raises(TypeError):
+        snapshot.discount_curves[Currency.USD] = build_curve(0.95)
+
+
+def test_snapshots_are_not_affected_by_updates():
+    market = Market()
+    eur_curve = build_curve(0.97)
+    market.set_discount_curve(Currency.EUR, eur_curve)
+    market.set_fx_spot(Currency.EUR, Currency.USD, 1.05)
+    snapshot = market.snapshot()
+
+    # Swap in a new curve
+    new_eur_curve = build_curve(0.96)
+    usd_curve = build_curve(0.95)
+    new_snapshot = market.update(discount_curves={Currency.EUR: new_eur_curve, Currency.USD: usd_curve})
+
+    assert snapshot.version == 2
+    assert snapshot.discount_curve(Currency.EUR) is eur_curve
+    with pytest.raises(ValueError):
+        snapshot.discount_curve(Currency.USD)
+
+    assert new_snapshot is market.snapshot()
+    assert new_snapshot.version == 3
+    assert new_snapshot.discount_curve(Currency.EUR) is new_eur_curve
+    assert new_snapshot.discount_curve(Currency.USD) is usd_curve
+
+    # Unchanged market data is carried over to the new snapshot
+    assert new_snapshot.fx_spots == snapshot.fx_spots
+
+    # Snapshots cannot be modified
+    with pytest.raises(TypeError):
+        new_snapshot.discount_curves[Currency.EUR] = eur_curve
+
+
+def test_fx_spots_and_fixings():
+    market = Market()
+    market.set_fx_spot(Currency.EUR, Currency.USD, 1.25)
+    market.set_fixings(Fixings("ESTR", [START], [0.039]))
+    snapshot = market.snapshot()
+
+    assert snapshot.fx_spot(Currency.EUR, Currency.USD) == 1.25
+    assert snapshot.fx_spot(Currency.USD, Currency.EUR) == 0.8
+    assert snapshot.fx_spot(Currency.USD, Currency.USD) == 1.0
+    assert snapshot.convert(Money(100, Currency.EUR), Currency.USD) == Money(125, Currency.USD)
+    assert snapshot.index_fixings("ESTR").rate(START) == 0.039
+
+    with pytest.raises(ValueError):
+        snapshot.projection_curve("ESTR")
+
+
+def test_concurrent_updates_are_not_lost():
+    market = Market()
+
+    def write(i: int) -> None:
+        for j in range(100):
+            market.set_projection_curve(f"INDEX{i}-{j}", build_curve(0.97))
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(market.snapshot().projection_curves) == 400
+    assert market.snapshot().version == 400
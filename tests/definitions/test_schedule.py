@@ -1,7 +1,20 @@
-from disquant.definitions.business_day import Adjustment, Calendar
+import pytest
+
+from disquant.definitions import business_day
+from disquant.definitions.business_day import Adjustment, Calendar, CompiledCalendar, install_calendar
 from disquant.definitions.date import Date
+from disquant.definitions.date_array import DateArray
+from disquant.definitions.day_count import DayCount, year_fraction
 from disquant.definitions.period import Period, Unit
-from disquant.definitions.schedule import Roll, Stub, generate_schedule
+from disquant.definitions.schedule import (
+    AccrualSchedule,
+    Roll,
+    ScheduleCache,
+    Schedules,
+    Stub,
+    generate_schedule,
+    generate_schedules,
+)
 
 
 def test_generate_schedule():
@@ -158,3 +171,142 @@ def test_generate_schedule_tenor_3m():
         Date(2025, 7, 28),
         Date(2025, 10, 27),
     ]
+
+
+def test_schedule_cache_after_install_calendar(monkeypatch: pytest.MonkeyPatch):
+    # Install in a copy of the global compiled calendars, restored on teardown, so that other tests are not affected
+    monkeypatch.setattr(business_day, "COMPILED", dict(business_day.COMPILED))
+
+    cache = ScheduleCache()
+    start = Date(2023, 10, 16)
+    end = Date(2024, 10, 16)
+    step = Period(1, Unit.MONTH)
+
+    install_calendar("SCHEDULE_CACHE", CompiledCalendar.from_holidays([]))
+    schedule = cache.generate(start, end, step, Calendar("SCHEDULE_CACHE", Adjustment.FOLLOWING), Stub.FRONT)
+
+    # Calendars created after their business days are replaced do not get the previous schedules
+    install_calendar("SCHEDULE_CACHE", CompiledCalendar.from_holidays([schedule[0].to_date()]))
+    other = cache.generate(start, end, step, Calendar("SCHEDULE_CACHE", Adjustment.FOLLOWING), Stub.FRONT)
+    assert other[0] == schedule[0] + Period(1, Unit.DAY)
+    assert other[1:] == schedule[1:]
+
+
+def test_schedule_cache():
+    cache = ScheduleCache(max_size=2)
+    start = Date(2023, 10, 16)
+    end = Date(2025, 10, 16)
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+
+    schedule = cache.generate(start, end, Period(1, Unit.MONTH), calendar, Stub.FRONT)
+    assert schedule == tuple(generate_schedule(start, end, Period(1, Unit.MONTH), calendar, Stub.FRONT))
+
+    # Equal calendars share the cached schedule
+    same_calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    assert cache.generate(start, end, Period(1, Unit.MONTH), same_calendar, Stub.FRONT) is schedule
+    assert cache.info.hits == 1
+    assert cache.info.misses == 1
+
+    # A 30 days step is a different schedule, even though Period(1, Unit.MONTH) == Period(30, Unit.DAY)
+    other = cache.generate(start, end, Period(30, Unit.DAY), calendar, Stub.FRONT)
+    assert other != schedule
+
+    # The least recently used schedule is evicted
+    cache.generate(start, end, Period(3, Unit.MONTH), calendar, Stub.FRONT)
+    assert cache.info.size == 2
+    assert cache.generate(start, end, Period(1, Unit.MONTH), calendar, Stub.FRONT) == schedule
+    assert cache.info.misses == 4
+
+    # Cached schedules cannot be modified
+    with pytest.raises(TypeError):
+        schedule[0] = start
+
+
+@pytest.mark.parametrize("stub", list(Stub))
+@pytest.mark.parametrize("roll", list(Roll))
+@pytest.mark.parametrize(
+    "step", [Period(1, Unit.MONTH), Period(3, Unit.MONTH), Period(1, Unit.YEAR), Period(2, Unit.WEEK)], ids=str
+)
+def test_generate_schedules(stub: Stub, roll: Roll, step: Period):
+    """
+    Check the batch schedules against the schedules generated one by one,
+    including ends of months, days capped in short months and maturities closer than a step.
+    """
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    starts = [Date(2023, 1, 31), Date(2023, 1, 30), Date(2023, 2, 28), Date(2023, 10, 16), Date(2024, 2, 29)]
+    ends = [Date(2025, 1, 31), Date(2024, 7, 30), Date(2033, 2, 28), Date(2023, 10, 20), Date(2029, 3, 14)]
+
+    schedules = generate_schedules(starts, ends, step, calendar, stub, roll)
+
+    assert len(schedules) == len(starts)
+    assert schedules.to_lists() == [
+        generate_schedule(start, end, step, calendar, stub, roll) for start, end in zip(starts, ends)
+    ]
+
+
+def test_schedules_layout():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    starts = DateArray.from_dates([Date(2023, 10, 16), Date(2023, 10, 16)])
+    ends = DateArray.from_dates([Date(2024, 10, 16), Date(2024, 4, 16)])
+
+    schedules = generate_schedules(starts, ends, Period(6, Unit.MONTH), calendar, Stub.FRONT)
+
+    assert list(schedules.offsets) == [0, 2, 3]
+    assert list(schedules.serials) == [
+        Date(2024, 4, 16).to_excel(),
+        Date(2024, 10, 16).to_excel(),
+        Date(2024, 4, 16).to_excel(),
+    ]
+    assert list(schedules[-1]) == [Date(2024, 4, 16)]
+
+    with pytest.raises(IndexError):
+        schedules[2]
+
+    with pytest.raises(ValueError):
+        generate_schedules(starts, ends[:1], Period(6, Unit.MONTH), calendar, Stub.FRONT)
+
+    with pytest.raises(ValueError):
+        Schedules(schedules.serials, schedules.offsets[:-1])
+
+
+def test_accrual_schedule():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    start = Date(2023, 10, 16)
+    end = Date(2026, 10, 16)
+    accruals = AccrualSchedule.generate(
+        start, end, Period(6, Unit.MONTH), calendar, Stub.FRONT, DayCount.THIRTY_360, Period(2, Unit.DAY)
+    )
+    schedule = generate_schedule(start, end, Period(6, Unit.MONTH), calendar, Stub.FRONT)
+
+    assert len(accruals) == len(schedule)
+    assert list(accruals.starts) == [start] + schedule[:-1]
+    assert list(accruals.ends) == schedule
+    assert list(accruals.payments) == [calendar.add(date, 2) for date in schedule]
+    assert list(accruals.year_fractions) == [
+        year_fraction(start, end, DayCount.THIRTY_360) for start, end in zip(accruals.starts, accruals.ends)
+    ]
+
+    with pytest.raises(ValueError):
+        AccrualSchedule(accruals.starts, accruals.ends[:-1], accruals.payments, accruals.year_fractions)
+
+
+def test_accrual_schedule_generate_many():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    starts = [Date(2023, 10, 16), Date(2024, 1, 31), Date(2024, 3, 15)]
+    ends = [Date(2026, 10, 16), Date(2025, 1, 31), Date(2024, 4, 15)]
+    step = Period(3, Unit.MONTH)
+
+    accruals, offsets = AccrualSchedule.generate_many(
+        starts, ends, step, calendar, Stub.FRONT, DayCount.ACTUAL_360, Period(2, Unit.DAY)
+    )
+
+    assert len(offsets) == len(starts) + 1
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        expected = AccrualSchedule.generate(
+            start, end, step, calendar, Stub.FRONT, DayCount.ACTUAL_360, Period(2, Unit.DAY)
+        )
+        periods = slice(offsets[i], offsets[i + 1])
+        assert list(accruals.starts[periods]) == list(expected.starts)
+        assert list(accruals.ends[periods]) == list(expected.ends)
+        assert list(accruals.payments[periods]) == list(expected.payments)
+        assert list(accruals.year_fractions[periods]) == list(expected.year_fractions)
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from disquant.definitions.business_day import Adjustment, Calendar, Join, compile_calendar
+from disquant.definitions.curve import DiscountCurve, Method
+from disquant.definitions.date import Date, DateRange
+from disquant.definitions.fixing import Fixings
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.snapshot import Snapshot, encode_snapshot, write_snapshot
+
+
+def test_snapshot(tmp_path):
+    start = Date(2023, 10, 16)
+    dates = [start + Period(months, Unit.MONTH) for months in range(3, 63, 3)]
+    factors = [math.exp(-0.03 * (date - start) / 365) for date in dates]
+    curve = DiscountCurve(start=start, dates=dates, factors=factors)
+    fixings = Fixings("ESTR", [start - Period(2, Unit.DAY), start - Period(1, Unit.DAY)], [0.039, 0.0391])
+
+    path = str(tmp_path / "market.snapshot")
+    write_snapshot(
+        path,
+        curves={"EUR": (curve, Method.MONOTONE_CONVEX)},
+        calendars={"TARGET": compile_calendar("TARGET"), "TARGET+USA": (compile_calendar("TARGET+USA"), Join.HOLIDAYS)},
+        fixings=[fixings],
+    )
+    snapshot = Snapshot(path)
+
+    # Curves are rebuilt on first access only
+    assert snapshot.curve_names == ["EUR"]
+    loaded_curve = snapshot.curve("EUR")
+    assert snapshot.curve("EUR") is loaded_curve
+    assert snapshot.method("EUR") == Method.MONOTONE_CONVEX
+    assert loaded_curve.start == start
+    assert loaded_curve.dates == dates
+    assert list(loaded_curve.factors) == factors
+    targets = list(DateRange(start, dates[-1]))
+    assert loaded_curve.spots(targets, Method.MONOTONE_CONVEX) == curve.spots(targets, Method.MONOTONE_CONVEX)
+
+    # Calendars give the same business days
+    calendar = snapshot.calendar("TARGET+USA")
+    compiled = compile_calendar("TARGET+USA")
+    for date in DateRange(start, start + Period(1, Unit.YEAR)):
+        serial = date.to_excel()
+        assert calendar.is_open(serial) == compiled.is_open(serial)
+        assert calendar.add(serial, 10) == compiled.add(serial, 10)
+
+    snapshot.install_calendars()
+    assert compile_calendar("USA+TARGET") is calendar
+    assert Calendar("TARGET", Adjustment.FOLLOWING).add(start, 5) == Calendar("TARGET").add(start, 5)
+
+    # Fixings
+    assert snapshot.fixing_indices == ["ESTR"]
+    assert snapshot.fixings("ESTR").rate(start - Period(1, Unit.DAY)) == 0.0391
+    with pytest.raises(ValueError):
+        snapshot.fixings("ESTR").rate(start)
+
+    with pytest.raises(ValueError):
+        snapshot.curve("USD")
+
+
+def test_invalid_snapshot(tmp_path):
+    path = tmp_path / "invalid.snapshot"
+    path.write_bytes(b"not a snapshot file")
+
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_snapshot_from_buffer():
+    start = Date(2023, 10, 16)
+    dates = [start + Period(months, Unit.MONTH) for months in range(3, 63, 3)]
+    curve = DiscountCurve(start=start, dates=dates, factors=[math.exp(-0.03 * (date - start) / 365) for date in dates])
+
+    # The buffer may be longer than the snapshot, e.g. a shared memory block rounded up to a page
+    buffer = bytearray(encode_snapshot(curves={"EUR": (curve, Method.LOG_LINEAR_DISCOUNT_FACTOR)})) + bytes(100)
+    snapshot = Snapshot.from_buffer(memoryview(buffer))
+
+    loaded_curve = snapshot.curve("EUR")
+    assert loaded_curve.dates == dates
+    assert list(loaded_curve.factors) == list(curve.factors)
+
+    with pytest.raises(ValueError):
+        Snapshot.from_buffer(bytes(100))
@@ -1,14 +1,16 @@
 import math
 
+import pytest
+
 from disquant.definitions.business_day import Adjustment, Calendar
-from disquant.definitions.curve import DiscountCurve
+from disquant.definitions.curve import DiscountCurve, Method, ShiftedCurve
 from disquant.definitions.date import Date
 from disquant.definitions.day_count import DayCount
 from disquant.definitions.frequency import Frequency
 from disquant.definitions.money import Currency, Money
 from disquant.definitions.period import Period, Unit
-from disquant.definitions.rate import Compounding, InterestRate
-from disquant.instruments.irs import FixedLeg, Way
+from disquant.definitions.rate import Compounding, InterestRate, compound
+from disquant.instruments.irs import FixedCoupon, FixedLeg, FloatingLeg, InterestRateSwap, Way, compute_par_rates
 
 
 def test_compute_fixed_leg_npv():
@@ -44,3 +46,220 @@ def test_compute_fixed_leg_npv():
     npv = fixed_leg.compute_npv(discount_curve)
 
     assert math.isclose(npv, -2407495.2348627294)
+
+
+def test_fixed_leg_coupons():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    notional = Money(10_000_000, Currency.EUR)
+    coupon_rate = InterestRate(0.03, Compounding.ANNUAL)
+    fixed_leg = FixedLeg.generate(
+        way=Way.RECEIVER,
+        start=Date(2023, 10, 16),
+        end=Date(2028, 10, 16),
+        notional=notional,
+        coupon_rate=coupon_rate,
+        day_count=DayCount.THIRTY_360,
+        payment_frequency=Frequency.ANNUAL,
+        payment_offset=Period(2, Unit.DAY),
+        calendar=calendar,
+    )
+
+    coupons = fixed_leg.coupons
+    assert len(coupons) == len(fixed_leg.accruals) == 5
+    for coupon in coupons:
+        assert coupon.payment == calendar.add(coupon.end, 2)
+        assert coupon.amount == notional * (compound(coupon_rate, coupon.start, coupon.end, DayCount.THIRTY_360) - 1)
+
+
+def test_fixed_leg_from_coupons():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    start = Date(2023, 10, 16)
+    generated_leg = FixedLeg.generate(
+        way=Way.PAYER,
+        start=start,
+        end=start + Period(5, Unit.YEAR),
+        notional=Money(10_000_000, Currency.EUR),
+        coupon_rate=InterestRate(0.03, Compounding.ANNUAL),
+        day_count=DayCount.THIRTY_360,
+        payment_frequency=Frequency.ANNUAL,
+        payment_offset=Period(2, Unit.DAY),
+        calendar=calendar,
+    )
+
+    # A leg built from the coupons of another leg has the same cashflows
+    fixed_leg = FixedLeg(Way.PAYER, generated_leg.coupons)
+    assert fixed_leg.coupons == generated_leg.coupons
+    assert fixed_leg.currency == Currency.EUR
+    assert fixed_leg.accruals is None and fixed_leg.notional is None
+
+    discount_curve = DiscountCurve.flat_forward(
+        start, start + Period(6, Unit.YEAR), InterestRate(0.02), DayCount.ACTUAL_365_FIXED
+    )
+    assert fixed_leg.compute_npv(discount_curve) == generated_leg.compute_npv(discount_curve)
+
+    with pytest.raises(ValueError):
+        FixedLeg(Way.PAYER, [*generated_leg.coupons, FixedCoupon(start, start, start, Money(1, Currency.USD))])
+
+
+def test_compiled_leg():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    start = Date(2023, 10, 16)
+    fixed_leg = FixedLeg.generate(
+        way=Way.PAYER,
+        start=start,
+        end=start + Period(10, Unit.YEAR),
+        notional=Money(10_000_000, Currency.EUR),
+        coupon_rate=InterestRate(0.03, Compounding.ANNUAL),
+        day_count=DayCount.THIRTY_360,
+        payment_frequency=Frequency.QUARTERLY,
+        payment_offset=Period(2, Unit.DAY),
+        calendar=calendar,
+    )
+    compiled_leg = fixed_leg.compile()
+    assert compiled_leg.sign == -1
+    assert compiled_leg.currency == Currency.EUR
+
+    # Revalue against several curves and compare with discounting each coupon
+    for rate in [0.01, 0.02, 0.05]:
+        discount_curve = DiscountCurve.flat_forward(
+            start=start,
+            end=start + Period(11, Unit.YEAR),
+            rate=InterestRate(rate, Compounding.CONTINUOUS),
+            day_count=DayCount.ACTUAL_365_FIXED,
+        )
+        npv = compiled_leg.compute_npv(discount_curve)
+        expected = -sum(
+            coupon.amount.amount * discount_curve.spot(coupon.payment, Method.LOG_LINEAR_DISCOUNT_FACTOR)
+            for coupon in fixed_leg.coupons
+        )
+        assert npv.currency == Currency.EUR
+        assert math.isclose(npv.amount, expected, rel_tol=1e-12)
+        assert fixed_leg.compute_npv(discount_curve) == npv
+
+
+def test_compute_fixed_leg_sensitivities():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    start = Date(2023, 10, 16)
+    fixed_leg = FixedLeg.generate(
+        way=Way.RECEIVER,
+        start=start,
+        end=start + Period(3, Unit.YEAR),
+        notional=Money(10_000_000, Currency.USD),
+        coupon_rate=InterestRate(0.03, Compounding.ANNUAL),
+        day_count=DayCount.THIRTY_360,
+        payment_frequency=Frequency.SEMI_ANNUAL,
+        payment_offset=Period(2, Unit.DAY),
+        calendar=calendar,
+    )
+
+    dates = [start + Period(months, Unit.MONTH) for months in range(6, 48, 6)]
+    factors = [0.985, 0.97, 0.955, 0.94, 0.925, 0.91, 0.895]
+    discount_curve = DiscountCurve(start=start, dates=dates, factors=factors)
+    sensitivities = fixed_leg.compute_sensitivities(discount_curve)
+
+    # Compare with bumping each node discount factor and computing the npv again
+    h = 1e-6
+    npv = fixed_leg.compute_npv(discount_curve)
+    for i, sensitivity in enumerate(sensitivities):
+        bumped_factors = list(factors)
+        bumped_factors[i] += h
+        bumped_npv = fixed_leg.compute_npv(DiscountCurve(start=start, dates=dates, factors=bumped_factors))
+        assert math.isclose(float(sensitivity), (float(bumped_npv) - float(npv)) / h, rel_tol=1e-5, abs_tol=1e-2)
+
+    assert len(sensitivities) == len(dates)
+
+
+START = Date(2023, 10, 16)
+NODES = [START + Period(1, Unit.DAY)] + [START + Period(months, Unit.MONTH) for months in range(3, 12 * 21, 3)]
+DISCOUNT_CURVE = DiscountCurve(
+    start=START,
+    dates=NODES,
+    factors=[math.exp(-(0.02 + 0.0005 * (date - START) / 365) * (date - START) / 365) for date in NODES],
+)
+PROJECTION_CURVE = DiscountCurve(
+    start=START,
+    dates=NODES,
+    factors=[math.exp(-(0.025 + 0.0005 * (date - START) / 365) * (date - START) / 365) for date in NODES],
+)
+SWAP_CONVENTIONS = dict(
+    fixed_day_count=DayCount.THIRTY_360,
+    fixed_frequency=Frequency.ANNUAL,
+    floating_day_count=DayCount.ACTUAL_360,
+    floating_frequency=Frequency.QUARTERLY,
+    payment_offset=Period(2, Unit.DAY),
+    calendar=Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING),
+)
+
+
+def test_floating_leg():
+    calendar = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+    floating_leg = FloatingLeg.generate(
+        way=Way.RECEIVER,
+        start=START,
+        end=START + Period(5, Unit.YEAR),
+        notional=Money(10_000_000, Currency.EUR),
+        day_count=DayCount.ACTUAL_360,
+        payment_frequency=Frequency.QUARTERLY,
+        payment_offset=Period(2, Unit.DAY),
+        calendar=calendar,
+        spread=0.001,
+    )
+    accruals = floating_leg.accruals
+    method = Method.LOG_LINEAR_DISCOUNT_FACTOR
+
+    forward_rates = floating_leg.compute_forward_rates(PROJECTION_CURVE)
+    for start, end, t, forward_rate in zip(accruals.starts, accruals.ends, accruals.year_fractions, forward_rates):
+        assert math.isclose(forward_rate, (1 / PROJECTION_CURVE.forward(start, end, method) - 1) / t, rel_tol=1e-12)
+
+    expected = sum(
+        10_000_000 * (forward_rate + 0.001) * t * DISCOUNT_CURVE.spot(payment, method)
+        for forward_rate, t, payment in zip(forward_rates, accruals.year_fractions, accruals.payments)
+    )
+    npv = floating_leg.compute_npv(DISCOUNT_CURVE, PROJECTION_CURVE)
+    assert npv.currency == Currency.EUR
+    assert math.isclose(npv.amount, expected, rel_tol=1e-12)
+
+
+def test_interest_rate_swap():
+    notional = Money(10_000_000, Currency.EUR)
+    end = START + Period(10, Unit.YEAR)
+    swap = InterestRateSwap.generate(Way.PAYER, START, end, notional, InterestRate(0.03), **SWAP_CONVENTIONS)
+    assert swap.floating_leg.way == Way.RECEIVER
+
+    # The swap is worth zero at its par rate
+    par_rate = swap.compute_par_rate(DISCOUNT_CURVE, PROJECTION_CURVE)
+    par_swap = InterestRateSwap.generate(Way.PAYER, START, end, notional, InterestRate(par_rate), **SWAP_CONVENTIONS)
+    assert math.isclose(par_swap.compute_npv(DISCOUNT_CURVE, PROJECTION_CURVE).amount, 0, abs_tol=1e-6)
+
+    # The NPV is linear in the fixed rate, with a slope given by the annuity
+    annuity = swap.compute_annuity(DISCOUNT_CURVE)
+    npv = swap.compute_npv(DISCOUNT_CURVE, PROJECTION_CURVE)
+    assert math.isclose(npv.amount, -(0.03 - par_rate) * annuity * notional.amount, rel_tol=1e-9)
+
+    # A payer swap gains when rates rise
+    dv01 = swap.compute_dv01(DISCOUNT_CURVE, PROJECTION_CURVE)
+    shifted_npv = swap.compute_npv(
+        ShiftedCurve.parallel(DISCOUNT_CURVE, 0.0001), ShiftedCurve.parallel(PROJECTION_CURVE, 0.0001)
+    )
+    assert dv01 == shifted_npv - npv
+    assert dv01.amount > 0
+
+    with pytest.raises(ValueError):
+        InterestRateSwap(swap.fixed_leg, FloatingLeg(Way.PAYER, swap.floating_leg.accruals, notional))
+
+
+def test_compute_par_rates():
+    starts = [START, START + Period(1, Unit.YEAR), START + Period(30, Unit.MONTH)]
+    tenors = [Period(1, Unit.YEAR), Period(2, Unit.YEAR), Period(7, Unit.YEAR), Period(15, Unit.YEAR)]
+    grid = compute_par_rates(
+        starts, tenors, discount_curve=DISCOUNT_CURVE, projection_curve=PROJECTION_CURVE, **SWAP_CONVENTIONS
+    )
+
+    assert len(grid) == len(starts)
+    for start, par_rates in zip(starts, grid):
+        assert len(par_rates) == len(tenors)
+        for tenor, par_rate in zip(tenors, par_rates):
+            swap = InterestRateSwap.generate(
+                Way.PAYER, start, start + tenor, Money(1, Currency.EUR), InterestRate(0.03), **SWAP_CONVENTIONS
+            )
+            assert par_rate == swap.compute_par_rate(DISCOUNT_CURVE, PROJECTION_CURVE)
@@ -0,0 +1,146 @@
+import math
+import os
+
+import pytest
+
+from disquant.definitions.business_day import Adjustment, Calendar
+from disquant.definitions.curve import DiscountCurve, ShiftedCurve
+from disquant.definitions.date import Date
+from disquant.definitions.day_count import DayCount
+from disquant.definitions.frequency import Frequency
+from disquant.definitions.market import Market, MarketSnapshot
+from disquant.definitions.money import Currency, Money
+from disquant.definitions.period import Period, Unit
+from disquant.definitions.rate import Compounding, InterestRate
+from disquant.instruments.irs import FixedLeg, InterestRateSwap, Way
+from disquant.instruments.portfolio import PortfolioEngine
+
+START = Date(2023, 10, 16)
+NODES = [START + Period(1, Unit.DAY)] + [START + Period(months, Unit.MONTH) for months in range(3, 12 * 16, 3)]
+CALENDAR = Calendar("TARGET", Adjustment.MODIFIED_FOLLOWING)
+
+
+def build_curve(rate: float) -> DiscountCurve:
+    return DiscountCurve(start=START, dates=NODES, factors=[math.exp(-rate * (date - START) / 365) for date in NODES])
+
+
+def build_market() -> MarketSnapshot:
+    market = Market()
+    market.update(
+        discount_curves={Currency.EUR: build_curve(0.02), Currency.USD: build_curve(0.04)},
+        projection_curves={"ESTR": build_curve(0.025)},
+    )
+    return market.snapshot()
+
+
+def build_trades() -> list[InterestRateSwap | FixedLeg]:
+    trades = []
+    for i in range(60):
+        currency = Currency.EUR if i % 2 else Currency.USD
+        trades.append(
+            InterestRateSwap.generate(
+                way=Way.PAYER if i % 3 else Way.RECEIVER,
+                start=START + Period(i % 4, Unit.MONTH),
+                end=START + Period(1 + i % 10, Unit.YEAR),
+                notional=Money(1_000_000 * (1 + i % 7), currency),
+                fixed_rate=InterestRate(0.03),
+                fixed_day_count=DayCount.THIRTY_360,
+                fixed_frequency=Frequency.ANNUAL,
+                floating_day_count=DayCount.ACTUAL_360,
+                floating_frequency=Frequency.QUARTERLY,
+                payment_offset=Period(2, Unit.DAY),
+                calendar=CALENDAR,
+                index="ESTR" if currency == Currency.EUR and i % 4 == 1 else None,
+            )
+        )
+
+    trades.append(
+        FixedLeg.generate(
+            way=Way.RECEIVER,
+            start=START,
+            end=START + Period(5, Unit.YEAR),
+            notional=Money(10_000_000, Currency.EUR),
+            coupon_rate=InterestRate(0.03, Compounding.ANNUAL),
+            day_count=DayCount.THIRTY_360,
+            payment_frequency=Frequency.ANNUAL,
+            payment_offset=Period(2, Unit.DAY),
+            calendar=CALENDAR,
+        )
+    )
+    return trades
+
+
+def expected_npv(trade: InterestRateSwap | FixedLeg, market: MarketSnapshot) -> Money:
+    if isinstance(trade, FixedLeg):
+        return trade.compute_npv(market.discount_curve(trade.currency))
+
+    index = trade.floating_leg.index
+    return trade.compute_npv(
+        market.discount_curve(trade.fixed_leg.currency), market.projection_curve(index) if index else None
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_price_portfolio(workers: int):
+    market = build_market()
+    trades = build_trades()
+
+    with PortfolioEngine(market, workers=workers, chunk_size=7) as engine:
+        valuation = engine.price(trades)
+
+    # NPVs are in the order of the trades and equal to the NPVs of each trade
+    assert len(valuation) == len(trades)
+    for i, trade in enumerate(trades):
+        assert valuation.npv(i) == expected_npv(trade, market)
+
+    for currency in [Currency.EUR, Currency.USD]:
+        total = sum(npv for npv, other in zip(valuation.npvs, valuation.currencies) if other == currency)
+        assert valuation.totals[currency] == Money(total, currency)
+
+
+def shared_blocks() -> set[str]:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+def test_close():
+    before = shared_blocks()
+    engine = PortfolioEngine(build_market(), workers=2)
+    engine.price(build_trades()[:3])
+    engine.close()
+
+    # The shared memory block is released, and closing again has no effect
+    assert shared_blocks() <= before
+    engine.close()
+
+    with pytest.raises(ValueError):
+        engine.price(build_trades()[:3])
+
+
+def test_price_portfolio_on_other_curves():
+    # Chunks on curves which are not defined by their nodes are priced in the current process
+    market = Market(build_market())
+    market.set_discount_curve(
+        Currency.EUR,
+        DiscountCurve.flat_forward(START, START + Period(16, Unit.YEAR), InterestRate(0.02), DayCount.ACTUAL_365_FIXED),
+    )
+    market.set_projection_curve("ESTR", ShiftedCurve.parallel(build_curve(0.025), 0.0001))
+    market = market.snapshot()
+    trades = build_trades()
+
+    with PortfolioEngine(market, workers=2, chunk_size=7) as engine:
+        valuation = engine.price(trades)
+
+    for i, trade in enumerate(trades):
+        assert valuation.npv(i) == expected_npv(trade, market)
+
+
+def test_invalid_portfolios():
+    market = build_market()
+    with PortfolioEngine(market, workers=1) as engine:
+        with pytest.raises(TypeError):
+            engine.price([Money(1, Currency.EUR)])
+
+    # All the curves of the trades need to be in the market
+    with PortfolioEngine(Market().snapshot(), workers=1) as engine:
+        with pytest.raises(ValueError):
+            engine.price(build_trades())
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from disquant.utils.interpolation import (
+    akima,
+    cubic_interpolation,
+    cubic_spline,
+    linear_interpolation,
+    monotone_convex,
+    monotone_convex_interpolation,
+)
+
+
+def test_linear_interpolation():
+    assert linear_interpolation(1, 2, 3, 6, 2) == 4
+
+    with pytest.raises(ValueError):
+        linear_interpolation(1, 2, 3, 6, 4)
+
+
+def test_natural_cubic_spline():
+    xs = [0, 1, 2]
+    cubics = cubic_spline(xs, [0, 1, 0])
+
+    # The second derivative at the middle point solves 4 * m = 6 * (-1 - 1)
+    assert cubics == [(0, 1.5, 0, -0.5), (1, 0, -1.5, 0.5)]
+    assert cubic_interpolation(0, 1, cubics[0], 0.5) == 0.6875
+
+    # Points on a line give a line
+    cubics = cubic_spline([0, 1, 3, 6], [1, 3, 7, 13])
+    for x in [0.5, 2, 4.5]:
+        i = 0 if x < 1 else 1 if x < 3 else 2
+        assert math.isclose(cubic_interpolation([0, 1, 3, 6][i], [0, 1, 3, 6][i + 1], cubics[i], x), 1 + 2 * x)
+
+
+def test_clamped_cubic_spline():
+    xs = [0, 1, 2, 4]
+    ys = [0.01, 0.02, 0.025, 0.02]
+    cubics = cubic_spline(xs, ys, clamped=True)
+
+    # Zero first derivatives at both ends, continuous first and second derivatives in between
+    assert cubics[0][1] == 0
+    a, b, c, d = cubics[-1]
+    assert math.isclose(b + 2 * c * 2 + 3 * d * 2**2, 0, abs_tol=1e-15)
+    for (a1, b1, c1, d1), (a2, b2, c2, d2), h in zip(cubics[:-1], cubics[1:], [1, 1]):
+        assert math.isclose(a1 + b1 * h + c1 * h**2 + d1 * h**3, a2)
+        assert math.isclose(b1 + 2 * c1 * h + 3 * d1 * h**2, b2, abs_tol=1e-15)
+        assert math.isclose(2 * c1 + 6 * d1 * h, 2 * c2, abs_tol=1e-15)
+
+
+def test_akima():
+    # Points on a line give a line
+    cubics = akima([0, 1, 3, 6], [1, 3, 7, 13])
+    assert all(math.isclose(b, 2) and c == 0 and d == 0 for _, b, c, d in cubics)
+
+    # A step does not overshoot
+    xs = [0, 1, 2, 3, 4, 5]
+    ys = [0, 0, 0, 1, 1, 1]
+    cubics = akima(xs, ys)
+    for i, cubic in enumerate(cubics):
+        for k in range(11):
+            assert 0 <= cubic_interpolation(xs[i], xs[i + 1], cubic, xs[i] + k / 10) <= 1
+
+
+def test_monotone_convex():
+    # Flat forward rates are reproduced
+    xs = [0, 1, 3, 6]
+    coefficients = monotone_convex(xs, [0.02 * x for x in xs])
+    assert all(math.isclose(monotone_convex_interpolation(c, c[0] + 0.5), 0.02 * (c[0] + 0.5)) for c in coefficients)
+
+    # The points are reproduced and the forward rates are continuous at the points
+    ys = [0, 0.01, 0.035, 0.05]
+    coefficients = monotone_convex(xs, ys)
+    h = 1e-6
+    for i, c in enumerate(coefficients):
+        assert math.isclose(monotone_convex_interpolation(c, xs[i + 1]), ys[i + 1])
+        if i > 0:
+            left = (ys[i] - monotone_convex_interpolation(coefficients[i - 1], xs[i] - h)) / h
+            right = (monotone_convex_interpolation(c, xs[i] + h) - ys[i]) / h
+            assert math.isclose(left, right, abs_tol=1e-5)
+
+    with pytest.raises(ValueError):
+        monotone_convex_interpolation(coefficients[0], 2)